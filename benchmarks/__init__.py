@@ -0,0 +1 @@
+"""Define performance benchmarks for package contents."""
@@ -0,0 +1,58 @@
+"""Define common inputs for benchmarks."""
+
+import random
+
+import pytest
+
+from package_name_to_import_with import BinaryArithmeticOperator
+
+PARENTHESISED_OPERAND_PROBABILITY = 0.1
+
+
+def generate_arithmetic_expression(number_of_operands: int, seed: int = 0) -> str:
+    """Generate a reproducible arithmetic expression with parentheses and negative numbers.
+
+    Parameters
+    ----------
+    number_of_operands : int
+        number of numbers in the expression
+    seed : int, optional
+        seed of the random number generator, by default 0
+
+    Returns
+    -------
+    str
+        standard arithmetic expression
+    """
+    random_generator = random.Random(seed)  # noqa: S311 # nosec B311
+
+    expression_parts = [str(random_generator.randint(1, 99))]
+    for _ in range(number_of_operands - 1):
+        operator = random_generator.choice(list(BinaryArithmeticOperator))
+        number = round(random_generator.uniform(-99, 99), 2) or 1
+        operand = (
+            f"({number})"
+            if random_generator.random() < PARENTHESISED_OPERAND_PROBABILITY
+            else str(number)
+        )
+
+        expression_parts.append(f" {operator} {operand}")
+
+    return "".join(expression_parts)
+
+
+@pytest.fixture(params=[10, 1000, 100000], name="long_expression")
+def fixture_long_expression(request: pytest.FixtureRequest) -> str:
+    """Define arithmetic expressions of increasing sizes for benchmarks.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        request for fixture from benchmark function
+
+    Returns
+    -------
+    str
+        standard arithmetic expression
+    """
+    return generate_arithmetic_expression(request.param)
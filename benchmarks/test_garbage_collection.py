@@ -0,0 +1,60 @@
+"""Define benchmarks for bulk evaluation with and without paused garbage collection."""
+
+import typing
+
+import pytest
+
+from package_name_to_import_with.garbage_collection_module import (
+    monitor_collection_pauses,
+    pause_garbage_collection,
+)
+from package_name_to_import_with.streaming_module import solve_simplification_stream
+
+from .conftest import generate_arithmetic_expression
+
+if typing.TYPE_CHECKING:
+    import pytest_benchmark.fixture
+
+EXPRESSIONS = [generate_arithmetic_expression(20, seed=seed) for seed in range(2000)]
+
+
+def evaluate_batch(pause: bool) -> float:
+    """Evaluate all expressions, returning wall time of garbage collections.
+
+    Parameters
+    ----------
+    pause : bool
+        whether to pause automatic garbage collection for the batch
+
+    Returns
+    -------
+    float
+        seconds spent in garbage collections caused by batch
+    """
+    if pause:
+        with pause_garbage_collection() as batch:
+            _ = list(solve_simplification_stream(EXPRESSIONS, validate=True))
+
+        return batch.report.pause_seconds if batch.report is not None else 0.0
+
+    with monitor_collection_pauses() as monitor:
+        _ = list(solve_simplification_stream(EXPRESSIONS, validate=True))
+
+    return monitor.pauses.seconds
+
+
+@pytest.mark.benchmark(group="garbage_collection")
+@pytest.mark.parametrize("pause", [False, True])
+def test_bulk_evaluation(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", pause: bool
+) -> None:
+    """Measure bulk evaluation, recording time spent in garbage collection of last round.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    pause : bool
+        whether to pause automatic garbage collection for the batch
+    """
+    benchmark.extra_info["pause_seconds"] = benchmark(evaluate_batch, pause)
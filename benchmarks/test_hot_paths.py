@@ -0,0 +1,365 @@
+"""Define benchmarks for stages of evaluation of arithmetic expressions and basic operations."""
+
+import typing
+
+import pytest
+
+from package_name_to_import_with import BinaryArithmeticOperator, calculate_results
+from package_name_to_import_with.calculator_sub_package import (
+    BinaryArithmeticExpression,
+    BinaryArithmeticRecord,
+    validate_binary_arithmetic_expressions,
+)
+from package_name_to_import_with.calculator_sub_package.basics import (
+    add_numbers,
+    divide_numbers,
+    get_negative,
+    get_reciprocal,
+    multiply_numbers,
+    subtract_numbers,
+)
+from package_name_to_import_with.columnar_module import ResultColumns
+from package_name_to_import_with.simplify import (
+    clean_and_tokenise_expression,
+    convert_infix_expression,
+    evaluate_postfix_expression,
+    solve_simplification,
+    tokenise_expression,
+)
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+    import pytest_benchmark.fixture
+
+OPERAND_PAIRS = [(3.0, 7.0), (123456.789, -0.000321), (1.5e300, 2.5e-300)]
+BULK_SIZE = 10000
+
+
+@pytest.mark.benchmark(group="clean_and_tokenise_expression")
+def test_clean_and_tokenise_expression(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", long_expression: str
+) -> None:
+    """Measure cleaning and tokenisation of arithmetic expression into matches.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    long_expression : str
+        standard arithmetic expression
+    """
+    benchmark(lambda: list(clean_and_tokenise_expression(long_expression)))
+
+
+@pytest.mark.benchmark(group="convert_infix_expression")
+def test_convert_infix_expression(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", long_expression: str
+) -> None:
+    """Measure conversion of tokenised arithmetic expression into reverse Polish notation.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    long_expression : str
+        standard arithmetic expression
+    """
+    infix_tokens = list(tokenise_expression(long_expression))
+
+    benchmark(lambda: convert_infix_expression(iter(infix_tokens)))
+
+
+@pytest.mark.benchmark(group="evaluate_postfix_expression")
+def test_evaluate_postfix_expression(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", long_expression: str
+) -> None:
+    """Measure validated evaluation of arithmetic expression in reverse Polish notation.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    long_expression : str
+        standard arithmetic expression
+    """
+    postfix_expression = convert_infix_expression(tokenise_expression(long_expression))
+
+    benchmark(evaluate_postfix_expression, postfix_expression)
+
+
+@pytest.mark.benchmark(group="solve_simplification")
+@pytest.mark.parametrize("validate", [False, True])
+def test_solve_simplification(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", long_expression: str, validate: bool
+) -> None:
+    """Measure evaluation of arithmetic expression from text to result.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    long_expression : str
+        standard arithmetic expression
+    validate : bool
+        whether to validate every intermediate operation
+    """
+    benchmark(solve_simplification, long_expression, validate=validate)
+
+
+@pytest.mark.benchmark(group="calculate_results")
+@pytest.mark.parametrize("operator", list(BinaryArithmeticOperator))
+@pytest.mark.parametrize("operands", OPERAND_PAIRS)
+def test_calculate_results(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture",
+    operator: BinaryArithmeticOperator,
+    operands: tuple[float, float],
+) -> None:
+    """Measure validated binary arithmetic operation.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    operator : BinaryArithmeticOperator
+        kind of binary arithmetic operation
+    operands : tuple[float, float]
+        left and right operands
+    """
+    benchmark(calculate_results, operands[0], operator, operands[1])
+
+
+@pytest.mark.benchmark(group="basics")
+@pytest.mark.parametrize(
+    "binary_function", [add_numbers, subtract_numbers, multiply_numbers, divide_numbers]
+)
+@pytest.mark.parametrize("operands", OPERAND_PAIRS)
+def test_binary_basics(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture",
+    binary_function: "collections.abc.Callable[[float, float], float]",
+    operands: tuple[float, float],
+) -> None:
+    """Measure basic operation on two numbers.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    binary_function : collections.abc.Callable[[float, float], float]
+        basic operation
+    operands : tuple[float, float]
+        left and right operands
+    """
+    benchmark(binary_function, *operands)
+
+
+@pytest.mark.benchmark(group="basics")
+@pytest.mark.parametrize("unary_function", [get_negative, get_reciprocal])
+@pytest.mark.parametrize("operand", [operand for operand, _ in OPERAND_PAIRS])
+def test_unary_basics(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture",
+    unary_function: "collections.abc.Callable[[float], float]",
+    operand: float,
+) -> None:
+    """Measure basic operation on one number.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    unary_function : collections.abc.Callable[[float], float]
+        basic operation
+    operand : float
+        input number
+    """
+    benchmark(unary_function, operand)
+
+
+@pytest.fixture(name="bulk_expressions", scope="module")
+def fixture_bulk_expressions() -> list[dict[str, typing.Any]]:
+    """Define many binary arithmetic expressions, as decoded from JSON.
+
+    Returns
+    -------
+    list[dict[str, typing.Any]]
+        fields of binary arithmetic expressions, cycling through operators and operands
+    """
+    operators = list(BinaryArithmeticOperator)
+
+    return [
+        {
+            "left_operand": OPERAND_PAIRS[position % len(OPERAND_PAIRS)][0] + position,
+            "binary_operator": str(operators[position % len(operators)]),
+            "right_operand": OPERAND_PAIRS[position % len(OPERAND_PAIRS)][1],
+        }
+        for position in range(BULK_SIZE)
+    ]
+
+
+def construct_one_by_one(expressions: list[dict[str, typing.Any]]) -> list[float]:
+    """Validate binary arithmetic expressions one at a time, and compute their results.
+
+    Parameters
+    ----------
+    expressions : list[dict[str, typing.Any]]
+        fields of binary arithmetic expressions
+
+    Returns
+    -------
+    list[float]
+        results of binary arithmetic expressions
+    """
+    return [
+        BinaryArithmeticExpression.model_validate(expression).result for expression in expressions
+    ]
+
+
+def construct_in_bulk(expressions: list[dict[str, typing.Any]]) -> list[float]:
+    """Validate binary arithmetic expressions in one call, and compute their results.
+
+    Parameters
+    ----------
+    expressions : list[dict[str, typing.Any]]
+        fields of binary arithmetic expressions
+
+    Returns
+    -------
+    list[float]
+        results of binary arithmetic expressions
+    """
+    return [
+        arithmetic_expression.result
+        for arithmetic_expression in validate_binary_arithmetic_expressions(expressions)
+    ]
+
+
+def construct_records(expressions: list[dict[str, typing.Any]]) -> list[float]:
+    """Construct unvalidated records of binary arithmetic expressions, and compute results.
+
+    Parameters
+    ----------
+    expressions : list[dict[str, typing.Any]]
+        fields of binary arithmetic expressions
+
+    Returns
+    -------
+    list[float]
+        results of binary arithmetic expressions
+    """
+    return [
+        BinaryArithmeticRecord(
+            float(expression["left_operand"]),
+            BinaryArithmeticOperator(expression["binary_operator"]),
+            float(expression["right_operand"]),
+        ).result
+        for expression in expressions
+    ]
+
+
+@pytest.mark.benchmark(group="bulk_construction")
+@pytest.mark.parametrize(
+    "construction_function", [construct_one_by_one, construct_in_bulk, construct_records]
+)
+def test_bulk_construction(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture",
+    construction_function: "collections.abc.Callable[[list[dict[str, typing.Any]]], list[float]]",
+    bulk_expressions: list[dict[str, typing.Any]],
+) -> None:
+    """Measure construction of many binary arithmetic expressions, results included.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    construction_function : collections.abc.Callable[[list[dict[str, typing.Any]]], list[float]]
+        way of constructing binary arithmetic expressions
+    bulk_expressions : list[dict[str, typing.Any]]
+        fields of binary arithmetic expressions
+    """
+    results = benchmark(construction_function, bulk_expressions)
+
+    assert results == construct_one_by_one(bulk_expressions)  # nosec B101
+
+
+def export_json_rows(arithmetic_expressions: list[BinaryArithmeticExpression]) -> bytes:
+    """Export binary arithmetic expressions one JSON document at a time.
+
+    Parameters
+    ----------
+    arithmetic_expressions : list[BinaryArithmeticExpression]
+        validated binary arithmetic expressions
+
+    Returns
+    -------
+    bytes
+        JSON documents, one per line, without unserialisable `operation`
+    """
+    return b"\n".join(
+        arithmetic_expression.model_dump_json(exclude={"operation"}).encode()
+        for arithmetic_expression in arithmetic_expressions
+    )
+
+
+def export_csv_columns(arithmetic_expressions: list[BinaryArithmeticExpression]) -> bytes:
+    """Export binary arithmetic expressions through typed columns as comma separated values.
+
+    Parameters
+    ----------
+    arithmetic_expressions : list[BinaryArithmeticExpression]
+        validated binary arithmetic expressions
+
+    Returns
+    -------
+    bytes
+        header and one row per expression
+    """
+    result_columns = ResultColumns()
+    result_columns.extend_expressions(arithmetic_expressions)
+
+    return result_columns.to_csv().encode()
+
+
+def export_binary_columns(arithmetic_expressions: list[BinaryArithmeticExpression]) -> bytes:
+    """Export binary arithmetic expressions through typed columns in binary format.
+
+    Parameters
+    ----------
+    arithmetic_expressions : list[BinaryArithmeticExpression]
+        validated binary arithmetic expressions
+
+    Returns
+    -------
+    bytes
+        header and contents of columns
+    """
+    result_columns = ResultColumns()
+    result_columns.extend_expressions(arithmetic_expressions)
+
+    return result_columns.to_bytes()
+
+
+@pytest.mark.benchmark(group="result_export")
+@pytest.mark.parametrize(
+    "export_function", [export_json_rows, export_csv_columns, export_binary_columns]
+)
+def test_result_export(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture",
+    export_function: "collections.abc.Callable[[list[BinaryArithmeticExpression]], bytes]",
+    bulk_expressions: list[dict[str, typing.Any]],
+) -> None:
+    """Measure export of many binary arithmetic expressions with their results.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    export_function : collections.abc.Callable[[list[BinaryArithmeticExpression]], bytes]
+        way of exporting binary arithmetic expressions
+    bulk_expressions : list[dict[str, typing.Any]]
+        fields of binary arithmetic expressions
+    """
+    arithmetic_expressions = validate_binary_arithmetic_expressions(bulk_expressions)
+
+    exported_data = benchmark(export_function, arithmetic_expressions)
+
+    assert exported_data  # nosec B101
@@ -0,0 +1,43 @@
+"""Define benchmarks for import time of the package."""
+
+import subprocess  # nosec B404
+import sys
+import typing
+
+import pytest
+
+if typing.TYPE_CHECKING:
+    import pytest_benchmark.fixture
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import package_name_to_import_with",
+        "from package_name_to_import_with import __version__",
+        "from package_name_to_import_with import solve_simplification",
+    ],
+)
+def test_import_time(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", statement: str
+) -> None:
+    """Measure start-up time of a fresh interpreter executing an import statement.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring execution time
+    statement : str
+        import statement to execute
+    """
+    completed_process = benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-X", "importtime", "-c", statement],),
+        kwargs={"capture_output": True, "check": True, "text": True},
+        rounds=10,
+    )
+
+    *_, package_import_time = (
+        line for line in completed_process.stderr.splitlines() if line.startswith("import time:")
+    )
+    benchmark.extra_info["cumulative_microseconds"] = int(package_import_time.split("|")[1])
@@ -0,0 +1,48 @@
+"""Define benchmarks for evaluation of optimised compiled expressions."""
+
+import typing
+
+import pytest
+
+from package_name_to_import_with import compile_expression
+from package_name_to_import_with.codegen_module import generate_function
+
+if typing.TYPE_CHECKING:
+    import pytest_benchmark.fixture
+
+FORMULA = "principal * (1 + 5 / 100 / 12) * (1 - 0) / (2 * 6) + fee * 1 + 0"
+
+
+@pytest.mark.parametrize("optimise", [False, True])
+def test_compiled_evaluation(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", optimise: bool
+) -> None:
+    """Measure repeated evaluation of a formula with constant parts.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring execution time
+    optimise : bool
+        whether constant parts are folded during compilation
+    """
+    compiled_expression = compile_expression(FORMULA, allow_variables=True, optimise=optimise)
+
+    benchmark(
+        compiled_expression.evaluate,
+        validate=False,
+        variable_values={"principal": 1000.0, "fee": 2.5},
+    )
+
+
+def test_generated_evaluation(benchmark: "pytest_benchmark.fixture.BenchmarkFixture") -> None:
+    """Measure repeated evaluation of a formula compiled into a Python function.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring execution time
+    """
+    generated_function = generate_function(FORMULA, allow_variables=True)
+
+    benchmark(generated_function, 2.5, 1000.0)
@@ -0,0 +1,72 @@
+"""Define stress benchmarks for arithmetic expressions with a million tokens."""
+
+import typing
+
+import pytest
+
+from package_name_to_import_with import solve_simplification
+
+from .conftest import generate_arithmetic_expression
+
+if typing.TYPE_CHECKING:
+    import pytest_benchmark.fixture
+
+NUMBER_OF_TOKENS = 1_000_000
+
+
+def generate_nested_arithmetic_expression(number_of_tokens: int) -> str:
+    """Generate an arithmetic expression where every operation opens a new parenthesis.
+
+    Parameters
+    ----------
+    number_of_tokens : int
+        approximate number of tokens in the expression
+
+    Returns
+    -------
+    str
+        standard arithmetic expression nested ``number_of_tokens / 4`` levels deep
+    """
+    depth = number_of_tokens // 4
+
+    return "(1 - " * depth + "1" + ")" * depth
+
+
+@pytest.fixture(params=["flat", "nested"], name="million_token_expression")
+def fixture_million_token_expression(request: pytest.FixtureRequest) -> str:
+    """Define arithmetic expressions with about a million tokens.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        request for fixture from benchmark function
+
+    Returns
+    -------
+    str
+        long flat expression, or deeply nested expression
+    """
+    if request.param == "nested":
+        return generate_nested_arithmetic_expression(NUMBER_OF_TOKENS)
+
+    return generate_arithmetic_expression(NUMBER_OF_TOKENS // 2)
+
+
+def test_million_token_simplification(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", million_token_expression: str
+) -> None:
+    """Measure evaluation of an expression with about a million tokens.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring execution time
+    million_token_expression : str
+        standard arithmetic expression
+    """
+    benchmark.pedantic(
+        solve_simplification,
+        args=(million_token_expression,),
+        kwargs={"validate": False},
+        rounds=3,
+    )
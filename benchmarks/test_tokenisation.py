@@ -0,0 +1,71 @@
+"""Define benchmarks for tokenisation of arithmetic expressions."""
+
+import typing
+
+import pytest
+
+from package_name_to_import_with.simplify import clean_and_tokenise_expression, tokenise_expression
+
+if typing.TYPE_CHECKING:
+    import pytest_benchmark.fixture
+
+
+def tokenise_with_group_dictionaries(expression: str) -> list[tuple[str, str]]:
+    """Extract typed tokens by scanning all named groups of every match.
+
+    This mirrors how matches were consumed before `tokenise_expression` was added.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        pairs of type and value of tokens
+    """
+    return [
+        next(
+            (element_type, element_value)
+            for element_type, element_value in token.groupdict().items()
+            if element_value is not None
+        )
+        for token in clean_and_tokenise_expression(expression)
+    ]
+
+
+@pytest.mark.benchmark(group="tokenisation")
+def test_group_dictionary_tokenisation(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", long_expression: str
+) -> None:
+    """Measure tokenisation by scanning named groups of regular expression matches.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    long_expression : str
+        standard arithmetic expression
+    """
+    benchmark(tokenise_with_group_dictionaries, long_expression)
+
+
+@pytest.mark.benchmark(group="tokenisation")
+def test_typed_tokenisation(
+    benchmark: "pytest_benchmark.fixture.BenchmarkFixture", long_expression: str
+) -> None:
+    """Measure tokenisation into pairs of token type and value.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        fixture measuring repeated executions
+    long_expression : str
+        standard arithmetic expression
+    """
+    tokens = benchmark(lambda: list(tokenise_expression(long_expression)))
+
+    assert [token_value for _, token_value in tokens] == [  # nosec B101
+        token_value for _, token_value in tokenise_with_group_dictionaries(long_expression)
+    ]
@@ -11,6 +11,8 @@
 SOURCE_DIRECTORY = pathlib.Path("src")
 DIST_DIRECTORY = pathlib.Path("dist")
 DOCS_DIRECTORY = pathlib.Path("docs")
+BENCHMARKS_DIRECTORY = pathlib.Path("benchmarks")
+BENCHMARK_STORAGE_DIRECTORY = pathlib.Path(".benchmarks")
 
 PYTHON_SCRIPT_PATHS = SOURCE_DIRECTORY.glob("**/*.py")
 PYTHON_SCRIPTS = [str(SCRIPT_PATH) for SCRIPT_PATH in PYTHON_SCRIPT_PATHS]
@@ -23,6 +25,9 @@
 LINT_SESSION_DECORATOR = functools.partial(
     GENERAL_SESSION_DECORATOR, python=PYTHON_VERSIONS, tags=["lint"]
 )
+BENCHMARK_SESSION_DECORATOR = functools.partial(
+    GENERAL_SESSION_DECORATOR, python=PYTHON_DEFAULT_VERSION, tags=["benchmark"]
+)
 RELEASE_SESSION_DECORATOR = functools.partial(
     GENERAL_SESSION_DECORATOR, python=PYTHON_DEFAULT_VERSION, tags=["release"]
 )
@@ -67,6 +72,41 @@ def bandit(session: nox.Session) -> None:
     )
 
 
+@BENCHMARK_SESSION_DECORATOR
+def benchmark(session: nox.Session) -> None:
+    """Run pytest-benchmark, comparing against latest saved run of this machine.
+
+    Every run is saved with its commit, and it fails if median time of any benchmark is more
+    than 10% slower than in latest saved run. Extra arguments are passed on to pytest.
+
+    Parameters
+    ----------
+    session : nox.Session
+        nox Session object
+    """
+    session.install("-e", ".[benchmark]")
+
+    comparison_arguments = (
+        ["--benchmark-compare", "--benchmark-compare-fail", "median:10%"]
+        if any(BENCHMARK_STORAGE_DIRECTORY.glob("*/*.json"))
+        else []
+    )
+
+    session.run(
+        "pytest",
+        "--override-ini",
+        "addopts=",
+        "--benchmark-storage",
+        str(BENCHMARK_STORAGE_DIRECTORY),
+        "--benchmark-autosave",
+        *comparison_arguments,
+        "--benchmark-sort",
+        "name",
+        *session.posargs,
+        str(BENCHMARKS_DIRECTORY),
+    )
+
+
 @FORMAT_SESSION_DECORATOR
 def black(session: nox.Session) -> None:
     """Run black.
@@ -187,7 +227,7 @@ def mypy(session: nox.Session) -> None:
     session : nox.Session
         nox Session object
     """
-    session.install("mypy", "pydantic")
+    session.install("mypy", "numpy", "pydantic")
 
     session.run("mypy")
 
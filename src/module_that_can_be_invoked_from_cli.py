@@ -1,12 +1,20 @@
 """Calculate arithmetic expressions from command line."""
 
 import argparse
+import contextlib
 import enum
+import io
+import os
+import pathlib
+import signal
+import socket
+import socketserver
 import sys
 import typing
 
 import pydantic
 
+from module_that_can_forward_to_daemon import can_forward, define_socket_path, is_own_socket
 from package_name_to_import_with import (
     BinaryArithmeticOperator,
     CustomPydanticBaseModel,
@@ -14,6 +22,18 @@
     calculate_results,
     solve_simplification,
 )
+from package_name_to_import_with.garbage_collection_module import pause_garbage_collection
+from package_name_to_import_with.memory_profiling_module import MemoryProfiler
+from package_name_to_import_with.parallel_module import DEFAULT_CHUNK_SIZE, solve_many_stream
+from package_name_to_import_with.streaming_module import (
+    format_evaluation_record,
+    solve_simplification_stream,
+)
+
+STANDARD_INPUT = "-"
+STREAM_PROFILE_LABEL = "stream"
+USAGE_EXIT_CODE = 2
+DAEMON_REQUEST_TIMEOUT = 10.0
 
 
 @enum.unique
@@ -22,6 +42,8 @@ class CalculatorType(CustomStrEnum):
 
     BINARY = "binary"
     GENERAL = "general"
+    STREAM = "stream"
+    DAEMON = "daemon"
 
 
 class BinaryInputs(CustomPydanticBaseModel):
@@ -66,30 +88,136 @@ class GeneralInputs(CustomPydanticBaseModel):
     expression: str = pydantic.Field(description="mathematical expression to be evaluated")
 
 
+class StreamInputs(CustomPydanticBaseModel):
+    """Define arguments of streaming calculator.
+
+    Attributes
+    ----------
+    calculator_type : typing.Literal[CalculatorType.STREAM]
+        kind of calculator
+    source : str
+        path of file with one expression per line, or ``-`` for standard input
+    workers : int | None
+        number of worker processes, if expressions are evaluated in parallel
+    chunksize : int
+        number of expressions sent to a worker process at once
+    pause_gc : bool
+        whether to disable automatic garbage collection until all expressions are evaluated
+    """
+
+    calculator_type: typing.Literal[CalculatorType.STREAM] = pydantic.Field(
+        description="kind of calculator"
+    )
+    source: str = pydantic.Field(
+        description="path of file with one expression per line, or - for standard input"
+    )
+    workers: int | None = pydantic.Field(
+        default=None,
+        description="number of worker processes, if expressions are evaluated in parallel",
+        gt=0,
+    )
+    chunksize: int = pydantic.Field(
+        default=DEFAULT_CHUNK_SIZE,
+        description="number of expressions sent to a worker process at once",
+        gt=0,
+    )
+    pause_gc: bool = pydantic.Field(
+        default=False,
+        description="whether to disable automatic garbage collection until all expressions "
+        "are evaluated",
+    )
+
+
+class DaemonInputs(CustomPydanticBaseModel):
+    """Define arguments of calculator daemon.
+
+    Attributes
+    ----------
+    calculator_type : typing.Literal[CalculatorType.DAEMON]
+        kind of calculator
+    socket_path : str
+        path of Unix socket to listen on
+    """
+
+    calculator_type: typing.Literal[CalculatorType.DAEMON] = pydantic.Field(
+        description="kind of calculator"
+    )
+    socket_path: str = pydantic.Field(description="path of Unix socket to listen on")
+
+
 class UserInputs(CustomPydanticBaseModel):
     """Define sub-commands and arguments of CLI calculator.
 
     Attributes
     ----------
-    inputs : BinaryInputs | GeneralInputs
+    inputs : BinaryInputs | GeneralInputs | StreamInputs | DaemonInputs
         inputs for the calculator
+    profile_memory : bool
+        whether to report memory used by every stage of evaluation
     """
 
-    inputs: BinaryInputs | GeneralInputs = pydantic.Field(
+    inputs: BinaryInputs | GeneralInputs | StreamInputs | DaemonInputs = pydantic.Field(
         description="inputs for the calculator", discriminator="calculator_type"
     )
+    profile_memory: bool = pydantic.Field(
+        default=False, description="whether to report memory used by every stage of evaluation"
+    )
 
 
 @pydantic.validate_call(validate_return=True)
-def capture_user_inputs() -> UserInputs:
+def capture_user_inputs(command_line_arguments: list[str] | None = None) -> UserInputs:
     """Capture user inputs for arithmetic expression.
 
+    Parameters
+    ----------
+    command_line_arguments : list[str] | None, optional
+        arguments without program name, by default from `sys.argv`
+
     Returns
     -------
     UserInputs
         captured user inputs
     """
-    parser = argparse.ArgumentParser(description="calculator for console", add_help=True)
+    parser = argparse.ArgumentParser(
+        description="calculator for console", add_help=True, allow_abbrev=False
+    )
+
+    parser.add_argument(
+        "--stream",
+        nargs="?",
+        const=STANDARD_INPUT,
+        metavar="FILE",
+        help="evaluate one expression per line of FILE, or of standard input if omitted",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="evaluate streamed expressions in parallel over N processes",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="N",
+        help=f"send N streamed expressions to a process at once (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--pause-gc",
+        action="store_true",
+        help="disable garbage collection until streamed expressions are evaluated, "
+        "then collect once and report pauses on standard error",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="trace memory of every stage of evaluation and report it on standard error",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep calculator running behind a Unix socket, and answer later invocations",
+    )
 
     sub_parsers = parser.add_subparsers(
         dest="calculator_type", help="types of arithmetic expressions"
@@ -108,26 +236,373 @@ def capture_user_inputs() -> UserInputs:
 
     general_parser.add_argument("expression", type=str, help="infix expression")
 
-    parsed_arguments, _ = parser.parse_known_args()
+    parsed_arguments, _ = parser.parse_known_args(command_line_arguments)
+
+    profile_memory = parsed_arguments.profile_memory
+
+    if parsed_arguments.daemon:
+        if (
+            parsed_arguments.calculator_type is not None
+            or parsed_arguments.stream is not None
+            or parsed_arguments.workers is not None
+            or parsed_arguments.pause_gc
+            or profile_memory
+        ):
+            parser.error("--daemon can not be combined with other arguments")
+
+        return UserInputs.model_validate(
+            {
+                "inputs": {
+                    "calculator_type": CalculatorType.DAEMON,
+                    "socket_path": define_socket_path(),
+                }
+            }
+        )
+
+    if (stream_source := parsed_arguments.stream) is not None:
+        if parsed_arguments.calculator_type is not None:
+            parser.error("--stream can not be combined with sub-commands")
+
+        if profile_memory and parsed_arguments.workers is not None:
+            parser.error("--profile-memory can not be combined with --workers")
+
+        return UserInputs.model_validate(
+            {
+                "inputs": {
+                    "calculator_type": CalculatorType.STREAM,
+                    "source": stream_source,
+                    "workers": parsed_arguments.workers,
+                    "chunksize": parsed_arguments.chunksize,
+                    "pause_gc": parsed_arguments.pause_gc,
+                },
+                "profile_memory": profile_memory,
+            }
+        )
+
+    if parsed_arguments.workers is not None:
+        parser.error("--workers can only be combined with --stream")
+
+    if parsed_arguments.pause_gc:
+        parser.error("--pause-gc can only be combined with --stream")
+
+    arguments = vars(parsed_arguments)
+    for option_argument in (
+        "stream",
+        "workers",
+        "chunksize",
+        "pause_gc",
+        "profile_memory",
+        "daemon",
+    ):
+        del arguments[option_argument]
+
+    return UserInputs.model_validate({"inputs": arguments, "profile_memory": profile_memory})
+
+
+@pydantic.validate_call(validate_return=True)
+def stream_calculator(
+    source: str,
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    pause_gc: bool = False,
+    profile_memory: bool = False,
+) -> None:
+    """Calculate arithmetic expressions from every line of a file or standard input.
+
+    Parameters
+    ----------
+    source : str
+        path of file with one expression per line, or ``-`` for standard input
+    workers : int | None, optional
+        number of worker processes, by default expressions are evaluated in current process
+    chunksize : int, optional
+        number of expressions sent to a worker process at once, by default 256
+    pause_gc : bool, optional
+        whether to disable automatic garbage collection until all expressions are evaluated,
+        by default False
+    profile_memory : bool, optional
+        whether to report memory used by every stage of evaluation, by default False
+
+    Notes
+    -----
+    #. Writes one line per expression, either ``Result = <result>`` or ``Error: <reason>``.
+    #. Reads and writes through buffered streams one line at a time, so memory stays constant.
+    #. Output order matches input order, also when expressions are evaluated in parallel.
+    #. With `pause_gc`, pauses of garbage collection are summarised on standard error, and only
+       current process is affected, not worker processes.
+    #. With `profile_memory`, memory of every stage is summarised over all expressions on
+       standard error. It is not supported with worker processes.
+    """
+    garbage_collection_batch = None
+    memory_profiler = MemoryProfiler() if profile_memory else None
+
+    with contextlib.ExitStack() as context_stack:
+        if source == STANDARD_INPUT:
+            input_stream: typing.TextIO = sys.stdin
+        else:
+            input_stream = context_stack.enter_context(pathlib.Path(source).open(encoding="utf-8"))
+
+        if pause_gc:
+            garbage_collection_batch = context_stack.enter_context(pause_garbage_collection())
+
+        expressions = (line.rstrip("\r\n") for line in input_stream)
+        records = (
+            solve_simplification_stream(expressions)
+            if workers is None
+            else solve_many_stream(expressions, workers=workers, chunksize=chunksize)
+        )
+        formatted_records = (format_evaluation_record(record) for record in records)
+
+        if memory_profiler is None:
+            sys.stdout.writelines(formatted_records)
+        else:
+            memory_profiler.profile_call(
+                STREAM_PROFILE_LABEL, sys.stdout.writelines, formatted_records
+            )
+
+        sys.stdout.flush()
+
+    if garbage_collection_batch is not None and garbage_collection_batch.report is not None:
+        sys.stderr.write(garbage_collection_batch.report.format_summary())
+
+    if memory_profiler is not None:
+        sys.stderr.write(memory_profiler.format_summary())
+
+
+class DaemonRequest(CustomPydanticBaseModel):
+    """Define invocation forwarded to calculator daemon.
+
+    Attributes
+    ----------
+    arguments : list[str]
+        command line arguments, without program name
+    """
+
+    arguments: list[str] = pydantic.Field(
+        description="command line arguments, without program name"
+    )
+
+
+class DaemonResponse(CustomPydanticBaseModel):
+    """Define outputs of invocation answered by calculator daemon.
+
+    Attributes
+    ----------
+    stdout : str
+        text written to standard output
+    stderr : str
+        text written to standard error
+    exit_code : int
+        exit status of invocation
+    """
+
+    stdout: str = pydantic.Field(description="text written to standard output")
+    stderr: str = pydantic.Field(description="text written to standard error")
+    exit_code: int = pydantic.Field(description="exit status of invocation")
+
+
+@pydantic.validate_call(validate_return=True)
+def run_console_calculator(command_line_arguments: list[str]) -> DaemonResponse:
+    """Run console calculator, capturing its outputs instead of writing them.
+
+    Parameters
+    ----------
+    command_line_arguments : list[str]
+        arguments without program name
+
+    Returns
+    -------
+    DaemonResponse
+        captured outputs and exit status
+
+    Notes
+    -----
+    #. `sys.stdout` and `sys.stderr` of whole process are redirected, so invocations must not
+       overlap.
+    #. ``--daemon`` and ``--stream`` are refused, as they depend on the invoking process.
+    """
+    if not can_forward(command_line_arguments):
+        return DaemonResponse(
+            stdout="",
+            stderr="Error: --daemon and --stream can not be forwarded to daemon",
+            exit_code=USAGE_EXIT_CODE,
+        )
+
+    standard_output = io.StringIO()
+    standard_error = io.StringIO()
+    exit_code = 0
+
+    with contextlib.redirect_stdout(standard_output), contextlib.redirect_stderr(standard_error):
+        try:
+            console_calculator(command_line_arguments)
+        except SystemExit as exit_request:
+            exit_code = (
+                exit_request.code
+                if isinstance(exit_request.code, int)
+                else int(exit_request.code is not None)
+            )
+        except Exception as error:  # noqa: BLE001  # pylint: disable=broad-except
+            sys.stderr.write(f"Error: {error}")
+            exit_code = 1
+
+    return DaemonResponse(
+        stdout=standard_output.getvalue(), stderr=standard_error.getvalue(), exit_code=exit_code
+    )
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Answer one forwarded invocation per connection.
+
+    Notes
+    -----
+    Daemon answers one connection at a time, so reading invocation is limited to
+    `DAEMON_REQUEST_TIMEOUT` seconds, after which a stalled client is disconnected.
+    """
 
-    return UserInputs.model_validate({"inputs": vars(parsed_arguments)})
+    timeout = DAEMON_REQUEST_TIMEOUT
+
+    def handle(self: "DaemonRequestHandler") -> None:
+        """Read invocation as a JSON line, run it, and write its outputs as JSON."""
+        try:
+            request_line = self.rfile.readline()
+        except TimeoutError:
+            return
+
+        try:
+            daemon_request = DaemonRequest.model_validate_json(request_line)
+        except pydantic.ValidationError as error:
+            daemon_response = DaemonResponse(
+                stdout="", stderr=f"Error: {error}", exit_code=USAGE_EXIT_CODE
+            )
+        else:
+            daemon_response = run_console_calculator(daemon_request.arguments)
+
+        self.wfile.write(daemon_response.model_dump_json().encode())
+
+
+def create_daemon_server(socket_path: str) -> "socketserver.UnixStreamServer":
+    """Listen on Unix socket, replacing socket left behind by a daemon that stopped.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket to listen on
+
+    Returns
+    -------
+    socketserver.UnixStreamServer
+        server answering one invocation at a time, not yet serving
+
+    Raises
+    ------
+    FileExistsError
+        if another daemon is listening on `socket_path`, or if something other than a socket
+        owned by current user is there
+
+    Notes
+    -----
+    Socket is only accessible by current user.
+    """
+    if os.path.lexists(socket_path):
+        if not is_own_socket(socket_path):
+            raise FileExistsError(f"{socket_path} is not a socket owned by current user")
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except ConnectionRefusedError:
+                pathlib.Path(socket_path).unlink()
+            else:
+                raise FileExistsError(f"Daemon is already listening on {socket_path}")
+
+    previous_umask = os.umask(0o177)
+    try:
+        return socketserver.UnixStreamServer(socket_path, DaemonRequestHandler)
+    finally:
+        os.umask(previous_umask)
+
+
+@pydantic.validate_call(validate_return=True)
+def serve_daemon(socket_path: str) -> None:
+    """Answer forwarded invocations until interrupted or terminated.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket to listen on
+
+    Notes
+    -----
+    #. Invocations are answered one at a time, in a process where calculator is already
+       imported.
+    #. Socket is removed on ``SIGINT`` and ``SIGTERM``.
+    """
+    daemon_server = create_daemon_server(socket_path)
+    previous_handler = signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        with contextlib.suppress(KeyboardInterrupt), daemon_server:
+            daemon_server.serve_forever()
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        pathlib.Path(socket_path).unlink(missing_ok=True)
 
 
 @pydantic.validate_call(validate_return=True)
-def console_calculator() -> None:
-    """Calculate arithmetic expressions."""
-    user_inputs = capture_user_inputs()
+def console_calculator(command_line_arguments: list[str] | None = None) -> None:
+    """Calculate arithmetic expressions.
+
+    Parameters
+    ----------
+    command_line_arguments : list[str] | None, optional
+        arguments without program name, by default from `sys.argv`
+    """
+    user_inputs = capture_user_inputs(command_line_arguments)
+
+    if user_inputs.inputs.calculator_type == CalculatorType.DAEMON:
+        try:
+            serve_daemon(user_inputs.inputs.socket_path)  # type: ignore[union-attr]
+        except OSError as error:
+            sys.stderr.write(f"Error: {error}")
+
+        return
+
+    if user_inputs.inputs.calculator_type == CalculatorType.STREAM:
+        try:
+            stream_calculator(
+                user_inputs.inputs.source,  # type: ignore[union-attr]
+                workers=user_inputs.inputs.workers,  # type: ignore[union-attr]
+                chunksize=user_inputs.inputs.chunksize,  # type: ignore[union-attr]
+                pause_gc=user_inputs.inputs.pause_gc,  # type: ignore[union-attr]
+                profile_memory=user_inputs.profile_memory,
+            )
+        except OSError as error:
+            sys.stderr.write(f"Error: {error}")
+
+        return
+
+    memory_profiler = MemoryProfiler() if user_inputs.profile_memory else None
+    binary_calculator = (
+        calculate_results
+        if memory_profiler is None
+        else memory_profiler.decorate(calculate_results)
+    )
+    general_calculator = (
+        solve_simplification
+        if memory_profiler is None
+        else memory_profiler.decorate(solve_simplification)
+    )
 
     try:
         match user_inputs.inputs.calculator_type:
             case CalculatorType.BINARY:
-                operation_result = calculate_results(
+                operation_result = binary_calculator(
                     user_inputs.inputs.first_number,  # type: ignore[union-attr]
                     user_inputs.inputs.operator,  # type: ignore[union-attr]
                     user_inputs.inputs.second_number,  # type: ignore[union-attr]
                 )
             case CalculatorType.GENERAL:
-                operation_result = solve_simplification(
+                operation_result = general_calculator(
                     user_inputs.inputs.expression  # type: ignore[union-attr]
                 )
             case _:  # pragma: no cover
@@ -137,6 +612,9 @@ def console_calculator() -> None:
     else:
         sys.stdout.write(f"Result = {operation_result}")
 
+    if memory_profiler is not None:
+        sys.stderr.write(memory_profiler.format_summary())
+
 
 if __name__ == "__main__":
     console_calculator()
@@ -0,0 +1,177 @@
+"""Forward console calculator invocations to a running daemon, without importing calculator.
+
+Only standard library modules are imported here, so that forwarded invocations do not pay for
+importing `pydantic` and `package_name_to_import_with`.
+"""
+
+import importlib
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import typing
+
+SOCKET_ENVIRONMENT_VARIABLE = "CONSOLE_CALCULATOR_SOCKET"
+SOCKET_FILE_NAME = "console-calculator"
+DAEMON_TIMEOUT = 30.0
+LOCAL_ONLY_FLAGS = frozenset({"--daemon", "--stream"})
+
+
+def define_socket_path() -> str:
+    """Find Unix socket path of daemon.
+
+    Returns
+    -------
+    str
+        value of ``CONSOLE_CALCULATOR_SOCKET`` if set, otherwise a per user path inside
+        ``XDG_RUNTIME_DIR`` or temporary directory
+    """
+    if socket_path := os.environ.get(SOCKET_ENVIRONMENT_VARIABLE):
+        return socket_path
+
+    socket_directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user_suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+
+    return os.path.join(socket_directory, f"{SOCKET_FILE_NAME}{user_suffix}.sock")  # noqa: PTH118
+
+
+def is_own_socket(socket_path: str) -> bool:
+    """Check whether path is a Unix socket owned by current user, without following links.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+
+    Returns
+    -------
+    bool
+        whether path exists, is a socket and belongs to current user
+
+    Notes
+    -----
+    Default socket path may be in shared temporary directory, where any local user could
+    create it first. Sticky bit of such directories prevents other users from replacing a
+    socket after this check.
+    """
+    try:
+        socket_status = os.lstat(socket_path)
+    except OSError:
+        return False
+
+    return stat.S_ISSOCK(socket_status.st_mode) and (
+        not hasattr(os, "getuid") or socket_status.st_uid == os.getuid()
+    )
+
+
+def is_local_only_flag(name: str) -> bool:
+    """Check whether an argument names a flag depending on invoking process, or abbreviates one.
+
+    Parameters
+    ----------
+    name : str
+        command line argument, without value after ``=``
+
+    Returns
+    -------
+    bool
+        whether `name` is a long option and a prefix of any of `LOCAL_ONLY_FLAGS`
+    """
+    return (
+        name.startswith("--")
+        and len(name) > len("--")
+        and any(flag.startswith(name) for flag in LOCAL_ONLY_FLAGS)
+    )
+
+
+def can_forward(arguments: list[str]) -> bool:
+    """Check whether invocation can be answered by daemon.
+
+    Parameters
+    ----------
+    arguments : list[str]
+        command line arguments, without program name
+
+    Returns
+    -------
+    bool
+        whether arguments neither start daemon nor read local files or standard input
+
+    Notes
+    -----
+    Abbreviations of local flags, like ``--str``, are not forwarded either, even though command
+    line parser does not expand abbreviations, so that daemon never reads its own files.
+    """
+    return hasattr(socket, "AF_UNIX") and not any(
+        is_local_only_flag(argument.partition("=")[0]) for argument in arguments
+    )
+
+
+def forward_to_daemon(
+    arguments: list[str], socket_path: str | None = None
+) -> dict[str, typing.Any] | None:
+    """Send invocation to daemon, and wait for its outputs.
+
+    Parameters
+    ----------
+    arguments : list[str]
+        command line arguments, without program name
+    socket_path : str | None, optional
+        Unix socket path of daemon, by default from `define_socket_path`
+
+    Returns
+    -------
+    dict[str, typing.Any] | None
+        ``stdout``, ``stderr`` and ``exit_code`` of invocation, or None if daemon is not
+        running, does not answer, or socket is not owned by current user
+    """
+    socket_path = socket_path or define_socket_path()
+    if not is_own_socket(socket_path):
+        return None
+
+    request = json.dumps({"arguments": arguments}).encode() + b"\n"
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(DAEMON_TIMEOUT)
+            client.connect(socket_path)
+            client.sendall(request)
+            client.shutdown(socket.SHUT_WR)
+
+            with client.makefile("rb") as response_stream:
+                response = response_stream.read()
+    except OSError:
+        return None
+
+    try:
+        return typing.cast("dict[str, typing.Any]", json.loads(response))
+    except ValueError:
+        return None
+
+
+def console_calculator() -> None:
+    """Calculate arithmetic expressions, through daemon if it is running.
+
+    Notes
+    -----
+    Falls back to evaluating in current process if daemon is not running, and for ``--daemon``
+    and ``--stream`` invocations.
+    """
+    arguments = sys.argv[1:]
+
+    if can_forward(arguments) and (response := forward_to_daemon(arguments)) is not None:
+        sys.stdout.write(response["stdout"])
+        sys.stderr.write(response["stderr"])
+
+        if exit_code := response["exit_code"]:
+            sys.exit(exit_code)
+
+        return
+
+    importlib.import_module("module_that_can_be_invoked_from_cli").console_calculator()
+
+
+if __name__ == "__main__":
+    console_calculator()
@@ -0,0 +1,725 @@
+"""Calculate arithmetic expressions over HTTP with JSON payloads."""
+
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import http
+import json
+import math
+import threading
+import time
+import typing
+
+import pydantic
+
+from module_that_can_be_invoked_from_cli import BinaryInputs, GeneralInputs
+from package_name_to_import_with import (
+    CustomPydanticBaseModel,
+    calculate_results,
+    solve_simplification,
+)
+from package_name_to_import_with.async_module import run_evaluation
+from package_name_to_import_with.parallel_module import DEFAULT_CHUNK_SIZE, split_into_chunks
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_KEEP_ALIVE_TIMEOUT = 5.0
+DEFAULT_REQUEST_TIMEOUT = 10.0
+MAXIMUM_BODY_SIZE = 1024 * 1024
+MAXIMUM_HEADER_COUNT = 64
+MAXIMUM_BATCH_SIZE = 10000
+
+EVALUATE_PATH = "/evaluate"
+BATCH_PATH = "/evaluate/batch"
+STATISTICS_PATH = "/stats"
+
+JSON_CONTENT_TYPE = "application/json"
+
+JsonPayload: typing.TypeAlias = dict[str, typing.Any] | list[dict[str, typing.Any]]
+
+
+class RequestRejectedError(ValueError):
+    """Signal request that is answered with an error status without being dispatched.
+
+    Parameters
+    ----------
+    status : http.HTTPStatus
+        status of response
+    message : str
+        reason of rejection
+    """
+
+    def __init__(self: "RequestRejectedError", status: http.HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class EvaluationInputs(CustomPydanticBaseModel):
+    """Define payload of one evaluation, matching sub-commands of console calculator.
+
+    Attributes
+    ----------
+    inputs : BinaryInputs | GeneralInputs
+        inputs for the calculator
+    """
+
+    inputs: BinaryInputs | GeneralInputs = pydantic.Field(
+        description="inputs for the calculator", discriminator="calculator_type"
+    )
+
+
+BATCH_ADAPTER = pydantic.TypeAdapter(
+    typing.Annotated[list[EvaluationInputs], pydantic.Field(max_length=MAXIMUM_BATCH_SIZE)]
+)
+
+
+class ServerStatistics(CustomPydanticBaseModel):
+    """Define throughput and latency of server since it started.
+
+    Attributes
+    ----------
+    requests : int
+        number of answered evaluation requests, including invalid payloads
+    evaluations : int
+        number of evaluated payloads, counting every item of batches
+    failures : int
+        number of evaluations that failed
+    uptime_seconds : float
+        seconds since server started
+    evaluations_per_second : float
+        evaluations divided by uptime
+    mean_latency_seconds : float
+        mean time to answer a request
+    maximum_latency_seconds : float
+        longest time to answer a request
+    """
+
+    requests: int = pydantic.Field(description="number of answered requests", ge=0)
+    evaluations: int = pydantic.Field(description="number of evaluated payloads", ge=0)
+    failures: int = pydantic.Field(description="number of evaluations that failed", ge=0)
+    uptime_seconds: float = pydantic.Field(description="seconds since server started", ge=0)
+    evaluations_per_second: float = pydantic.Field(
+        description="evaluations divided by uptime", ge=0
+    )
+    mean_latency_seconds: float = pydantic.Field(description="mean time to answer a request", ge=0)
+    maximum_latency_seconds: float = pydantic.Field(
+        description="longest time to answer a request", ge=0
+    )
+
+
+class StatisticsRecorder:
+    """Accumulate throughput and latency of answered requests."""
+
+    def __init__(self: "StatisticsRecorder") -> None:
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._requests = 0
+        self._evaluations = 0
+        self._failures = 0
+        self._total_latency = 0.0
+        self._maximum_latency = 0.0
+
+    def record(
+        self: "StatisticsRecorder", latency: float, evaluations: int, failures: int
+    ) -> None:
+        """Count one answered request.
+
+        Parameters
+        ----------
+        latency : float
+            seconds taken to answer request
+        evaluations : int
+            number of payloads evaluated for request
+        failures : int
+            number of those evaluations that failed
+        """
+        with self._lock:
+            self._requests += 1
+            self._evaluations += evaluations
+            self._failures += failures
+            self._total_latency += latency
+            self._maximum_latency = max(self._maximum_latency, latency)
+
+    @property
+    def statistics(self: "StatisticsRecorder") -> ServerStatistics:
+        """Capture statistics so far.
+
+        Returns
+        -------
+        ServerStatistics
+            throughput and latency since server started
+        """
+        with self._lock:
+            uptime = time.perf_counter() - self._start
+
+            return ServerStatistics(
+                requests=self._requests,
+                evaluations=self._evaluations,
+                failures=self._failures,
+                uptime_seconds=uptime,
+                evaluations_per_second=self._evaluations / uptime if uptime else 0.0,
+                mean_latency_seconds=(
+                    self._total_latency / self._requests if self._requests else 0.0
+                ),
+                maximum_latency_seconds=self._maximum_latency,
+            )
+
+
+def evaluate_inputs(inputs: BinaryInputs | GeneralInputs) -> dict[str, typing.Any]:
+    """Evaluate one payload, capturing failure as an error message.
+
+    Parameters
+    ----------
+    inputs : BinaryInputs | GeneralInputs
+        inputs for the calculator
+
+    Returns
+    -------
+    dict[str, typing.Any]
+        either ``{"result": <result>}`` or ``{"error": <reason>}``
+
+    Notes
+    -----
+    #. Defined at module level, so that it can be sent to worker processes.
+    #. Infinite and NaN results are reported as errors, as JSON can not represent them.
+    """
+    try:
+        if isinstance(inputs, BinaryInputs):
+            result = calculate_results(inputs.first_number, inputs.operator, inputs.second_number)
+        else:
+            result = solve_simplification(inputs.expression)
+    except Exception as error:  # noqa: BLE001  # pylint: disable=broad-except
+        return {"error": str(error)}
+
+    if not math.isfinite(result):
+        return {"error": f"Result is not finite: {result}"}
+
+    return {"result": result}
+
+
+def evaluate_batch_inputs(
+    batch_inputs: list[BinaryInputs | GeneralInputs],
+) -> list[dict[str, typing.Any]]:
+    """Evaluate a chunk of payloads inside one worker.
+
+    Parameters
+    ----------
+    batch_inputs : list[BinaryInputs | GeneralInputs]
+        inputs for the calculator
+
+    Returns
+    -------
+    list[dict[str, typing.Any]]
+        output of `evaluate_inputs` for every payload, in same order
+
+    Notes
+    -----
+    Defined at module level, so that it can be sent to worker processes.
+    """
+    return [evaluate_inputs(inputs) for inputs in batch_inputs]
+
+
+def format_validation_error(error: pydantic.ValidationError) -> dict[str, typing.Any]:
+    """Describe invalid payload.
+
+    Parameters
+    ----------
+    error : pydantic.ValidationError
+        failure of payload validation
+
+    Returns
+    -------
+    dict[str, typing.Any]
+        ``{"error": <reason>}``
+    """
+    return {"error": error.errors(include_url=False, include_context=False)}
+
+
+def format_response(status: http.HTTPStatus, payload: JsonPayload, keep_alive: bool) -> bytes:
+    """Serialise HTTP/1.1 response with JSON body.
+
+    Parameters
+    ----------
+    status : http.HTTPStatus
+        status of response
+    payload : JsonPayload
+        body of response
+    keep_alive : bool
+        whether connection stays open for further requests
+
+    Returns
+    -------
+    bytes
+        status line, headers and body
+
+    Notes
+    -----
+    Payloads with infinite or NaN numbers are answered with status 500 instead, as they can
+    not be represented in standard JSON.
+    """
+    try:
+        body = json.dumps(payload, allow_nan=False).encode()
+    except ValueError:
+        status = http.HTTPStatus.INTERNAL_SERVER_ERROR
+        body = json.dumps({"error": "Response can not be represented in JSON."}).encode()
+
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {JSON_CONTENT_TYPE}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+
+    return head.encode("ascii") + body
+
+
+class EvaluationServer:
+    """Answer evaluation requests over keep-alive HTTP/1.1 connections.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor | None, optional
+        worker pool for evaluations, by default executor of event loop
+    timeout : float | None, optional
+        seconds to wait for each evaluation, by default no limit
+    keep_alive_timeout : float, optional
+        seconds an idle connection is kept open, by default 5
+    chunksize : int, optional
+        number of batch payloads sent to a worker at once, by default 256
+    request_timeout : float, optional
+        seconds allowed to receive headers, and again to receive body, of a request once its
+        request line arrived, by default 10
+
+    Notes
+    -----
+    #. ``POST /evaluate`` accepts one payload, ``{"inputs": {...}}``, with inputs of ``binary``
+       or ``general`` sub-commands of console calculator.
+    #. ``POST /evaluate/batch`` accepts a list of up to `MAXIMUM_BATCH_SIZE` such payloads, and
+       answers a list of results in same order. Payloads are sent to workers in chunks, so that
+       inter-process communication does not dominate, and `timeout` applies to every chunk.
+    #. ``GET /stats`` answers throughput and latency since server started.
+    #. Only bodies with ``Content-Length`` are supported, not chunked transfer encoding.
+    """
+
+    def __init__(
+        self: "EvaluationServer",
+        executor: concurrent.futures.Executor | None = None,
+        timeout: float | None = None,
+        keep_alive_timeout: float = DEFAULT_KEEP_ALIVE_TIMEOUT,
+        chunksize: int = DEFAULT_CHUNK_SIZE,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> None:
+        self.executor = executor
+        self.timeout = timeout
+        self.keep_alive_timeout = keep_alive_timeout
+        self.chunksize = chunksize
+        self.request_timeout = request_timeout
+        self.statistics_recorder = StatisticsRecorder()
+
+    async def evaluate(
+        self: "EvaluationServer", inputs: BinaryInputs | GeneralInputs
+    ) -> dict[str, typing.Any]:
+        """Evaluate one payload in worker pool.
+
+        Parameters
+        ----------
+        inputs : BinaryInputs | GeneralInputs
+            inputs for the calculator
+
+        Returns
+        -------
+        dict[str, typing.Any]
+            either ``{"result": <result>}`` or ``{"error": <reason>}``
+        """
+        try:
+            return await run_evaluation(
+                functools.partial(evaluate_inputs, inputs),
+                inline=False,
+                executor=self.executor,
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            return {"error": f"Evaluation timed out after {self.timeout} seconds"}
+
+    async def evaluate_chunk(
+        self: "EvaluationServer", batch_inputs: list[BinaryInputs | GeneralInputs]
+    ) -> list[dict[str, typing.Any]]:
+        """Evaluate a chunk of payloads in one call to worker pool.
+
+        Parameters
+        ----------
+        batch_inputs : list[BinaryInputs | GeneralInputs]
+            inputs for the calculator
+
+        Returns
+        -------
+        list[dict[str, typing.Any]]
+            either ``{"result": <result>}`` or ``{"error": <reason>}`` for every payload, all
+            errors if chunk times out
+        """
+        try:
+            return await run_evaluation(
+                functools.partial(evaluate_batch_inputs, batch_inputs),
+                inline=False,
+                executor=self.executor,
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            return [
+                {"error": f"Evaluation timed out after {self.timeout} seconds"}
+                for _ in batch_inputs
+            ]
+
+    async def dispatch(
+        self: "EvaluationServer", method: str, path: str, body: bytes
+    ) -> tuple[http.HTTPStatus, JsonPayload]:
+        """Route request to its endpoint.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method
+        path : str
+            requested path, without query
+        body : bytes
+            content of request
+
+        Returns
+        -------
+        tuple[http.HTTPStatus, JsonPayload]
+            status and body of response
+        """
+        start = time.perf_counter()
+        evaluations = failures = 0
+
+        if path == STATISTICS_PATH:
+            if method != "GET":
+                return http.HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use GET."}
+
+            return http.HTTPStatus.OK, self.statistics_recorder.statistics.model_dump()
+
+        if path not in (EVALUATE_PATH, BATCH_PATH):
+            return http.HTTPStatus.NOT_FOUND, {"error": f"Unknown path {path}."}
+
+        if method != "POST":
+            return http.HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST."}
+
+        payload: JsonPayload
+        try:
+            if path == EVALUATE_PATH:
+                evaluation_inputs = EvaluationInputs.model_validate_json(body)
+                payload = await self.evaluate(evaluation_inputs.inputs)
+                evaluations, failures = 1, int("error" in payload)
+                status = http.HTTPStatus.UNPROCESSABLE_ENTITY if failures else http.HTTPStatus.OK
+            else:
+                batch_inputs = BATCH_ADAPTER.validate_json(body)
+                chunk_payloads = await asyncio.gather(
+                    *(
+                        self.evaluate_chunk(chunk)
+                        for chunk in split_into_chunks(
+                            (evaluation.inputs for evaluation in batch_inputs), self.chunksize
+                        )
+                    )
+                )
+                payload = [record for chunk_payload in chunk_payloads for record in chunk_payload]
+                evaluations = len(payload)
+                failures = sum("error" in record for record in payload)
+                status = http.HTTPStatus.OK
+        except pydantic.ValidationError as error:
+            status, payload = http.HTTPStatus.UNPROCESSABLE_ENTITY, format_validation_error(error)
+
+        self.statistics_recorder.record(time.perf_counter() - start, evaluations, failures)
+
+        return status, payload
+
+    async def handle_connection(
+        self: "EvaluationServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests of one connection until it is closed or idle for too long.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            incoming stream of connection
+        writer : asyncio.StreamWriter
+            outgoing stream of connection
+        """
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request_line = await asyncio.wait_for(
+                        reader.readline(), self.keep_alive_timeout
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+                if not request_line.strip():
+                    break
+
+                status, payload, keep_alive = await self.handle_request(request_line, reader)
+                writer.write(format_response(status, payload, keep_alive))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def read_headers(reader: asyncio.StreamReader) -> dict[str, str] | None:
+        """Read header lines of one request, up to empty line ending them.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            incoming stream of connection, positioned after request line
+
+        Returns
+        -------
+        dict[str, str] | None
+            values keyed by lowercase names, or None if there are more than
+            `MAXIMUM_HEADER_COUNT` header lines
+        """
+        headers: dict[str, str] = {}
+        header_count = 0
+
+        while (header_line := await reader.readline()).strip():
+            header_count += 1
+            if header_count > MAXIMUM_HEADER_COUNT:
+                return None
+
+            name, _, value = header_line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        return headers
+
+    async def read_request(
+        self: "EvaluationServer", request_line: bytes, reader: asyncio.StreamReader
+    ) -> tuple[str, str, bytes, bool]:
+        """Read headers and body of one request, within `request_timeout` for each.
+
+        Parameters
+        ----------
+        request_line : bytes
+            first line of request
+        reader : asyncio.StreamReader
+            incoming stream of connection, positioned after request line
+
+        Returns
+        -------
+        tuple[str, str, bytes, bool]
+            method, path without query, body, and whether connection stays open
+
+        Raises
+        ------
+        RequestRejectedError
+            if request is malformed, too large or not received in time
+        """
+        try:
+            method, target, version = request_line.decode("ascii").split()
+        except (UnicodeDecodeError, ValueError) as error:
+            raise RequestRejectedError(
+                http.HTTPStatus.BAD_REQUEST, "Malformed request line."
+            ) from error
+
+        try:
+            headers = await asyncio.wait_for(self.read_headers(reader), self.request_timeout)
+        except asyncio.TimeoutError as error:
+            raise RequestRejectedError(
+                http.HTTPStatus.REQUEST_TIMEOUT, "Request was not received in time."
+            ) from error
+
+        if headers is None:
+            raise RequestRejectedError(
+                http.HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers."
+            )
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        if "transfer-encoding" in headers:
+            raise RequestRejectedError(
+                http.HTTPStatus.LENGTH_REQUIRED,
+                "Use Content-Length instead of Transfer-Encoding.",
+            )
+
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError as error:
+            raise RequestRejectedError(
+                http.HTTPStatus.BAD_REQUEST, "Invalid Content-Length."
+            ) from error
+
+        if content_length < 0:
+            raise RequestRejectedError(http.HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+
+        if content_length > MAXIMUM_BODY_SIZE:
+            raise RequestRejectedError(
+                http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Body can not exceed {MAXIMUM_BODY_SIZE} bytes.",
+            )
+
+        try:
+            body = await asyncio.wait_for(reader.readexactly(content_length), self.request_timeout)
+        except asyncio.TimeoutError as error:
+            raise RequestRejectedError(
+                http.HTTPStatus.REQUEST_TIMEOUT, "Request was not received in time."
+            ) from error
+
+        return method, target.partition("?")[0], body, keep_alive
+
+    async def handle_request(
+        self: "EvaluationServer", request_line: bytes, reader: asyncio.StreamReader
+    ) -> tuple[http.HTTPStatus, JsonPayload, bool]:
+        """Read headers and body of one request, and answer it.
+
+        Parameters
+        ----------
+        request_line : bytes
+            first line of request
+        reader : asyncio.StreamReader
+            incoming stream of connection, positioned after request line
+
+        Returns
+        -------
+        tuple[http.HTTPStatus, JsonPayload, bool]
+            status and body of response, and whether connection stays open, never after a
+            rejected request
+        """
+        try:
+            method, path, body, keep_alive = await self.read_request(request_line, reader)
+        except RequestRejectedError as rejection:
+            return rejection.status, {"error": str(rejection)}, False
+
+        status, payload = await self.dispatch(method, path, body)
+
+        return status, payload, keep_alive
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int | None = None,
+    timeout: float | None = None,
+    keep_alive_timeout: float = DEFAULT_KEEP_ALIVE_TIMEOUT,
+) -> None:
+    """Serve evaluations until cancelled.
+
+    Parameters
+    ----------
+    host : str, optional
+        interface to listen on, by default only local connections
+    port : int, optional
+        port to listen on, by default 8080
+    workers : int | None, optional
+        number of worker processes, by default number of processors
+    timeout : float | None, optional
+        seconds to wait for each evaluation, by default no limit
+    keep_alive_timeout : float, optional
+        seconds an idle connection is kept open, by default 5
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        evaluation_server = EvaluationServer(
+            executor=executor, timeout=timeout, keep_alive_timeout=keep_alive_timeout
+        )
+        server = await asyncio.start_server(evaluation_server.handle_connection, host, port)
+
+        async with server:
+            await server.serve_forever()
+
+
+class ServerInputs(CustomPydanticBaseModel):
+    """Define arguments of HTTP calculator.
+
+    Attributes
+    ----------
+    host : str
+        interface to listen on
+    port : int
+        port to listen on
+    workers : int | None
+        number of worker processes
+    timeout : float | None
+        seconds to wait for each evaluation
+    keep_alive_timeout : float
+        seconds an idle connection is kept open
+    """
+
+    host: str = pydantic.Field(default=DEFAULT_HOST, description="interface to listen on")
+    port: int = pydantic.Field(
+        default=DEFAULT_PORT, description="port to listen on", ge=0, le=65535
+    )
+    workers: int | None = pydantic.Field(
+        default=None, description="number of worker processes", gt=0
+    )
+    timeout: float | None = pydantic.Field(
+        default=None, description="seconds to wait for each evaluation", gt=0
+    )
+    keep_alive_timeout: float = pydantic.Field(
+        default=DEFAULT_KEEP_ALIVE_TIMEOUT,
+        description="seconds an idle connection is kept open",
+        gt=0,
+    )
+
+
+@pydantic.validate_call(validate_return=True)
+def capture_server_inputs() -> ServerInputs:
+    """Capture arguments of HTTP calculator.
+
+    Returns
+    -------
+    ServerInputs
+        captured arguments
+    """
+    parser = argparse.ArgumentParser(description="calculator over HTTP", add_help=True)
+
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST, help=f"interface to listen on (default: {DEFAULT_HOST})"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"port to listen on (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="evaluate over N processes (default: number of processors)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="abandon evaluations taking longer than SECONDS",
+    )
+    parser.add_argument(
+        "--keep-alive-timeout",
+        type=float,
+        default=DEFAULT_KEEP_ALIVE_TIMEOUT,
+        metavar="SECONDS",
+        help=f"close connections idle for SECONDS (default: {DEFAULT_KEEP_ALIVE_TIMEOUT:g})",
+    )
+
+    parsed_arguments, _ = parser.parse_known_args()
+
+    return ServerInputs.model_validate(vars(parsed_arguments))
+
+
+@pydantic.validate_call(validate_return=True)
+def http_calculator() -> None:
+    """Calculate arithmetic expressions over HTTP."""
+    server_inputs = capture_server_inputs()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(**server_inputs.model_dump()))
+
+
+if __name__ == "__main__":
+    http_calculator()
@@ -1,18 +1,152 @@
-"""Expose selected package contents."""
+"""Expose selected package contents.
+
+Contents are imported from submodules on first access, so that importing the package is cheap.
+"""
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .caching_module import BoundedCache, CacheStatistics, EvictionPolicy
+    from .calculator_sub_package import BinaryArithmeticOperator, calculate_results
+    from .data_using_module import METADATA
+    from .garbage_collection_module import (
+        GarbageCollectionPolicy,
+        GarbageCollector,
+        define_garbage_collection_decorator,
+    )
+    from .simplify import CompiledExpression, compile_expression, solve_simplification
+    from .utils import CustomFloatEnum, CustomPydanticBaseModel, CustomStrEnum
+
+LAZILY_IMPORTED_ATTRIBUTES: dict[str, str] = {
+    "METADATA": ".data_using_module",
+    "BinaryArithmeticOperator": ".calculator_sub_package",
+    "BoundedCache": ".caching_module",
+    "CacheStatistics": ".caching_module",
+    "CompiledExpression": ".simplify",
+    "CustomFloatEnum": ".utils",
+    "CustomPydanticBaseModel": ".utils",
+    "CustomStrEnum": ".utils",
+    "EvictionPolicy": ".caching_module",
+    "GarbageCollectionPolicy": ".garbage_collection_module",
+    "GarbageCollector": ".garbage_collection_module",
+    "calculate_results": ".calculator_sub_package",
+    "compile_expression": ".simplify",
+    "define_garbage_collection_decorator": ".garbage_collection_module",
+    "solve_simplification": ".simplify",
+}
+LAZILY_IMPORTED_SUBMODULES = frozenset(
+    {
+        "async_module",
+        "bytecode_module",
+        "caching_module",
+        "calculator_sub_package",
+        "codegen_module",
+        "columnar_module",
+        "data_using_module",
+        "garbage_collection_module",
+        "instrumentation_module",
+        "memory_profiling_module",
+        "parallel_module",
+        "persistent_cache_module",
+        "simplify",
+        "streaming_module",
+        "utils",
+        "vectorisation_module",
+    }
+)
+
+
+def read_package_version() -> str:
+    """Read version of the package without validating rest of package metadata.
+
+    Returns
+    -------
+    str
+        version of the package
+
+    Notes
+    -----
+    #. Avoids importing ``pydantic``, unlike `METADATA`, for callers that need only version.
+    #. Reuses `METADATA` if it is already validated.
+    """
+    if (metadata := globals().get("METADATA")) is not None:
+        return str(metadata.Version)
+
+    import importlib.resources  # noqa: PLC0415
+    import json  # noqa: PLC0415
+
+    metadata_file = importlib.resources.files(__name__).joinpath("metadata.json")
+
+    return str(json.loads(metadata_file.read_text())["Version"])
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    """Import package contents on first access.
+
+    Parameters
+    ----------
+    name : str
+        name of requested attribute
+
+    Returns
+    -------
+    typing.Any
+        requested attribute, stored in package namespace for later accesses
+
+    Raises
+    ------
+    AttributeError
+        if `name` is not exposed by the package
+
+    Notes
+    -----
+    Submodules are also imported on first access, as with eager imports of their contents.
+    """
+    attribute: typing.Any
+
+    if name == "__version__":
+        attribute = read_package_version()
+    elif name in LAZILY_IMPORTED_ATTRIBUTES:
+        submodule = importlib.import_module(LAZILY_IMPORTED_ATTRIBUTES[name], __name__)
+        attribute = getattr(submodule, name)
+    elif name in LAZILY_IMPORTED_SUBMODULES:
+        attribute = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = attribute
+
+    return attribute
+
+
+def __dir__() -> list[str]:
+    """List package contents, including those not imported yet.
+
+    Returns
+    -------
+    list[str]
+        names of attributes and submodules of the package
+    """
+    return sorted(
+        {*globals(), *LAZILY_IMPORTED_ATTRIBUTES, *LAZILY_IMPORTED_SUBMODULES, "__version__"}
+    )
 
-from .calculator_sub_package import BinaryArithmeticOperator, calculate_results
-from .data_using_module import METADATA
-from .garbage_collection_module import define_garbage_collection_decorator
-from .simplify import solve_simplification
-from .utils import CustomFloatEnum, CustomPydanticBaseModel, CustomStrEnum
 
 __all__ = [
     "BinaryArithmeticOperator",
+    "BoundedCache",
+    "CacheStatistics",
+    "CompiledExpression",
     "CustomFloatEnum",
     "CustomPydanticBaseModel",
     "CustomStrEnum",
+    "EvictionPolicy",
+    "GarbageCollectionPolicy",
+    "GarbageCollector",
     "calculate_results",
+    "compile_expression",
     "define_garbage_collection_decorator",
     "solve_simplification",
 ]
-__version__: str = METADATA.Version
+__version__: str
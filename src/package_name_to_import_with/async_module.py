@@ -0,0 +1,349 @@
+"""Evaluate arithmetic expressions from asynchronous code without blocking event loop."""
+
+import asyncio
+import collections
+import collections.abc
+import concurrent.futures
+import functools
+import typing
+import weakref
+
+import pydantic
+
+from .simplify import solve_simplification
+from .streaming_module import EvaluationRecord, evaluate_expression
+
+DEFAULT_MAXIMUM_IN_FLIGHT = 64
+INLINE_EXPRESSION_LENGTH = 256
+MAXIMUM_EXECUTOR_SUBMISSIONS = 64
+
+EvaluationResult = typing.TypeVar("EvaluationResult")
+
+SUBMISSION_LIMITERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def define_submission_limiter() -> asyncio.Semaphore:
+    """Find limiter of evaluations submitted to executors from running event loop.
+
+    Returns
+    -------
+    asyncio.Semaphore
+        semaphore shared by all evaluations of running event loop, allowing
+        `MAXIMUM_EXECUTOR_SUBMISSIONS` at once when created
+    """
+    running_loop = asyncio.get_running_loop()
+
+    if (submission_limiter := SUBMISSION_LIMITERS.get(running_loop)) is None:
+        submission_limiter = asyncio.Semaphore(MAXIMUM_EXECUTOR_SUBMISSIONS)
+        SUBMISSION_LIMITERS[running_loop] = submission_limiter
+
+    return submission_limiter
+
+
+async def submit_evaluation(
+    evaluation: collections.abc.Callable[[], EvaluationResult],
+    executor: concurrent.futures.Executor | None = None,
+) -> EvaluationResult:
+    """Run an evaluation in an executor, once shared limiter of event loop allows it.
+
+    Parameters
+    ----------
+    evaluation : collections.abc.Callable[[], EvaluationResult]
+        evaluation without arguments, picklable if `executor` uses processes
+    executor : concurrent.futures.Executor | None, optional
+        executor for evaluation, by default executor of event loop
+
+    Returns
+    -------
+    EvaluationResult
+        output of `evaluation`
+
+    Notes
+    -----
+    Cancelling stops waiting for evaluation, but it keeps its place in limiter until it
+    finishes in executor, so that abandoned evaluations still count against the limit.
+    """
+    submission_limiter = define_submission_limiter()
+    await submission_limiter.acquire()
+
+    try:
+        submission = asyncio.get_running_loop().run_in_executor(executor, evaluation)
+    except BaseException:
+        submission_limiter.release()
+        raise
+
+    def release_submission(completed_submission: "asyncio.Future[EvaluationResult]") -> None:
+        """Free place of finished evaluation, retrieving its outcome if nobody waits for it.
+
+        Parameters
+        ----------
+        completed_submission : asyncio.Future[EvaluationResult]
+            finished evaluation
+        """
+        submission_limiter.release()
+
+        if not completed_submission.cancelled():
+            _ = completed_submission.exception()
+
+    submission.add_done_callback(release_submission)
+
+    return await asyncio.shield(submission)
+
+
+async def run_evaluation(
+    evaluation: collections.abc.Callable[[], EvaluationResult],
+    inline: bool,
+    executor: concurrent.futures.Executor | None = None,
+    timeout: float | None = None,
+) -> EvaluationResult:
+    """Run an evaluation on event loop or in an executor.
+
+    Parameters
+    ----------
+    evaluation : collections.abc.Callable[[], EvaluationResult]
+        evaluation without arguments, picklable if `executor` uses processes
+    inline : bool
+        whether to run `evaluation` directly on event loop
+    executor : concurrent.futures.Executor | None, optional
+        executor for evaluations that are not inline, by default executor of event loop
+    timeout : float | None, optional
+        seconds to wait for evaluations that are not inline, by default no limit
+
+    Returns
+    -------
+    EvaluationResult
+        output of `evaluation`
+
+    Raises
+    ------
+    asyncio.TimeoutError
+        if evaluation in executor does not finish within `timeout`, waiting for shared limiter
+        included
+
+    Notes
+    -----
+    Evaluations in executors from all callers on same event loop share one limiter, see
+    `submit_evaluation`.
+    """
+    if inline:
+        return evaluation()
+
+    return await asyncio.wait_for(submit_evaluation(evaluation, executor), timeout)
+
+
+@pydantic.validate_call(validate_return=True)
+async def solve_simplification_async(
+    expression: str,
+    executor: pydantic.InstanceOf[concurrent.futures.Executor] | None = None,
+    timeout: pydantic.PositiveFloat | None = None,
+    validate: bool = True,
+) -> float:
+    """Evaluate arithmetic expression without blocking event loop on large inputs.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    executor : concurrent.futures.Executor | None, optional
+        executor for evaluation, by default executor of event loop for long expressions
+    timeout : float | None, optional
+        seconds to wait for evaluation in executor, by default no limit
+    validate : bool, optional
+        whether to validate every intermediate operation, by default True
+
+    Returns
+    -------
+    float
+        result of arithmetic expression
+
+    Raises
+    ------
+    asyncio.TimeoutError
+        if evaluation does not finish within `timeout`, which is `TimeoutError` from Python
+        3.11
+
+    Notes
+    -----
+    #. Without `executor`, expressions up to 256 characters are evaluated on event loop, as
+       handing them to a thread costs more than evaluating them.
+    #. Cancellation and timeouts stop waiting at once, but an evaluation already running in a
+       thread finishes in background and its result is discarded.
+    #. At most `MAXIMUM_EXECUTOR_SUBMISSIONS` evaluations per event loop run in executors at
+       once, across all callers, and others wait for their turn.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> import asyncio
+        >>> from package_name_to_import_with.async_module import solve_simplification_async
+        >>> asyncio.run(solve_simplification_async("5 * 6 / (7 + 8) - 9"))
+        -7.0
+    """
+    return await run_evaluation(
+        functools.partial(solve_simplification, expression, validate=validate),
+        inline=executor is None and len(expression) <= INLINE_EXPRESSION_LENGTH,
+        executor=executor,
+        timeout=timeout,
+    )
+
+
+async def evaluate_expression_async(
+    expression: str,
+    executor: concurrent.futures.Executor | None = None,
+    timeout: float | None = None,
+    validate: bool = False,
+) -> EvaluationRecord:
+    """Evaluate one arithmetic expression, capturing failure and timeout in a record.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    executor : concurrent.futures.Executor | None, optional
+        executor for evaluation, by default executor of event loop for long expressions
+    timeout : float | None, optional
+        seconds to wait for evaluation in executor, by default no limit
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Returns
+    -------
+    EvaluationRecord
+        result or reason of failure of evaluation
+    """
+    try:
+        return await run_evaluation(
+            functools.partial(evaluate_expression, expression, validate=validate),
+            inline=executor is None and len(expression) <= INLINE_EXPRESSION_LENGTH,
+            executor=executor,
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        return EvaluationRecord(expression, None, f"Evaluation timed out after {timeout} seconds")
+
+
+@pydantic.validate_call
+async def solve_many_async_stream(
+    expressions: collections.abc.Iterable[str],
+    executor: pydantic.InstanceOf[concurrent.futures.Executor] | None = None,
+    maximum_in_flight: pydantic.PositiveInt = DEFAULT_MAXIMUM_IN_FLIGHT,
+    timeout: pydantic.PositiveFloat | None = None,
+    validate: bool = False,
+) -> collections.abc.AsyncIterator[EvaluationRecord]:
+    """Evaluate arithmetic expressions concurrently, yielding records in order.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[str]
+        standard arithmetic expressions, consumed only when there is room for more evaluations
+    executor : concurrent.futures.Executor | None, optional
+        executor for evaluations, by default executor of event loop for long expressions
+    maximum_in_flight : pydantic.PositiveInt, optional
+        maximum number of evaluations started but not yet yielded, by default 64
+    timeout : float | None, optional
+        seconds to wait for every evaluation in executor, by default no limit
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Yields
+    ------
+    EvaluationRecord
+        result or reason of failure of every expression, in order of `expressions`
+
+    Notes
+    -----
+    #. Failures and timeouts are reported in records and never stop the stream.
+    #. A slow consumer stops new evaluations from starting, so memory stays bounded.
+    #. Control returns to event loop between evaluations, also for inline evaluations.
+    #. Evaluations not yet yielded are cancelled if the stream is closed early.
+    """
+    pending_evaluations: collections.deque[asyncio.Task[EvaluationRecord]] = collections.deque()
+
+    try:
+        for expression in expressions:
+            pending_evaluations.append(
+                asyncio.ensure_future(
+                    evaluate_expression_async(
+                        expression, executor=executor, timeout=timeout, validate=validate
+                    )
+                )
+            )
+
+            if len(pending_evaluations) >= maximum_in_flight:
+                yield await pending_evaluations.popleft()
+            else:
+                await asyncio.sleep(0)
+
+        while pending_evaluations:
+            yield await pending_evaluations.popleft()
+    finally:
+        for pending_evaluation in pending_evaluations:
+            _ = pending_evaluation.cancel()
+
+
+@pydantic.validate_call(validate_return=True)
+async def solve_many_async(
+    expressions: collections.abc.Iterable[str],
+    executor: pydantic.InstanceOf[concurrent.futures.Executor] | None = None,
+    maximum_in_flight: pydantic.PositiveInt = DEFAULT_MAXIMUM_IN_FLIGHT,
+    timeout: pydantic.PositiveFloat | None = None,
+    validate: bool = False,
+) -> list[EvaluationRecord]:
+    """Evaluate arithmetic expressions concurrently.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[str]
+        standard arithmetic expressions
+    executor : concurrent.futures.Executor | None, optional
+        executor for evaluations, by default executor of event loop for long expressions
+    maximum_in_flight : pydantic.PositiveInt, optional
+        maximum number of evaluations running at once, by default 64
+    timeout : float | None, optional
+        seconds to wait for every evaluation in executor, by default no limit
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Returns
+    -------
+    list[EvaluationRecord]
+        result or reason of failure of every expression, in order of `expressions`
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> import asyncio
+        >>> from package_name_to_import_with.async_module import solve_many_async
+        >>> records = asyncio.run(solve_many_async(["1 + 2", "1 / 0"]))
+        >>> [(record.result, record.error) for record in records]
+        [(3.0, None), (None, 'Division by zero is attempted.')]
+    """
+    return [
+        record
+        async for record in solve_many_async_stream(
+            expressions,
+            executor=executor,
+            maximum_in_flight=maximum_in_flight,
+            timeout=timeout,
+            validate=validate,
+        )
+    ]
+
+
+__all__ = [
+    "DEFAULT_MAXIMUM_IN_FLIGHT",
+    "INLINE_EXPRESSION_LENGTH",
+    "MAXIMUM_EXECUTOR_SUBMISSIONS",
+    "SUBMISSION_LIMITERS",
+    "define_submission_limiter",
+    "evaluate_expression_async",
+    "run_evaluation",
+    "solve_many_async",
+    "solve_many_async_stream",
+    "solve_simplification_async",
+    "submit_evaluation",
+]
@@ -0,0 +1,380 @@
+"""Store parsed arithmetic expressions in compact array-backed bytecode."""
+
+import array
+import enum
+import struct
+import typing
+
+import pydantic
+
+from .calculator_sub_package import (
+    TRUSTED_BINARY_ARITHMETIC_OPERATIONS,
+    BinaryArithmeticOperation,
+    BinaryArithmeticOperator,
+)
+from .simplify import Variable, compile_expression
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+PostfixElement: typing.TypeAlias = BinaryArithmeticOperator | Variable | float
+
+BYTECODE_HEADER = struct.Struct("<4I")
+VARIABLE_NAME_SEPARATOR = "\0"
+
+
+@enum.unique
+class Opcode(enum.IntEnum):
+    """Define instructions of expression bytecode."""
+
+    PUSH_CONSTANT = 0
+    PUSH_VARIABLE = 1
+    ADDITION = 2
+    SUBTRACTION = 3
+    MULTIPLICATION = 4
+    DIVISION = 5
+
+
+OPERATOR_OPCODES: dict[BinaryArithmeticOperator, Opcode] = {
+    BinaryArithmeticOperator.ADDITION: Opcode.ADDITION,
+    BinaryArithmeticOperator.SUBTRACTION: Opcode.SUBTRACTION,
+    BinaryArithmeticOperator.MULTIPLICATION: Opcode.MULTIPLICATION,
+    BinaryArithmeticOperator.DIVISION: Opcode.DIVISION,
+}
+OPCODE_OPERATORS: dict[Opcode, BinaryArithmeticOperator] = {
+    opcode: operator for operator, opcode in OPERATOR_OPCODES.items()
+}
+OPCODE_OPERATIONS: dict[int, BinaryArithmeticOperation] = {
+    opcode: TRUSTED_BINARY_ARITHMETIC_OPERATIONS[operator]
+    for opcode, operator in OPCODE_OPERATORS.items()
+}
+
+
+class ExpressionBytecode:
+    """Store arithmetic expression in reverse Polish notation as typed arrays.
+
+    Parameters
+    ----------
+    opcodes : array.array[int]
+        instructions, one unsigned byte per element of postfix expression
+    constants : array.array[float]
+        numbers pushed by `Opcode.PUSH_CONSTANT`, as double precision floats in order of use
+    variable_indices : array.array[int]
+        positions in `variables` pushed by `Opcode.PUSH_VARIABLE`, in order of use
+    variables : tuple[str, ...]
+        sorted unique variable names
+
+    Notes
+    -----
+    #. Uses about one byte per operator and eight bytes per number, instead of a pointer to a
+       boxed object per element of a list.
+    #. Arrays must not be modified after construction, as hash depends on their contents.
+    #. Pickles into raw bytes of the arrays, so it is cheap to send to other processes.
+    """
+
+    __slots__ = ("constants", "opcodes", "variable_indices", "variables")
+
+    def __init__(
+        self: "ExpressionBytecode",
+        opcodes: "array.array[int]",
+        constants: "array.array[float]",
+        variable_indices: "array.array[int]",
+        variables: tuple[str, ...],
+    ) -> None:
+        self.opcodes = opcodes
+        self.constants = constants
+        self.variable_indices = variable_indices
+        self.variables = variables
+
+    @classmethod
+    def from_postfix_expression(
+        cls: type["ExpressionBytecode"],
+        postfix_expression: "collections.abc.Iterable[PostfixElement]",
+    ) -> "ExpressionBytecode":
+        """Encode postfix arithmetic expression into bytecode.
+
+        Parameters
+        ----------
+        postfix_expression : collections.abc.Iterable[PostfixElement]
+            elements of arithmetic expression in postfix format, as produced by
+            `convert_infix_expression`
+
+        Returns
+        -------
+        ExpressionBytecode
+            equivalent bytecode
+        """
+        opcodes = array.array("B")
+        constants = array.array("d")
+        variable_names: list[str] = []
+
+        for element in postfix_expression:
+            if isinstance(element, BinaryArithmeticOperator):
+                opcodes.append(OPERATOR_OPCODES[element])
+            elif isinstance(element, Variable):
+                opcodes.append(Opcode.PUSH_VARIABLE)
+                variable_names.append(element.name)
+            else:
+                opcodes.append(Opcode.PUSH_CONSTANT)
+                constants.append(element)
+
+        variables = tuple(sorted(set(variable_names)))
+        variable_positions = {variable: position for position, variable in enumerate(variables)}
+        variable_indices = array.array(
+            "H", [variable_positions[variable] for variable in variable_names]
+        )
+
+        return cls(opcodes, constants, variable_indices, variables)
+
+    def to_postfix_expression(self: "ExpressionBytecode") -> list[PostfixElement]:
+        """Decode bytecode into postfix arithmetic expression.
+
+        Returns
+        -------
+        list[PostfixElement]
+            elements of arithmetic expression in postfix format
+        """
+        constants = iter(self.constants)
+        variables = [Variable(name=variable) for variable in self.variables]
+        variable_indices = iter(self.variable_indices)
+
+        postfix_expression: list[PostfixElement] = []
+        for opcode in self.opcodes:
+            if opcode == Opcode.PUSH_CONSTANT:
+                postfix_expression.append(next(constants))
+            elif opcode == Opcode.PUSH_VARIABLE:
+                postfix_expression.append(variables[next(variable_indices)])
+            else:
+                postfix_expression.append(OPCODE_OPERATORS[Opcode(opcode)])
+
+        return postfix_expression
+
+    def evaluate(
+        self: "ExpressionBytecode", variable_values: dict[str, float] | None = None
+    ) -> float:
+        """Evaluate bytecode without validating every operation.
+
+        Parameters
+        ----------
+        variable_values : dict[str, float] | None, optional
+            numbers keyed by variable names, by default no variables
+
+        Returns
+        -------
+        float
+            result of arithmetic expression
+
+        Raises
+        ------
+        ValueError
+            if numbers are not provided for all variables
+        ValueError
+            if division by zero is attempted
+        """
+        variable_values = variable_values or {}
+        if missing_variables := set(self.variables).difference(variable_values):
+            raise ValueError(f"Missing values for variables: {missing_variables}")
+
+        variable_numbers = [float(variable_values[variable]) for variable in self.variables]
+        constants = iter(self.constants)
+        variable_indices = iter(self.variable_indices)
+        push_constant = Opcode.PUSH_CONSTANT.value
+        push_variable = Opcode.PUSH_VARIABLE.value
+
+        stack: list[float] = []
+        for opcode in self.opcodes:
+            if opcode == push_constant:
+                stack.append(next(constants))
+            elif opcode == push_variable:
+                stack.append(variable_numbers[next(variable_indices)])
+            else:
+                second_input = stack.pop()
+                stack[-1] = OPCODE_OPERATIONS[opcode](stack[-1], second_input)
+
+        return stack.pop()
+
+    @property
+    def nbytes(self: "ExpressionBytecode") -> int:
+        """Count bytes used by arrays of bytecode.
+
+        Returns
+        -------
+        int
+            combined size of opcodes, constants and variable indices
+        """
+        return sum(
+            values.itemsize * len(values)
+            for values in (self.opcodes, self.constants, self.variable_indices)
+        )
+
+    def to_bytes(self: "ExpressionBytecode") -> bytes:
+        """Serialise bytecode into a flat byte string.
+
+        Returns
+        -------
+        bytes
+            header of lengths followed by contents of arrays and variable names
+
+        Notes
+        -----
+        #. Arrays are stored in native byte order, so bytes are meant for same platform.
+        """
+        variable_names = VARIABLE_NAME_SEPARATOR.join(self.variables).encode("utf-8")
+
+        return b"".join(
+            [
+                BYTECODE_HEADER.pack(
+                    len(self.opcodes),
+                    len(self.constants),
+                    len(self.variable_indices),
+                    len(variable_names),
+                ),
+                self.opcodes.tobytes(),
+                self.constants.tobytes(),
+                self.variable_indices.tobytes(),
+                variable_names,
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls: type["ExpressionBytecode"], data: bytes) -> "ExpressionBytecode":
+        """Deserialise bytecode from a flat byte string.
+
+        Parameters
+        ----------
+        data : bytes
+            output of `to_bytes`
+
+        Returns
+        -------
+        ExpressionBytecode
+            restored bytecode
+        """
+        (
+            number_of_opcodes,
+            number_of_constants,
+            number_of_variable_indices,
+            length_of_variable_names,
+        ) = BYTECODE_HEADER.unpack_from(data)
+
+        opcodes = array.array("B")
+        constants = array.array("d")
+        variable_indices = array.array("H")
+
+        offset = BYTECODE_HEADER.size
+        for values, length in (
+            (opcodes, number_of_opcodes),
+            (constants, number_of_constants),
+            (variable_indices, number_of_variable_indices),
+        ):
+            values.frombytes(data[offset : offset + length * values.itemsize])
+            offset += length * values.itemsize
+
+        variable_names = data[offset : offset + length_of_variable_names].decode("utf-8")
+        variables = tuple(variable_names.split(VARIABLE_NAME_SEPARATOR)) if variable_names else ()
+
+        return cls(opcodes, constants, variable_indices, variables)
+
+    def __reduce__(
+        self: "ExpressionBytecode",
+    ) -> "tuple[collections.abc.Callable[[bytes], ExpressionBytecode], tuple[bytes]]":
+        """Support pickling through flat byte string.
+
+        Returns
+        -------
+        tuple[collections.abc.Callable[[bytes], ExpressionBytecode], tuple[bytes]]
+            constructor and its argument
+        """
+        return self.from_bytes, (self.to_bytes(),)
+
+    def __eq__(self: "ExpressionBytecode", other: object) -> bool:
+        """Compare contents of two bytecodes.
+
+        Parameters
+        ----------
+        other : object
+            object to compare with
+
+        Returns
+        -------
+        bool
+            whether `other` is bytecode with same instructions, numbers and variables
+        """
+        if not isinstance(other, ExpressionBytecode):
+            return NotImplemented
+
+        return self.to_bytes() == other.to_bytes()
+
+    def __hash__(self: "ExpressionBytecode") -> int:
+        """Hash contents of bytecode.
+
+        Returns
+        -------
+        int
+            hash of serialised bytecode
+        """
+        return hash(self.to_bytes())
+
+    def __repr__(self: "ExpressionBytecode") -> str:
+        """Create short representation with sizes of arrays.
+
+        Returns
+        -------
+        str
+            summary of bytecode
+        """
+        return (
+            f"{type(self).__name__}(opcodes={len(self.opcodes)}, "
+            f"constants={len(self.constants)}, variables={self.variables})"
+        )
+
+
+@pydantic.validate_call(validate_return=True)
+def compile_bytecode(
+    expression: str, allow_variables: bool = False, optimise: bool = True
+) -> pydantic.InstanceOf[ExpressionBytecode]:
+    """Parse arithmetic expression into compact bytecode.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    allow_variables : bool, optional
+        whether to accept named variables such as ``x`` or ``rate_2``, by default False
+    optimise : bool, optional
+        whether to fold constants and remove redundant operations, by default True
+
+    Returns
+    -------
+    ExpressionBytecode
+        expression in reverse Polish notation, stored in typed arrays
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.bytecode_module import compile_bytecode
+        >>> bytecode = compile_bytecode("x * (y + 2)", allow_variables=True)
+        >>> bytecode
+        ExpressionBytecode(opcodes=5, constants=1, variables=('x', 'y'))
+        >>> bytecode.evaluate({"x": 3, "y": 4})
+        18.0
+    """
+    compiled_expression = compile_expression(
+        expression, allow_variables=allow_variables, optimise=optimise
+    )
+
+    return ExpressionBytecode.from_postfix_expression(compiled_expression.postfix_expression)
+
+
+__all__ = [
+    "BYTECODE_HEADER",
+    "OPCODE_OPERATIONS",
+    "OPCODE_OPERATORS",
+    "OPERATOR_OPCODES",
+    "VARIABLE_NAME_SEPARATOR",
+    "ExpressionBytecode",
+    "Opcode",
+    "PostfixElement",
+    "compile_bytecode",
+]
@@ -0,0 +1,200 @@
+"""Define bounded caches for repeated computations."""
+
+import collections
+import collections.abc
+import enum
+import threading
+import typing
+
+import pydantic
+
+from .utils import CustomPydanticBaseModel, CustomStrEnum
+
+CachedValue = typing.TypeVar("CachedValue")
+
+
+@enum.unique
+class EvictionPolicy(CustomStrEnum):
+    """Define supported strategies to discard entries from a full cache."""
+
+    LEAST_RECENTLY_USED = "lru"
+    FIRST_IN_FIRST_OUT = "fifo"
+
+
+class CacheStatistics(CustomPydanticBaseModel):
+    """Define usage counters of a cache.
+
+    Attributes
+    ----------
+    hits : int
+        number of lookups answered from cache
+    misses : int
+        number of lookups that required computation
+    evictions : int
+        number of entries discarded to respect maximum size
+    size : int
+        number of entries currently stored
+    maximum_size : int
+        maximum number of entries that can be stored
+    """
+
+    hits: int = pydantic.Field(description="number of lookups answered from cache", ge=0)
+    misses: int = pydantic.Field(description="number of lookups that required computation", ge=0)
+    evictions: int = pydantic.Field(
+        description="number of entries discarded to respect maximum size", ge=0
+    )
+    size: int = pydantic.Field(description="number of entries currently stored", ge=0)
+    maximum_size: int = pydantic.Field(
+        description="maximum number of entries that can be stored", gt=0
+    )
+
+    @pydantic.computed_field  # type: ignore[misc] # will allow serialisation
+    @property  # will be computed every time it is called
+    def hit_ratio(self: "CacheStatistics") -> float:
+        """Store fraction of lookups answered from cache.
+
+        Returns
+        -------
+        float
+            ratio of hits to total lookups, zero if there were no lookups
+        """
+        if not (total_lookups := self.hits + self.misses):
+            return 0.0
+
+        return self.hits / total_lookups
+
+
+class BoundedCache(typing.Generic[CachedValue]):
+    """Store a bounded number of computed values keyed by strings.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        maximum number of entries that can be stored, by default 1024
+    eviction_policy : EvictionPolicy, optional
+        strategy to discard entries from a full cache, by default least recently used
+
+    Raises
+    ------
+    ValueError
+        if `maximum_size` is not positive
+
+    Notes
+    -----
+    #. Lookups and updates are guarded by a lock, so one cache can be shared between threads.
+    #. Computations run outside the lock, so concurrent misses for same key may compute twice.
+    #. Failed computations are not stored.
+    """
+
+    def __init__(
+        self: "BoundedCache[CachedValue]",
+        maximum_size: int = 1024,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LEAST_RECENTLY_USED,
+    ) -> None:
+        if maximum_size < 1:
+            raise ValueError(f"Cache size must be positive: {maximum_size}")
+
+        self.maximum_size = maximum_size
+        self.eviction_policy = EvictionPolicy(eviction_policy)
+
+        self._entries: collections.OrderedDict[str, CachedValue] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self: "BoundedCache[CachedValue]") -> int:
+        """Count stored entries.
+
+        Returns
+        -------
+        int
+            number of entries currently stored
+        """
+        return len(self._entries)
+
+    def __contains__(self: "BoundedCache[CachedValue]", key: object) -> bool:
+        """Check presence of an entry without affecting counters or eviction order.
+
+        Parameters
+        ----------
+        key : object
+            key to look for
+
+        Returns
+        -------
+        bool
+            whether `key` is stored
+        """
+        return key in self._entries
+
+    @property
+    def statistics(self: "BoundedCache[CachedValue]") -> CacheStatistics:
+        """Capture current usage counters.
+
+        Returns
+        -------
+        CacheStatistics
+            snapshot of hits, misses, evictions and size
+        """
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maximum_size=self.maximum_size,
+            )
+
+    def get_or_compute(
+        self: "BoundedCache[CachedValue]",
+        key: str,
+        computation: collections.abc.Callable[[str], CachedValue],
+    ) -> CachedValue:
+        """Return stored value for a key, computing and storing it if absent.
+
+        Parameters
+        ----------
+        key : str
+            identifier of the value
+        computation : collections.abc.Callable[[str], CachedValue]
+            function to compute value from `key` on cache miss
+
+        Returns
+        -------
+        CachedValue
+            stored or freshly computed value
+        """
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+
+                if self.eviction_policy is EvictionPolicy.LEAST_RECENTLY_USED:
+                    self._entries.move_to_end(key)
+
+                return self._entries[key]
+
+            self._misses += 1
+
+        value = computation(key)
+
+        with self._lock:
+            if key not in self._entries:
+                while len(self._entries) >= self.maximum_size:
+                    _ = self._entries.popitem(last=False)
+                    self._evictions += 1
+
+            self._entries[key] = value
+
+        return value
+
+    def clear(self: "BoundedCache[CachedValue]") -> None:
+        """Discard all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+__all__ = ["BoundedCache", "CacheStatistics", "EvictionPolicy"]
@@ -3,6 +3,7 @@
 import collections.abc
 import enum
 import functools
+import operator
 import typing
 
 import pydantic
@@ -31,6 +32,44 @@ class BinaryArithmeticOperator(CustomStrEnum):
 }
 
 
+def divide_trusted_numbers(dividend: float, divisor: float) -> float:
+    """Perform division of two real numbers without validation.
+
+    Parameters
+    ----------
+    dividend : float
+        number which is divided
+    divisor : float
+        number which divides
+
+    Returns
+    -------
+    float
+        quotient of `dividend` by `divisor`
+
+    Raises
+    ------
+    ValueError
+        if division by zero is attempted
+
+    Notes
+    -----
+    #. Multiplies by reciprocal like `divide_numbers`, so that results match exactly.
+    """
+    if not divisor:
+        raise ValueError("Division by zero is attempted.")
+
+    return dividend * (1.0 / divisor)
+
+
+TRUSTED_BINARY_ARITHMETIC_OPERATIONS: dict[BinaryArithmeticOperator, BinaryArithmeticOperation] = {
+    BinaryArithmeticOperator.ADDITION: operator.add,
+    BinaryArithmeticOperator.SUBTRACTION: operator.sub,
+    BinaryArithmeticOperator.MULTIPLICATION: operator.mul,
+    BinaryArithmeticOperator.DIVISION: divide_trusted_numbers,
+}
+
+
 class BinaryArithmeticExpression(CustomPydanticBaseModel):
     """Define binary arithmetic expression.
 
@@ -102,6 +141,297 @@ def result(self: "BinaryArithmeticExpression") -> float:
         return self.operation(self.left_operand, self.right_operand)
 
 
+@functools.cache
+def define_binary_arithmetic_expressions_adapter() -> (
+    pydantic.TypeAdapter[list[BinaryArithmeticExpression]]
+):
+    """Build validator of lists of binary arithmetic expressions once per process.
+
+    Returns
+    -------
+    pydantic.TypeAdapter[list[BinaryArithmeticExpression]]
+        validator shared between calls
+    """
+    return pydantic.TypeAdapter(list[BinaryArithmeticExpression])
+
+
+def store_trusted_results(
+    arithmetic_expressions: list[BinaryArithmeticExpression],
+) -> list[BinaryArithmeticExpression]:
+    """Compute results of validated binary arithmetic expressions without validating again.
+
+    Parameters
+    ----------
+    arithmetic_expressions : list[BinaryArithmeticExpression]
+        validated binary arithmetic expressions
+
+    Returns
+    -------
+    list[BinaryArithmeticExpression]
+        same binary arithmetic expressions, with `result` already cached
+
+    Notes
+    -----
+    Results are stored where `functools.cached_property` stores them on first access, and
+    `TRUSTED_BINARY_ARITHMETIC_OPERATIONS` match `BINARY_ARITHMETIC_OPERATIONS` exactly.
+    """
+    for arithmetic_expression in arithmetic_expressions:
+        arithmetic_expression.__dict__["result"] = TRUSTED_BINARY_ARITHMETIC_OPERATIONS[
+            arithmetic_expression.binary_operator
+        ](arithmetic_expression.left_operand, arithmetic_expression.right_operand)
+
+    return arithmetic_expressions
+
+
+def validate_binary_arithmetic_expressions(
+    expressions: collections.abc.Iterable[typing.Any], compute_results: bool = True
+) -> list[BinaryArithmeticExpression]:
+    """Validate many binary arithmetic expressions in one call.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[typing.Any]
+        mappings of fields, or instances, of binary arithmetic expressions
+    compute_results : bool, optional
+        whether to compute all results at once, skipping validation of basic operations on
+        already validated operands, by default True
+
+    Returns
+    -------
+    list[BinaryArithmeticExpression]
+        validated binary arithmetic expressions, in same order
+
+    Raises
+    ------
+    pydantic.ValidationError
+        if any expression is invalid, locating every failure by its position
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.calculator_sub_package import (
+        ...     validate_binary_arithmetic_expressions,
+        ... )
+        >>> arithmetic_expressions = validate_binary_arithmetic_expressions(
+        ...     [
+        ...         {"left_operand": 1, "binary_operator": "+", "right_operand": 2},
+        ...         {"left_operand": 1, "binary_operator": "/", "right_operand": 4},
+        ...     ]
+        ... )
+        >>> [arithmetic_expression.result for arithmetic_expression in arithmetic_expressions]
+        [3.0, 0.25]
+    """
+    arithmetic_expressions = define_binary_arithmetic_expressions_adapter().validate_python(
+        expressions if isinstance(expressions, list) else list(expressions)
+    )
+
+    if compute_results:
+        return store_trusted_results(arithmetic_expressions)
+
+    return arithmetic_expressions
+
+
+def validate_binary_arithmetic_expressions_json(
+    data: str | bytes, compute_results: bool = True
+) -> list[BinaryArithmeticExpression]:
+    """Parse and validate a JSON array of binary arithmetic expressions in one call.
+
+    Parameters
+    ----------
+    data : str | bytes
+        JSON array of objects with fields of binary arithmetic expressions
+    compute_results : bool, optional
+        whether to compute all results at once, skipping validation of basic operations on
+        already validated operands, by default True
+
+    Returns
+    -------
+    list[BinaryArithmeticExpression]
+        validated binary arithmetic expressions, in same order
+
+    Raises
+    ------
+    pydantic.ValidationError
+        if JSON is malformed or any expression is invalid
+    """
+    arithmetic_expressions = define_binary_arithmetic_expressions_adapter().validate_json(data)
+
+    if compute_results:
+        return store_trusted_results(arithmetic_expressions)
+
+    return arithmetic_expressions
+
+
+class BinaryArithmeticRecord:
+    """Define binary arithmetic expression from a trusted producer, without validation.
+
+    Attributes
+    ----------
+    left_operand : float
+        first number of binary arithmetic expression
+    binary_operator : BinaryArithmeticOperator
+        arithmetic operator of binary arithmetic expression
+    right_operand : float
+        second number of binary arithmetic expression
+    operation : BinaryArithmeticOperation
+        function to perform arithmetic operation corresponding to `binary_operator`
+    result : float
+        result of binary arithmetic expression
+
+    Notes
+    -----
+    #. Fields are stored as provided, so operands must already be floats and operator a
+       `BinaryArithmeticOperator`.
+    #. Result is computed on first access with `TRUSTED_BINARY_ARITHMETIC_OPERATIONS`, which
+       match `BINARY_ARITHMETIC_OPERATIONS` exactly, and division by zero only fails then.
+    #. `model_dump` gives same fields, including computed ones, as for
+       `BinaryArithmeticExpression`.
+    """
+
+    __slots__ = ("_result", "binary_operator", "left_operand", "right_operand")
+
+    def __init__(
+        self: "BinaryArithmeticRecord",
+        left_operand: float,
+        binary_operator: BinaryArithmeticOperator,
+        right_operand: float,
+    ) -> None:
+        self.left_operand = left_operand
+        self.binary_operator = binary_operator
+        self.right_operand = right_operand
+        self._result: float | None = None
+
+    @classmethod
+    def from_expression(
+        cls: type["BinaryArithmeticRecord"], arithmetic_expression: BinaryArithmeticExpression
+    ) -> "BinaryArithmeticRecord":
+        """Copy fields of a validated binary arithmetic expression.
+
+        Parameters
+        ----------
+        arithmetic_expression : BinaryArithmeticExpression
+            validated binary arithmetic expression
+
+        Returns
+        -------
+        BinaryArithmeticRecord
+            record with same fields
+        """
+        return cls(
+            arithmetic_expression.left_operand,
+            arithmetic_expression.binary_operator,
+            arithmetic_expression.right_operand,
+        )
+
+    @property
+    def operation(self: "BinaryArithmeticRecord") -> BinaryArithmeticOperation:
+        """Store implementation of binary arithmetic operation.
+
+        Returns
+        -------
+        BinaryArithmeticOperation
+            implementation of binary arithmetic operation corresponding to `binary_operator`
+        """
+        return BINARY_ARITHMETIC_OPERATIONS[self.binary_operator]
+
+    @property
+    def result(self: "BinaryArithmeticRecord") -> float:
+        """Store result of binary arithmetic expression.
+
+        Returns
+        -------
+        float
+            result of binary arithmetic expression
+
+        Raises
+        ------
+        ValueError
+            if division by zero is attempted
+        """
+        if self._result is None:
+            self._result = TRUSTED_BINARY_ARITHMETIC_OPERATIONS[self.binary_operator](
+                self.left_operand, self.right_operand
+            )
+
+        return self._result
+
+    def to_expression(self: "BinaryArithmeticRecord") -> BinaryArithmeticExpression:
+        """Validate record into a binary arithmetic expression.
+
+        Returns
+        -------
+        BinaryArithmeticExpression
+            validated binary arithmetic expression with same fields
+        """
+        return BinaryArithmeticExpression(
+            left_operand=self.left_operand,
+            binary_operator=self.binary_operator,
+            right_operand=self.right_operand,
+        )
+
+    def model_dump(self: "BinaryArithmeticRecord") -> dict[str, typing.Any]:
+        """Serialise fields like `BinaryArithmeticExpression.model_dump`.
+
+        Returns
+        -------
+        dict[str, typing.Any]
+            fields and computed fields keyed by their names
+        """
+        return {
+            "left_operand": self.left_operand,
+            "binary_operator": self.binary_operator,
+            "right_operand": self.right_operand,
+            "operation": self.operation,
+            "result": self.result,
+        }
+
+    def __eq__(self: "BinaryArithmeticRecord", other: object) -> bool:
+        """Compare fields with another record.
+
+        Parameters
+        ----------
+        other : object
+            object to compare with
+
+        Returns
+        -------
+        bool
+            whether `other` is a record with same fields
+        """
+        if not isinstance(other, BinaryArithmeticRecord):
+            return NotImplemented
+
+        return (self.left_operand, self.binary_operator, self.right_operand) == (
+            other.left_operand,
+            other.binary_operator,
+            other.right_operand,
+        )
+
+    def __hash__(self: "BinaryArithmeticRecord") -> int:
+        """Hash fields of record.
+
+        Returns
+        -------
+        int
+            hash of operands and operator
+        """
+        return hash((self.left_operand, self.binary_operator, self.right_operand))
+
+    def __repr__(self: "BinaryArithmeticRecord") -> str:
+        """Describe fields of record.
+
+        Returns
+        -------
+        str
+            class name with operands and operator
+        """
+        return (
+            f"{type(self).__name__}(left_operand={self.left_operand!r}, "
+            f"binary_operator={self.binary_operator!r}, right_operand={self.right_operand!r})"
+        )
+
+
 @pydantic.validate_call(validate_return=True)
 def calculate_results(
     first_input: float, operator: BinaryArithmeticOperator, second_input: float
@@ -145,8 +475,15 @@ def calculate_results(
 
 __all__ = [
     "BINARY_ARITHMETIC_OPERATIONS",
+    "TRUSTED_BINARY_ARITHMETIC_OPERATIONS",
     "BinaryArithmeticExpression",
     "BinaryArithmeticOperation",
     "BinaryArithmeticOperator",
+    "BinaryArithmeticRecord",
     "calculate_results",
+    "define_binary_arithmetic_expressions_adapter",
+    "divide_trusted_numbers",
+    "store_trusted_results",
+    "validate_binary_arithmetic_expressions",
+    "validate_binary_arithmetic_expressions_json",
 ]
@@ -0,0 +1,263 @@
+"""Generate Python functions evaluating parsed arithmetic expressions with inlined arithmetic."""
+
+import collections.abc
+import keyword
+import math
+import typing
+
+import pydantic
+
+from .calculator_sub_package import BinaryArithmeticOperator
+from .simplify import Variable, compile_expression
+
+PostfixElement: typing.TypeAlias = BinaryArithmeticOperator | Variable | float
+GeneratedFunction: typing.TypeAlias = collections.abc.Callable[..., float]
+
+GENERATED_FUNCTION_NAME = "generated_expression"
+STACK_SLOT_PREFIX = "stack_"
+ZERO_DIVISION_MESSAGE = "Division by zero is attempted."
+MALFORMED_POSTFIX_MESSAGE = "Malformed postfix expression"
+INDENTATION = "    "
+
+OPERATOR_TEMPLATES: dict[BinaryArithmeticOperator, str] = {
+    BinaryArithmeticOperator.ADDITION: "{} + {}",
+    BinaryArithmeticOperator.SUBTRACTION: "{} - {}",
+    BinaryArithmeticOperator.MULTIPLICATION: "{} * {}",
+    BinaryArithmeticOperator.DIVISION: "{} * (1.0 / {})",
+}
+GENERATED_FUNCTION_BUILTINS = {
+    "ValueError": ValueError,
+    "ZeroDivisionError": ZeroDivisionError,
+    "float": float,
+}
+
+
+def format_constant(constant: float) -> str:
+    """Write number as Python source evaluating to same float.
+
+    Parameters
+    ----------
+    constant : float
+        number in arithmetic expression
+
+    Returns
+    -------
+    str
+        float literal, or call of `float` for infinities and NaN
+    """
+    constant = float(constant)
+
+    return repr(constant) if math.isfinite(constant) else f'float("{constant!r}")'
+
+
+def define_parameter_names(variables: collections.abc.Sequence[str]) -> list[str]:
+    """Name parameters of generated function after variables where possible.
+
+    Parameters
+    ----------
+    variables : collections.abc.Sequence[str]
+        sorted names of variables in arithmetic expression
+
+    Returns
+    -------
+    list[str]
+        variable names, except keywords and names reserved for stack slots, which are
+        replaced by positional names
+    """
+    return [
+        (
+            variable
+            if not keyword.iskeyword(variable)
+            and not variable.startswith(STACK_SLOT_PREFIX)
+            and variable not in GENERATED_FUNCTION_BUILTINS
+            else f"{STACK_SLOT_PREFIX}parameter_{position}"
+        )
+        for position, variable in enumerate(variables)
+    ]
+
+
+def generate_source(
+    postfix_expression: collections.abc.Iterable[PostfixElement],
+    variables: collections.abc.Sequence[str] = (),
+) -> str:
+    """Translate postfix arithmetic expression into source of a Python function.
+
+    Parameters
+    ----------
+    postfix_expression : collections.abc.Iterable[PostfixElement]
+        elements of arithmetic expression in postfix format
+    variables : collections.abc.Sequence[str], optional
+        names of variables, in order of positional parameters, by default no variables
+
+    Returns
+    -------
+    str
+        definition of function named `GENERATED_FUNCTION_NAME`
+
+    Raises
+    ------
+    ValueError
+        if an operator lacks operands, or operands are left over
+
+    Notes
+    -----
+    #. Every operation becomes one assignment to a local variable per stack position, so
+       source is never nested deeper than one operation, however long the expression is.
+    #. Divisions multiply by reciprocals and zero divisors raise `ValueError`, exactly as in
+       `evaluate_trusted_postfix_expression`.
+    #. Source only contains float literals, operators and validated variable names.
+    """
+    parameter_names = define_parameter_names(variables)
+    parameters_by_variable = dict(zip(variables, parameter_names, strict=True))
+
+    operands: list[str] = []
+    statements: list[str] = []
+    for element in postfix_expression:
+        if isinstance(element, BinaryArithmeticOperator):
+            try:
+                second_operand = operands.pop()
+                first_operand = operands.pop()
+            except IndexError as error:
+                raise ValueError(
+                    f"{MALFORMED_POSTFIX_MESSAGE}: {element} lacks operands"
+                ) from error
+
+            stack_slot = f"{STACK_SLOT_PREFIX}{len(operands)}"
+
+            statements.append(
+                f"{stack_slot} = "
+                + OPERATOR_TEMPLATES[element].format(first_operand, second_operand)
+            )
+            operands.append(stack_slot)
+        elif isinstance(element, Variable):
+            operands.append(parameters_by_variable[element.name])
+        else:
+            operands.append(format_constant(element))
+
+    if len(operands) != 1:
+        raise ValueError(
+            f"{MALFORMED_POSTFIX_MESSAGE}: {len(operands)} operands remain instead of one"
+        )
+
+    (result,) = operands
+    statements.append(f"return {result}")
+
+    signature = ", ".join([*parameter_names, "/"]) if parameter_names else ""
+    conversions = [f"{parameter} = float({parameter})" for parameter in parameter_names]
+    body = "\n".join(f"{INDENTATION * 2}{statement}" for statement in statements)
+
+    return "\n".join(
+        [
+            f"def {GENERATED_FUNCTION_NAME}({signature}):",
+            *(f"{INDENTATION}{conversion}" for conversion in conversions),
+            f"{INDENTATION}try:",
+            body,
+            f"{INDENTATION}except ZeroDivisionError:",
+            f"{INDENTATION * 2}raise ValueError({ZERO_DIVISION_MESSAGE!r}) from None",
+            "",
+        ]
+    )
+
+
+def compile_function(
+    postfix_expression: collections.abc.Iterable[PostfixElement],
+    variables: collections.abc.Sequence[str] = (),
+    expression: str | None = None,
+) -> GeneratedFunction:
+    """Compile postfix arithmetic expression into a Python function.
+
+    Parameters
+    ----------
+    postfix_expression : collections.abc.Iterable[PostfixElement]
+        elements of arithmetic expression in postfix format
+    variables : collections.abc.Sequence[str], optional
+        names of variables, in order of positional parameters, by default no variables
+    expression : str | None, optional
+        standard arithmetic expression, used as docstring and in tracebacks
+
+    Returns
+    -------
+    GeneratedFunction
+        function taking numbers of variables as positional arguments
+    """
+    source = generate_source(postfix_expression, variables)
+    namespace: dict[str, typing.Any] = {"__builtins__": GENERATED_FUNCTION_BUILTINS}
+
+    exec(  # noqa: S102 # nosec B102 # source only contains numbers, operators and identifiers
+        compile(source, f"<expression {expression or GENERATED_FUNCTION_NAME}>", "exec"),
+        namespace,
+    )
+
+    generated_function: GeneratedFunction = namespace[GENERATED_FUNCTION_NAME]
+    generated_function.__doc__ = expression
+
+    return generated_function
+
+
+@pydantic.validate_call(validate_return=True)
+def generate_function(
+    expression: str, allow_variables: bool = False, optimise: bool = True
+) -> GeneratedFunction:
+    """Parse arithmetic expression into a Python function with inlined float arithmetic.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    allow_variables : bool, optional
+        whether to accept named variables such as ``x`` or ``rate_2``, by default False
+    optimise : bool, optional
+        whether to fold constants and remove redundant operations, by default True
+
+    Returns
+    -------
+    GeneratedFunction
+        function taking numbers of variables as positional arguments, in sorted order of
+        variable names as in `CompiledExpression.variables`
+
+    Raises
+    ------
+    ValueError
+        if generated function attempts division by zero
+
+    Notes
+    -----
+    #. Results match `CompiledExpression.evaluate` with ``validate=False``.
+    #. Parsing and compilation are costly, so generate once and call many times.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.codegen_module import generate_function
+        >>> generated_function = generate_function("x * (y + 2)", allow_variables=True)
+        >>> generated_function(3, 4)
+        18.0
+        >>> generate_function("5 * 6 / (7 + 8) - 9")()
+        -7.0
+    """
+    compiled_expression = compile_expression(
+        expression, allow_variables=allow_variables, optimise=optimise
+    )
+
+    return compile_function(
+        compiled_expression.postfix_expression, compiled_expression.variables, expression
+    )
+
+
+__all__ = [
+    "GENERATED_FUNCTION_BUILTINS",
+    "GENERATED_FUNCTION_NAME",
+    "INDENTATION",
+    "MALFORMED_POSTFIX_MESSAGE",
+    "OPERATOR_TEMPLATES",
+    "STACK_SLOT_PREFIX",
+    "ZERO_DIVISION_MESSAGE",
+    "GeneratedFunction",
+    "PostfixElement",
+    "compile_function",
+    "define_parameter_names",
+    "format_constant",
+    "generate_function",
+    "generate_source",
+]
@@ -1,8 +1,12 @@
-"""Define package contents."""
+"""Define package contents.
 
+Contents of ``metadata.json`` are read and validated on first access to `METADATA`.
+"""
+
+import functools
 import importlib.resources
-import json
 import re
+import typing
 
 import pydantic
 
@@ -79,7 +83,60 @@ def validate_version(cls: type["PackageMetadata"], version: str) -> str:
         return version
 
 
-METADATA_CONTENTS: str = (
-    importlib.resources.files("package_name_to_import_with").joinpath("metadata.json").read_text()
-)
-METADATA = PackageMetadata(**json.loads(METADATA_CONTENTS))
+@functools.cache
+def read_metadata_contents() -> str:
+    """Read package metadata file once per process.
+
+    Returns
+    -------
+    str
+        contents of ``metadata.json``
+    """
+    return (
+        importlib.resources.files("package_name_to_import_with")
+        .joinpath("metadata.json")
+        .read_text()
+    )
+
+
+@functools.cache
+def load_metadata() -> PackageMetadata:
+    """Validate package metadata once per process.
+
+    Returns
+    -------
+    PackageMetadata
+        validated package metadata, shared between calls
+    """
+    return PackageMetadata.model_validate_json(read_metadata_contents())
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    """Read and validate package metadata on first access.
+
+    Parameters
+    ----------
+    name : str
+        name of requested attribute
+
+    Returns
+    -------
+    typing.Any
+        contents of ``metadata.json`` for `METADATA_CONTENTS`, validated metadata for `METADATA`
+
+    Raises
+    ------
+    AttributeError
+        if `name` is not defined in the module
+    """
+    match name:
+        case "METADATA_CONTENTS":
+            return read_metadata_contents()
+        case "METADATA":
+            return load_metadata()
+        case _:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+METADATA_CONTENTS: str
+METADATA: PackageMetadata
@@ -1,54 +1,525 @@
-"""Define top level decorator."""
+"""Define top level decorator and policies of garbage collection after decorated calls."""
 
 import collections.abc
+import contextlib
 import functools
 import gc
+import threading
+import time
 import typing
 
 import pydantic
 
+from .utils import CustomPydanticBaseModel
+
 FunctionType: typing.TypeAlias = collections.abc.Callable[..., typing.Any]
 
+OLDEST_GENERATION = 2
 
-@pydantic.validate_call(validate_return=True)
-def define_garbage_collection_decorator(
-    function_to_be_decorated: FunctionType,
-) -> FunctionType:  # pragma: no cover
-    """Perform forcefully garbage collection after execution of provided function.
+GarbageCollectionThresholds: typing.TypeAlias = tuple[int, int, int]
+
+
+class GarbageCollectionPolicy(CustomPydanticBaseModel):
+    """Define when and how garbage is collected after decorated calls.
+
+    Attributes
+    ----------
+    generation : int
+        oldest generation to collect, collecting all generations by default
+    every_n_calls : int
+        number of calls between collections, collecting after every call by default
+    allocation_threshold : int | None
+        minimum number of objects allocated and not freed since last collection of youngest
+        generation for a collection to happen, not checked by default
+    freeze : bool
+        whether to move objects surviving a collection to permanent generation, so that later
+        collections skip them, not done by default
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    generation: int = pydantic.Field(
+        default=OLDEST_GENERATION,
+        description="oldest generation to collect",
+        ge=0,
+        le=OLDEST_GENERATION,
+    )
+    every_n_calls: int = pydantic.Field(
+        default=1, description="number of calls between collections", gt=0
+    )
+    allocation_threshold: int | None = pydantic.Field(
+        default=None,
+        description="minimum number of surviving allocations for a collection to happen",
+        ge=0,
+    )
+    freeze: bool = pydantic.Field(
+        default=False, description="whether to move surviving objects to permanent generation"
+    )
+
+
+class GarbageCollectionStatistics(CustomPydanticBaseModel):
+    """Define usage counters of garbage collection after decorated calls.
+
+    Attributes
+    ----------
+    calls : int
+        number of completed decorated calls
+    collections : int
+        number of collections performed
+    collected_objects : int
+        number of unreachable objects found by collections
+    seconds : float
+        wall time spent in collections
+    """
+
+    calls: int = pydantic.Field(description="number of completed decorated calls", ge=0)
+    collections: int = pydantic.Field(description="number of collections performed", ge=0)
+    collected_objects: int = pydantic.Field(
+        description="number of unreachable objects found by collections", ge=0
+    )
+    seconds: float = pydantic.Field(description="wall time spent in collections", ge=0)
+
+
+class GarbageCollector:
+    """Collect garbage after calls of decorated functions according to a policy.
 
     Parameters
     ----------
-    function_to_be_decorated : FunctionType
-        function whose execution may require forceful garbage collection
+    policy : GarbageCollectionPolicy | None, optional
+        when and how to collect, by default full collection after every call
 
-    Returns
-    -------
-    FunctionType
-        decorated function
+    Notes
+    -----
+    #. One collector may decorate several functions, they share calls and statistics.
+    #. Counters are guarded by a lock, collections run outside it.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.garbage_collection_module import (
+        ...     GarbageCollectionPolicy,
+        ...     GarbageCollector,
+        ... )
+        >>> garbage_collector = GarbageCollector(
+        ...     GarbageCollectionPolicy(generation=0, every_n_calls=10)
+        ... )
+        >>> square = garbage_collector.decorate(lambda number: number**2)
+        >>> [square(number) for number in range(25)][-1]
+        576
+        >>> statistics = garbage_collector.statistics
+        >>> statistics.calls, statistics.collections
+        (25, 2)
     """
 
-    @functools.wraps(function_to_be_decorated)
-    def wrapper_function(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:  # noqa: ANN401
-        """Execute provided function with forceful garbage collection afterwards.
+    def __init__(self: "GarbageCollector", policy: GarbageCollectionPolicy | None = None) -> None:
+        self.policy = policy or GarbageCollectionPolicy()
+
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._collections = 0
+        self._collected_objects = 0
+        self._seconds = 0.0
+
+    @property
+    def statistics(self: "GarbageCollector") -> GarbageCollectionStatistics:
+        """Capture current usage counters.
+
+        Returns
+        -------
+        GarbageCollectionStatistics
+            snapshot of calls, collections, collected objects and time spent
+        """
+        with self._lock:
+            return GarbageCollectionStatistics(
+                calls=self._calls,
+                collections=self._collections,
+                collected_objects=self._collected_objects,
+                seconds=self._seconds,
+            )
+
+    def after_call(self: "GarbageCollector") -> None:
+        """Count a completed call and collect garbage if policy requires it."""
+        with self._lock:
+            self._calls += 1
+            calls = self._calls
+
+        if calls % self.policy.every_n_calls:
+            return
+
+        if (
+            self.policy.allocation_threshold is not None
+            and gc.get_count()[0] < self.policy.allocation_threshold
+        ):
+            return
+
+        collection_start = time.perf_counter()
+        collected_objects = gc.collect(self.policy.generation)
+        collection_end = time.perf_counter()
+
+        if self.policy.freeze:
+            gc.freeze()
+
+        with self._lock:
+            self._collections += 1
+            self._collected_objects += collected_objects
+            self._seconds += collection_end - collection_start
+
+    def decorate(self: "GarbageCollector", function_to_be_decorated: FunctionType) -> FunctionType:
+        """Wrap function to collect garbage after its calls according to policy.
 
         Parameters
         ----------
-        *args : tuple
-            positional arguments for ``function_to_be_decorated``
-        **kwargs : dict
-            keyword arguments for ``function_to_be_decorated``
+        function_to_be_decorated : FunctionType
+            function whose execution may require garbage collection
 
         Returns
         -------
-        typing.Any
-            output of the provided function with provided arguments
+        FunctionType
+            decorated function
+        """
+
+        @functools.wraps(function_to_be_decorated)
+        def wrapper_function(
+            *args: typing.Any, **kwargs: typing.Any  # noqa: ANN401
+        ) -> typing.Any:  # noqa: ANN401
+            """Execute provided function with garbage collection afterwards.
+
+            Parameters
+            ----------
+            *args : tuple
+                positional arguments for ``function_to_be_decorated``
+            **kwargs : dict
+                keyword arguments for ``function_to_be_decorated``
+
+            Returns
+            -------
+            typing.Any
+                output of the provided function with provided arguments
+            """
+            result = function_to_be_decorated(*args, **kwargs)
+            self.after_call()
+
+            return result
+
+        return wrapper_function
+
+    def reset(self: "GarbageCollector") -> None:
+        """Reset counters, without unfreezing objects."""
+        with self._lock:
+            self._calls = 0
+            self._collections = 0
+            self._collected_objects = 0
+            self._seconds = 0.0
+
+
+class CollectionPauses(CustomPydanticBaseModel):
+    """Define measured pauses of garbage collections.
+
+    Attributes
+    ----------
+    collections : int
+        number of collections of any generation
+    collected_objects : int
+        number of unreachable objects found by collections
+    seconds : float
+        wall time spent in collections
+    """
+
+    collections: int = pydantic.Field(description="number of collections", ge=0)
+    collected_objects: int = pydantic.Field(
+        description="number of unreachable objects found by collections", ge=0
+    )
+    seconds: float = pydantic.Field(description="wall time spent in collections", ge=0)
+
+
+class CollectionPauseMonitor:
+    """Measure every garbage collection, including automatic ones, through `gc.callbacks`.
+
+    Notes
+    -----
+    #. Instances are callbacks, register them with `monitor_collection_pauses`.
+    #. Collections in all threads of current process are measured.
+    """
+
+    def __init__(self: "CollectionPauseMonitor") -> None:
+        self._collection_start: float | None = None
+        self._collections = 0
+        self._collected_objects = 0
+        self._seconds = 0.0
+
+    def __call__(self: "CollectionPauseMonitor", phase: str, info: dict[str, int]) -> None:
+        """Record start or end of a collection.
+
+        Parameters
+        ----------
+        phase : str
+            ``start`` before a collection, ``stop`` after it
+        info : dict[str, int]
+            details of collection from `gc`, including number of ``collected`` objects
         """
-        result = function_to_be_decorated(*args, **kwargs)
-        _ = gc.collect()
+        if phase == "start":
+            self._collection_start = time.perf_counter()
+        elif self._collection_start is not None:
+            self._collections += 1
+            self._collected_objects += info["collected"]
+            self._seconds += time.perf_counter() - self._collection_start
+            self._collection_start = None
 
-        return result
+    @property
+    def pauses(self: "CollectionPauseMonitor") -> CollectionPauses:
+        """Capture collections measured so far.
 
-    return wrapper_function
+        Returns
+        -------
+        CollectionPauses
+            snapshot of number, found objects and duration of collections
+        """
+        return CollectionPauses(
+            collections=self._collections,
+            collected_objects=self._collected_objects,
+            seconds=self._seconds,
+        )
+
+
+@contextlib.contextmanager
+def monitor_collection_pauses() -> collections.abc.Iterator[CollectionPauseMonitor]:
+    """Measure garbage collections within a block.
+
+    Yields
+    ------
+    CollectionPauseMonitor
+        monitor registered in `gc.callbacks` until end of block
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> import gc
+        >>> from package_name_to_import_with.garbage_collection_module import (
+        ...     monitor_collection_pauses,
+        ... )
+        >>> with monitor_collection_pauses() as monitor:
+        ...     _ = gc.collect()
+        >>> monitor.pauses.collections
+        1
+    """
+    monitor = CollectionPauseMonitor()
+    gc.callbacks.append(monitor)
+
+    try:
+        yield monitor
+    finally:
+        gc.callbacks.remove(monitor)
+
+
+class GarbageCollectionBatchReport(CustomPydanticBaseModel):
+    """Define pauses of garbage collection during and at end of a batch.
+
+    Attributes
+    ----------
+    automatic_pauses : CollectionPauses
+        collections that happened during batch, none if collection was disabled
+    final_collection : GarbageCollectionStatistics
+        single collection at end of batch, none if automatic collection was retuned instead
+    saved_seconds : float | None
+        wall time of collections of same workload without batch minus `pause_seconds`,
+        negative if batch took longer, None without measured baseline
+    """
+
+    automatic_pauses: CollectionPauses = pydantic.Field(
+        description="collections that happened during batch"
+    )
+    final_collection: GarbageCollectionStatistics = pydantic.Field(
+        description="single collection at end of batch"
+    )
+    saved_seconds: float | None = pydantic.Field(
+        default=None, description="wall time of collections saved compared with baseline"
+    )
+
+    @property  # will be computed every time it is called
+    def pause_seconds(self: "GarbageCollectionBatchReport") -> float:
+        """Compute total wall time of collections caused by batch.
+
+        Returns
+        -------
+        float
+            sum of automatic pauses and final collection
+        """
+        return self.automatic_pauses.seconds + self.final_collection.seconds
+
+    def format_summary(self: "GarbageCollectionBatchReport") -> str:
+        """Prepare single line summary of pauses.
+
+        Returns
+        -------
+        str
+            numbers and durations of collections, and time saved if it is known, terminated by
+            a newline
+        """
+        saving = "" if self.saved_seconds is None else f", saving {self.saved_seconds:.6f} seconds"
+
+        return (
+            f"Garbage collection: {self.automatic_pauses.collections} automatic collections "
+            f"took {self.automatic_pauses.seconds:.6f} seconds, final collection found "
+            f"{self.final_collection.collected_objects} objects in "
+            f"{self.final_collection.seconds:.6f} seconds{saving}\n"
+        )
+
+
+class GarbageCollectionBatch:
+    """Hold report of a batch evaluated with paused garbage collection.
+
+    Attributes
+    ----------
+    report : GarbageCollectionBatchReport | None
+        pauses of garbage collection, available after end of batch
+    """
+
+    def __init__(self: "GarbageCollectionBatch") -> None:
+        self.report: GarbageCollectionBatchReport | None = None
+
+
+@contextlib.contextmanager
+def pause_garbage_collection(
+    thresholds: GarbageCollectionThresholds | None = None,
+    final_generation: int = 0,
+    baseline: CollectionPauses | None = None,
+) -> collections.abc.Iterator[GarbageCollectionBatch]:
+    """Disable or retune automatic garbage collection for a batch, collecting once at end.
+
+    Parameters
+    ----------
+    thresholds : GarbageCollectionThresholds | None, optional
+        thresholds of three generations to use during batch, by default automatic garbage
+        collection is disabled
+    final_generation : int, optional
+        oldest generation to collect at end of batch, by default youngest generation, which
+        holds every object allocated while automatic garbage collection is disabled, unused
+        with `thresholds`
+    baseline : CollectionPauses | None, optional
+        pauses measured by `monitor_collection_pauses` around same workload without batch, by
+        default time saved is not reported
+
+    Yields
+    ------
+    GarbageCollectionBatch
+        holder of report, filled in at end of batch
+
+    Notes
+    -----
+    #. Previous state and thresholds of automatic garbage collection are restored at end.
+    #. With `thresholds`, automatic collection keeps running, so no collection is forced at end.
+    #. Garbage collection is global to a process, so other threads are affected as well.
+    #. Reference cycles created during batch stay in memory until its end.
+    #. Collecting only youngest generation at end avoids traversing all long-lived objects.
+    #. Time saved is only measured against `baseline`, as collections of a workload depend on
+       everything allocated before it.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.garbage_collection_module import (
+        ...     pause_garbage_collection,
+        ... )
+        >>> from package_name_to_import_with.streaming_module import solve_simplification_stream
+        >>> with pause_garbage_collection() as batch:
+        ...     records = list(solve_simplification_stream(["1 + 2"] * 1000))
+        >>> batch.report.automatic_pauses.collections, batch.report.final_collection.collections
+        (0, 1)
+    """
+    batch = GarbageCollectionBatch()
+    garbage_collector = GarbageCollector(GarbageCollectionPolicy(generation=final_generation))
+    was_enabled = gc.isenabled()
+    previous_thresholds = gc.get_threshold()
+
+    if thresholds is None:
+        gc.disable()
+    else:
+        gc.set_threshold(*thresholds)
+
+    try:
+        with monitor_collection_pauses() as monitor:
+            yield batch
+    finally:
+        gc.set_threshold(*previous_thresholds)
+        if was_enabled:
+            gc.enable()
+
+        if thresholds is None:
+            garbage_collector.after_call()
+
+        automatic_pauses, final_collection = monitor.pauses, garbage_collector.statistics
+
+        batch.report = GarbageCollectionBatchReport(
+            automatic_pauses=automatic_pauses,
+            final_collection=final_collection,
+            saved_seconds=(
+                None
+                if baseline is None
+                else baseline.seconds - automatic_pauses.seconds - final_collection.seconds
+            ),
+        )
+
+
+@pydantic.validate_call(validate_return=True)
+def define_garbage_collection_decorator(
+    function_to_be_decorated: FunctionType,
+    policy: GarbageCollectionPolicy | None = None,
+) -> FunctionType:
+    """Perform garbage collection after execution of provided function.
+
+    Parameters
+    ----------
+    function_to_be_decorated : FunctionType
+        function whose execution may require garbage collection
+    policy : GarbageCollectionPolicy | None, optional
+        when and how to collect, by default full collection after every call
+
+    Returns
+    -------
+    FunctionType
+        decorated function
+
+    Notes
+    -----
+    #. Use `GarbageCollector` directly to read statistics of collections.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.garbage_collection_module import (
+        ...     GarbageCollectionPolicy,
+        ...     define_garbage_collection_decorator,
+        ... )
+        >>> @define_garbage_collection_decorator
+        ... def add_one(number):
+        ...     return number + 1
+        >>> add_one(1)
+        2
+        >>> add_two = define_garbage_collection_decorator(
+        ...     lambda number: number + 2, policy=GarbageCollectionPolicy(every_n_calls=100)
+        ... )
+        >>> add_two(1)
+        3
+    """
+    return GarbageCollector(policy).decorate(function_to_be_decorated)
 
 
-__all__ = ["FunctionType", "define_garbage_collection_decorator"]
+__all__ = [
+    "OLDEST_GENERATION",
+    "CollectionPauseMonitor",
+    "CollectionPauses",
+    "FunctionType",
+    "GarbageCollectionBatch",
+    "GarbageCollectionBatchReport",
+    "GarbageCollectionPolicy",
+    "GarbageCollectionStatistics",
+    "GarbageCollectionThresholds",
+    "GarbageCollector",
+    "define_garbage_collection_decorator",
+    "monitor_collection_pauses",
+    "pause_garbage_collection",
+]
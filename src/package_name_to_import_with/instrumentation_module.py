@@ -0,0 +1,264 @@
+"""Report durations and sizes of stages of evaluation of arithmetic expressions."""
+
+import bisect
+import collections.abc
+import contextlib
+import enum
+import threading
+import typing
+
+from .utils import CustomStrEnum
+
+StageObserver: typing.TypeAlias = collections.abc.Callable[["StageTiming"], None]
+
+DEFAULT_DURATION_BUCKETS = (
+    0.000_01,
+    0.000_1,
+    0.001,
+    0.01,
+    0.1,
+    1.0,
+    10.0,
+)
+
+
+@enum.unique
+class Stage(CustomStrEnum):
+    """Define instrumented stages of evaluation of arithmetic expressions."""
+
+    TOKENISATION = "tokenisation"
+    CONVERSION = "conversion"
+    EVALUATION = "evaluation"
+
+
+class StageTiming(typing.NamedTuple):
+    """Define measurement of one stage of evaluation of an arithmetic expression.
+
+    Attributes
+    ----------
+    stage : Stage
+        measured stage
+    seconds : float
+        wall time spent in stage
+    size : int
+        number of tokens for tokenisation and conversion, number of operations for evaluation
+    """
+
+    stage: Stage
+    seconds: float
+    size: int
+
+
+STAGE_OBSERVERS: list[StageObserver] = []
+STAGE_OBSERVERS_LOCK = threading.Lock()
+
+
+def add_stage_observer(observer: StageObserver) -> None:
+    """Start reporting stage timings of every evaluation to a callback.
+
+    Parameters
+    ----------
+    observer : StageObserver
+        callback receiving one `StageTiming` per stage, called in evaluating thread
+
+    Notes
+    -----
+    #. Observers apply to evaluations in all threads of current process.
+    #. Exceptions raised by observers propagate to caller of evaluation.
+    """
+    with STAGE_OBSERVERS_LOCK:
+        STAGE_OBSERVERS.append(observer)
+
+
+def remove_stage_observer(observer: StageObserver) -> None:
+    """Stop reporting stage timings to a callback.
+
+    Parameters
+    ----------
+    observer : StageObserver
+        callback added by `add_stage_observer`
+
+    Raises
+    ------
+    ValueError
+        if `observer` was not added
+    """
+    with STAGE_OBSERVERS_LOCK:
+        STAGE_OBSERVERS.remove(observer)
+
+
+def report_stage_timing(stage_timing: StageTiming) -> None:
+    """Send stage timing to all current observers.
+
+    Parameters
+    ----------
+    stage_timing : StageTiming
+        measurement of one stage
+    """
+    for observer in tuple(STAGE_OBSERVERS):
+        observer(stage_timing)
+
+
+@contextlib.contextmanager
+def observe_stages(observer: StageObserver) -> collections.abc.Iterator[StageObserver]:
+    """Report stage timings to a callback within a block.
+
+    Parameters
+    ----------
+    observer : StageObserver
+        callback receiving one `StageTiming` per stage
+
+    Yields
+    ------
+    StageObserver
+        the callback itself
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.instrumentation_module import observe_stages
+        >>> from package_name_to_import_with.simplify import solve_simplification
+        >>> stage_timings = []
+        >>> with observe_stages(stage_timings.append):
+        ...     solve_simplification("1 + 2 * 3")
+        7.0
+        >>> [(stage_timing.stage.value, stage_timing.size) for stage_timing in stage_timings]
+        [('tokenisation', 5), ('conversion', 5), ('evaluation', 2)]
+    """
+    add_stage_observer(observer)
+
+    try:
+        yield observer
+    finally:
+        remove_stage_observer(observer)
+
+
+class StageMetrics:
+    """Aggregate stage timings into counters and histograms.
+
+    Parameters
+    ----------
+    duration_buckets : collections.abc.Sequence[float], optional
+        upper bounds of histogram buckets of durations in seconds, by default powers of ten
+        from ten microseconds to ten seconds
+
+    Notes
+    -----
+    #. Instances are observers, pass them to `observe_stages` or `add_stage_observer`.
+    #. Buckets are cumulative, as in Prometheus histograms, with an implicit ``+Inf`` bucket.
+    #. Updates are guarded by a lock, so one instance can observe evaluations in many threads.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.instrumentation_module import (
+        ...     StageMetrics,
+        ...     observe_stages,
+        ... )
+        >>> from package_name_to_import_with.simplify import solve_simplification
+        >>> metrics = StageMetrics()
+        >>> with observe_stages(metrics):
+        ...     solve_simplification("1 + 2")
+        ...     solve_simplification("(1 + 2) * 3")
+        3.0
+        9.0
+        >>> metrics.counts["conversion"], metrics.sizes["tokenisation"]
+        (2, 10)
+    """
+
+    def __init__(
+        self: "StageMetrics",
+        duration_buckets: collections.abc.Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> None:
+        self.duration_buckets = tuple(sorted(duration_buckets))
+
+        self.counts: dict[str, int] = dict.fromkeys(Stage, 0)
+        self.seconds: dict[str, float] = dict.fromkeys(Stage, 0.0)
+        self.sizes: dict[str, int] = dict.fromkeys(Stage, 0)
+        self.bucket_counts: dict[str, list[int]] = {
+            stage: [0] * len(self.duration_buckets) for stage in Stage
+        }
+        self._lock = threading.Lock()
+
+    def __call__(self: "StageMetrics", stage_timing: StageTiming) -> None:
+        """Add one stage timing to counters and histograms.
+
+        Parameters
+        ----------
+        stage_timing : StageTiming
+            measurement of one stage
+        """
+        first_bucket = bisect.bisect_left(self.duration_buckets, stage_timing.seconds)
+
+        with self._lock:
+            self.counts[stage_timing.stage] += 1
+            self.seconds[stage_timing.stage] += stage_timing.seconds
+            self.sizes[stage_timing.stage] += stage_timing.size
+
+            bucket_counts = self.bucket_counts[stage_timing.stage]
+            for bucket in range(first_bucket, len(bucket_counts)):
+                bucket_counts[bucket] += 1
+
+    def to_prometheus_text(self: "StageMetrics", prefix: str = "arithmetic_expression") -> str:
+        """Render metrics in Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            prefix of metric names, by default ``arithmetic_expression``
+
+        Returns
+        -------
+        str
+            histogram of durations and counter of sizes, labelled by stage
+        """
+        histogram = f"{prefix}_stage_duration_seconds"
+        counter = f"{prefix}_stage_size_total"
+
+        with self._lock:
+            lines = [
+                f"# HELP {histogram} Wall time of evaluation stages.",
+                f"# TYPE {histogram} histogram",
+            ]
+            for stage in Stage:
+                for upper_bound, bucket_count in zip(
+                    self.duration_buckets, self.bucket_counts[stage], strict=True
+                ):
+                    lines.append(
+                        f'{histogram}_bucket{{stage="{stage}",le="{upper_bound}"}} {bucket_count}'
+                    )
+
+                lines.extend(
+                    [
+                        f'{histogram}_bucket{{stage="{stage}",le="+Inf"}} {self.counts[stage]}',
+                        f'{histogram}_sum{{stage="{stage}"}} {self.seconds[stage]}',
+                        f'{histogram}_count{{stage="{stage}"}} {self.counts[stage]}',
+                    ]
+                )
+
+            lines.extend(
+                [
+                    f"# HELP {counter} Tokens or operations processed by evaluation stages.",
+                    f"# TYPE {counter} counter",
+                ]
+            )
+            lines.extend(f'{counter}{{stage="{stage}"}} {self.sizes[stage]}' for stage in Stage)
+
+        return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "DEFAULT_DURATION_BUCKETS",
+    "STAGE_OBSERVERS",
+    "STAGE_OBSERVERS_LOCK",
+    "Stage",
+    "StageMetrics",
+    "StageObserver",
+    "StageTiming",
+    "add_stage_observer",
+    "observe_stages",
+    "remove_stage_observer",
+    "report_stage_timing",
+]
@@ -0,0 +1,393 @@
+"""Measure memory allocated by evaluations of arithmetic expressions with `tracemalloc`."""
+
+import collections.abc
+import functools
+import threading
+import tracemalloc
+import typing
+
+import pydantic
+
+from .instrumentation_module import StageTiming, observe_stages
+from .utils import CustomPydanticBaseModel
+
+FunctionType: typing.TypeAlias = collections.abc.Callable[..., typing.Any]
+
+TRACEMALLOC_FILTERS = (
+    tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    tracemalloc.Filter(inclusive=False, filename_pattern=__file__),
+)
+
+
+class MemoryProfile(CustomPydanticBaseModel):
+    """Define memory used by one profiled call or stage.
+
+    Attributes
+    ----------
+    label : str
+        name of profiled function, or of stage of evaluation
+    peak_bytes : int
+        highest memory traced during call or stage, above memory traced at its start
+    allocated_bytes : int
+        memory allocated and not yet freed at end of call or stage, above memory traced at its
+        start
+    allocated_blocks : int | None
+        number of memory blocks allocated and not yet freed at end of call, None for stages and
+        for calls made while tracing was already started
+    """
+
+    label: str = pydantic.Field(description="name of profiled function or stage")
+    peak_bytes: int = pydantic.Field(description="highest memory traced above start", ge=0)
+    allocated_bytes: int = pydantic.Field(description="memory allocated and not yet freed", ge=0)
+    allocated_blocks: int | None = pydantic.Field(
+        default=None, description="blocks allocated and not yet freed", ge=0
+    )
+
+
+class MemoryCheckpoint:
+    """Remember traced memory at a point in time, to profile what happens afterwards.
+
+    Notes
+    -----
+    #. Resets peak of `tracemalloc`, so only latest checkpoint can measure its peak.
+    #. Only reads totals of traced memory, whose cost does not grow with number of traces.
+    """
+
+    def __init__(self: "MemoryCheckpoint") -> None:
+        tracemalloc.reset_peak()
+
+        self.traced_bytes, _ = tracemalloc.get_traced_memory()
+
+    def measure(self: "MemoryCheckpoint", label: str) -> MemoryProfile:
+        """Profile memory since checkpoint.
+
+        Parameters
+        ----------
+        label : str
+            name of profiled function or stage
+
+        Returns
+        -------
+        MemoryProfile
+            memory used since this checkpoint, without counts of blocks
+
+        Notes
+        -----
+        Memory freed during stage that was allocated before it is not subtracted, so that
+        allocations are never negative.
+        """
+        traced_bytes, peak_traced_bytes = tracemalloc.get_traced_memory()
+
+        return MemoryProfile(
+            label=label,
+            peak_bytes=max(peak_traced_bytes - self.traced_bytes, 0),
+            allocated_bytes=max(traced_bytes - self.traced_bytes, 0),
+        )
+
+
+def count_traced_blocks() -> tuple[int, int]:
+    """Count memory still allocated since `tracemalloc` started, with one snapshot.
+
+    Returns
+    -------
+    tuple[int, int]
+        number of blocks and their size in bytes, ignoring allocations of profiler itself
+    """
+    statistics = (
+        tracemalloc.take_snapshot().filter_traces(TRACEMALLOC_FILTERS).statistics("filename")
+    )
+
+    return (
+        sum(statistic.count for statistic in statistics),
+        sum(statistic.size for statistic in statistics),
+    )
+
+
+class MemoryProfiler:
+    """Record memory used by calls of decorated functions and by stages of evaluation.
+
+    Notes
+    -----
+    #. `tracemalloc` is started for every profiled call and stopped afterwards, unless it was
+       already tracing, as tracing slows down all allocations.
+    #. Stages of `solve_simplification` inside a profiled call are recorded before the call,
+       through observers of `instrumentation_module`.
+    #. Stages are measured from totals of traced memory, so their cost stays constant.
+    #. Blocks still allocated are counted from one snapshot at end of each call, only when
+       tracing was started for it, as only then every trace belongs to the call.
+    #. Profiled calls nested inside another profiled call are not recorded separately.
+    #. Stage observers are process wide, so profile in one thread at a time.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.memory_profiling_module import MemoryProfiler
+        >>> from package_name_to_import_with.simplify import solve_simplification
+        >>> memory_profiler = MemoryProfiler()
+        >>> profiled_solve_simplification = memory_profiler.decorate(solve_simplification)
+        >>> profiled_solve_simplification("1 + 2 * 3")
+        7.0
+        >>> [memory_profile.label for memory_profile in memory_profiler.profiles]
+        ['tokenisation', 'conversion', 'evaluation', 'solve_simplification']
+    """
+
+    def __init__(self: "MemoryProfiler") -> None:
+        self._lock = threading.Lock()
+        self._profiles: list[tuple[str, int, int, int | None]] = []
+        self._active_calls = threading.local()
+
+    @property
+    def profiles(self: "MemoryProfiler") -> list[MemoryProfile]:
+        """Capture recorded profiles.
+
+        Returns
+        -------
+        list[MemoryProfile]
+            profiles of stages and calls, in order of completion
+        """
+        with self._lock:
+            recorded_profiles = list(self._profiles)
+
+        return [
+            MemoryProfile(
+                label=label,
+                peak_bytes=peak_bytes,
+                allocated_bytes=allocated_bytes,
+                allocated_blocks=allocated_blocks,
+            )
+            for label, peak_bytes, allocated_bytes, allocated_blocks in recorded_profiles
+        ]
+
+    def record(self: "MemoryProfiler", memory_profile: MemoryProfile) -> None:
+        """Store one profile.
+
+        Parameters
+        ----------
+        memory_profile : MemoryProfile
+            memory used by a call or stage
+
+        Notes
+        -----
+        Stored as a tuple allocated in this module, so that `TRACEMALLOC_FILTERS` leaves stored
+        profiles out of allocations of profiled calls.
+        """
+        with self._lock:
+            self._profiles.append(
+                (
+                    memory_profile.label,
+                    memory_profile.peak_bytes,
+                    memory_profile.allocated_bytes,
+                    memory_profile.allocated_blocks,
+                )
+            )
+
+    def profile_call(
+        self: "MemoryProfiler",
+        label: str,
+        function_to_be_profiled: FunctionType,
+        *args: typing.Any,  # noqa: ANN401
+        **kwargs: typing.Any,  # noqa: ANN401
+    ) -> typing.Any:  # noqa: ANN401
+        """Call function, recording memory used by it and by stages of evaluation inside it.
+
+        Parameters
+        ----------
+        label : str
+            name of profiled function
+        function_to_be_profiled : FunctionType
+            function to call
+        *args : tuple
+            positional arguments for ``function_to_be_profiled``
+        **kwargs : dict
+            keyword arguments for ``function_to_be_profiled``
+
+        Returns
+        -------
+        typing.Any
+            output of the provided function with provided arguments
+        """
+        if getattr(self._active_calls, "depth", 0):
+            return function_to_be_profiled(*args, **kwargs)
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        self._active_calls.depth = 1
+        try:
+            stage_checkpoint = MemoryCheckpoint()
+            highest_traced_bytes = stage_checkpoint.traced_bytes
+
+            def record_stage(stage_timing: StageTiming) -> None:
+                """Record memory used by a stage of evaluation that just finished.
+
+                Parameters
+                ----------
+                stage_timing : StageTiming
+                    measurement of finished stage
+                """
+                nonlocal stage_checkpoint, highest_traced_bytes
+
+                stage_profile = stage_checkpoint.measure(str(stage_timing.stage))
+                highest_traced_bytes = max(
+                    highest_traced_bytes, stage_checkpoint.traced_bytes + stage_profile.peak_bytes
+                )
+                self.record(stage_profile)
+
+                stage_checkpoint = MemoryCheckpoint()
+
+            with observe_stages(record_stage):
+                # restart after registering observer, so that its setup is not profiled
+                call_checkpoint = stage_checkpoint = MemoryCheckpoint()
+                highest_traced_bytes = call_checkpoint.traced_bytes
+
+                result = function_to_be_profiled(*args, **kwargs)
+
+            traced_bytes, peak_traced_bytes = tracemalloc.get_traced_memory()
+            allocated_blocks, allocated_bytes = (
+                count_traced_blocks()
+                if started_tracing
+                else (None, max(traced_bytes - call_checkpoint.traced_bytes, 0))
+            )
+
+            call_profile = MemoryProfile(
+                label=label,
+                peak_bytes=max(highest_traced_bytes, peak_traced_bytes)
+                - call_checkpoint.traced_bytes,
+                allocated_bytes=allocated_bytes,
+                allocated_blocks=allocated_blocks,
+            )
+            self.record(call_profile)
+        finally:
+            self._active_calls.depth = 0
+
+            if started_tracing:
+                tracemalloc.stop()
+
+        return result
+
+    def decorate(self: "MemoryProfiler", function_to_be_decorated: FunctionType) -> FunctionType:
+        """Wrap function to record memory used by its calls.
+
+        Parameters
+        ----------
+        function_to_be_decorated : FunctionType
+            function whose memory usage is to be profiled
+
+        Returns
+        -------
+        FunctionType
+            decorated function
+        """
+        label = getattr(function_to_be_decorated, "__name__", repr(function_to_be_decorated))
+
+        @functools.wraps(function_to_be_decorated)
+        def wrapper_function(
+            *args: typing.Any, **kwargs: typing.Any  # noqa: ANN401
+        ) -> typing.Any:  # noqa: ANN401
+            """Execute provided function while recording its memory usage.
+
+            Parameters
+            ----------
+            *args : tuple
+                positional arguments for ``function_to_be_decorated``
+            **kwargs : dict
+                keyword arguments for ``function_to_be_decorated``
+
+            Returns
+            -------
+            typing.Any
+                output of the provided function with provided arguments
+            """
+            return self.profile_call(label, function_to_be_decorated, *args, **kwargs)
+
+        return wrapper_function
+
+    def format_summary(self: "MemoryProfiler") -> str:
+        """Prepare one line per label, aggregating all recorded profiles.
+
+        Returns
+        -------
+        str
+            number of profiles, highest peak and total allocated bytes per label, with blocks
+            where they were counted
+        """
+        summaries: dict[str, list[int]] = {}
+        counted_labels: set[str] = set()
+        for memory_profile in self.profiles:
+            calls, peak_bytes, allocated_blocks, allocated_bytes = summaries.setdefault(
+                memory_profile.label, [0, 0, 0, 0]
+            )
+            if memory_profile.allocated_blocks is not None:
+                counted_labels.add(memory_profile.label)
+
+            summaries[memory_profile.label] = [
+                calls + 1,
+                max(peak_bytes, memory_profile.peak_bytes),
+                allocated_blocks + (memory_profile.allocated_blocks or 0),
+                allocated_bytes + memory_profile.allocated_bytes,
+            ]
+
+        return "".join(
+            f"Memory of {label}: {calls} calls, peak {peak_bytes} bytes, "
+            f"{f'{allocated_blocks} blocks and ' if label in counted_labels else ''}"
+            f"{allocated_bytes} bytes still allocated\n"
+            for label, (calls, peak_bytes, allocated_blocks, allocated_bytes) in summaries.items()
+        )
+
+    def reset(self: "MemoryProfiler") -> None:
+        """Discard recorded profiles."""
+        with self._lock:
+            self._profiles.clear()
+
+
+@pydantic.validate_call(validate_return=True)
+def define_memory_profiling_decorator(
+    function_to_be_decorated: FunctionType,
+    memory_profiler: pydantic.InstanceOf[MemoryProfiler],
+) -> FunctionType:
+    """Record peak memory and allocations of every execution of provided function.
+
+    Parameters
+    ----------
+    function_to_be_decorated : FunctionType
+        function whose memory usage is to be profiled
+    memory_profiler : MemoryProfiler
+        recorder of profiles of calls and of stages of evaluation inside them
+
+    Returns
+    -------
+    FunctionType
+        decorated function
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with import calculate_results
+        >>> from package_name_to_import_with.memory_profiling_module import (
+        ...     MemoryProfiler,
+        ...     define_memory_profiling_decorator,
+        ... )
+        >>> memory_profiler = MemoryProfiler()
+        >>> profiled_calculate_results = define_memory_profiling_decorator(
+        ...     calculate_results, memory_profiler
+        ... )
+        >>> profiled_calculate_results(1, "+", 2)
+        3.0
+        >>> memory_profiler.profiles[0].label
+        'calculate_results'
+    """
+    return memory_profiler.decorate(function_to_be_decorated)
+
+
+__all__ = [
+    "TRACEMALLOC_FILTERS",
+    "FunctionType",
+    "MemoryCheckpoint",
+    "MemoryProfile",
+    "MemoryProfiler",
+    "count_traced_blocks",
+    "define_memory_profiling_decorator",
+]
@@ -0,0 +1,233 @@
+"""Evaluate many arithmetic expressions in parallel over multiple processes."""
+
+import collections
+import collections.abc
+import concurrent.futures
+import itertools
+import os
+import typing
+
+import pydantic
+
+from .streaming_module import EvaluationRecord, evaluate_expression
+
+DEFAULT_CHUNK_SIZE = 256
+PENDING_CHUNKS_PER_WORKER = 2
+
+ChunkElement = typing.TypeVar("ChunkElement")
+
+
+def evaluate_chunk(expressions: list[str], validate: bool = False) -> list[EvaluationRecord]:
+    """Evaluate a chunk of arithmetic expressions inside one process.
+
+    Parameters
+    ----------
+    expressions : list[str]
+        standard arithmetic expressions
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Returns
+    -------
+    list[EvaluationRecord]
+        result or reason of failure of every expression, in order of `expressions`
+    """
+    return [evaluate_expression(expression, validate=validate) for expression in expressions]
+
+
+def split_into_chunks(
+    expressions: collections.abc.Iterable[ChunkElement], chunksize: int
+) -> collections.abc.Iterator[list[ChunkElement]]:
+    """Group arithmetic expressions, or any other inputs, lazily into chunks of fixed size.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[ChunkElement]
+        standard arithmetic expressions, or other inputs of evaluations
+    chunksize : int
+        maximum number of expressions per chunk
+
+    Yields
+    ------
+    list[ChunkElement]
+        consecutive expressions, only last chunk may be smaller than `chunksize`
+    """
+    expressions_iterator = iter(expressions)
+
+    while chunk := list(itertools.islice(expressions_iterator, chunksize)):
+        yield chunk
+
+
+def collect_completed_chunks(
+    pending_chunks: dict[concurrent.futures.Future[list[EvaluationRecord]], int],
+) -> collections.abc.Iterator[tuple[int, EvaluationRecord]]:
+    """Wait for at least one pending chunk and release records of all finished chunks.
+
+    Parameters
+    ----------
+    pending_chunks : dict[concurrent.futures.Future[list[EvaluationRecord]], int]
+        submitted chunks keyed to positions of their first expressions, updated in place
+
+    Yields
+    ------
+    tuple[int, EvaluationRecord]
+        position of expression and its record, for every finished chunk
+    """
+    completed_chunks, _ = concurrent.futures.wait(
+        pending_chunks, return_when=concurrent.futures.FIRST_COMPLETED
+    )
+
+    for completed_chunk in completed_chunks:
+        chunk_start = pending_chunks.pop(completed_chunk)
+        yield from enumerate(completed_chunk.result(), start=chunk_start)
+
+
+@pydantic.validate_call
+def solve_many_stream(
+    expressions: collections.abc.Iterable[str],
+    workers: pydantic.PositiveInt | None = None,
+    chunksize: pydantic.PositiveInt = DEFAULT_CHUNK_SIZE,
+    validate: bool = False,
+) -> collections.abc.Iterator[EvaluationRecord]:
+    """Evaluate arithmetic expressions over a pool of processes, yielding records in order.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[str]
+        standard arithmetic expressions, consumed one chunk at a time
+    workers : pydantic.PositiveInt | None, optional
+        number of worker processes, by default number of processors
+    chunksize : pydantic.PositiveInt, optional
+        number of expressions sent to a worker at once, by default 256
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Yields
+    ------
+    EvaluationRecord
+        result or reason of failure of every expression, in order of `expressions`
+
+    Notes
+    -----
+    #. With a single worker, expressions are evaluated in current process without a pool.
+    #. At most two chunks per worker are in flight, so memory does not depend on input size.
+    #. A slow chunk delays records of later chunks, use `solve_many_as_completed` to avoid it.
+    """
+    if workers == 1:
+        for chunk in split_into_chunks(expressions, chunksize):
+            yield from evaluate_chunk(chunk, validate=validate)
+
+        return
+
+    maximum_pending_chunks = (workers or os.cpu_count() or 1) * PENDING_CHUNKS_PER_WORKER
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending_chunks: collections.deque[concurrent.futures.Future[list[EvaluationRecord]]] = (
+            collections.deque()
+        )
+
+        for chunk in split_into_chunks(expressions, chunksize):
+            pending_chunks.append(executor.submit(evaluate_chunk, chunk, validate))
+
+            if len(pending_chunks) >= maximum_pending_chunks:
+                yield from pending_chunks.popleft().result()
+
+        while pending_chunks:
+            yield from pending_chunks.popleft().result()
+
+
+@pydantic.validate_call
+def solve_many_as_completed(
+    expressions: collections.abc.Iterable[str],
+    workers: pydantic.PositiveInt | None = None,
+    chunksize: pydantic.PositiveInt = DEFAULT_CHUNK_SIZE,
+    validate: bool = False,
+) -> collections.abc.Iterator[tuple[int, EvaluationRecord]]:
+    """Evaluate arithmetic expressions over a pool of processes, yielding records as ready.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[str]
+        standard arithmetic expressions, consumed one chunk at a time
+    workers : pydantic.PositiveInt | None, optional
+        number of worker processes, by default number of processors
+    chunksize : pydantic.PositiveInt, optional
+        number of expressions sent to a worker at once, by default 256
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Yields
+    ------
+    tuple[int, EvaluationRecord]
+        position of expression in `expressions` and its record, in order of completion
+
+    Notes
+    -----
+    #. Records of a chunk are yielded together, as soon as that chunk finishes.
+    #. At most two chunks per worker are in flight, so memory does not depend on input size.
+    """
+    maximum_pending_chunks = (workers or os.cpu_count() or 1) * PENDING_CHUNKS_PER_WORKER
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending_chunks: dict[concurrent.futures.Future[list[EvaluationRecord]], int] = {}
+
+        chunk_start = 0
+        for chunk in split_into_chunks(expressions, chunksize):
+            pending_chunks[executor.submit(evaluate_chunk, chunk, validate)] = chunk_start
+            chunk_start += len(chunk)
+
+            if len(pending_chunks) >= maximum_pending_chunks:
+                yield from collect_completed_chunks(pending_chunks)
+
+        while pending_chunks:
+            yield from collect_completed_chunks(pending_chunks)
+
+
+@pydantic.validate_call(validate_return=True)
+def solve_many(
+    expressions: collections.abc.Iterable[str],
+    workers: pydantic.PositiveInt | None = None,
+    chunksize: pydantic.PositiveInt = DEFAULT_CHUNK_SIZE,
+    validate: bool = False,
+) -> list[EvaluationRecord]:
+    """Evaluate arithmetic expressions over a pool of processes.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[str]
+        standard arithmetic expressions
+    workers : pydantic.PositiveInt | None, optional
+        number of worker processes, by default number of processors
+    chunksize : pydantic.PositiveInt, optional
+        number of expressions sent to a worker at once, by default 256
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Returns
+    -------
+    list[EvaluationRecord]
+        result or reason of failure of every expression, in order of `expressions`
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.parallel_module import solve_many
+        >>> [record.result for record in solve_many(["1 + 2", "3 * 4"], workers=2)]
+        [3.0, 12.0]
+    """
+    return list(
+        solve_many_stream(expressions, workers=workers, chunksize=chunksize, validate=validate)
+    )
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "PENDING_CHUNKS_PER_WORKER",
+    "collect_completed_chunks",
+    "evaluate_chunk",
+    "solve_many",
+    "solve_many_as_completed",
+    "solve_many_stream",
+    "split_into_chunks",
+]
@@ -0,0 +1,319 @@
+"""Store compiled arithmetic expressions on disk, shared between processes."""
+
+import hashlib
+import os
+import pathlib
+import sqlite3
+import sys
+import threading
+
+import pydantic
+
+from . import read_package_version
+from .bytecode_module import ExpressionBytecode, compile_bytecode
+from .simplify import CompiledExpression, normalise_expression
+
+DEFAULT_MEMORY_MAP_SIZE = 64 * 1024 * 1024
+DEFAULT_BUSY_TIMEOUT = 30.0
+
+SCHEMA_STATEMENT = (
+    "CREATE TABLE IF NOT EXISTS compiled_expressions "
+    "(key TEXT PRIMARY KEY, bytecode BLOB NOT NULL) WITHOUT ROWID"
+)
+SELECT_STATEMENT = "SELECT bytecode FROM compiled_expressions WHERE key = ?"
+INSERT_STATEMENT = "INSERT OR IGNORE INTO compiled_expressions (key, bytecode) VALUES (?, ?)"
+COUNT_STATEMENT = "SELECT COUNT(*) FROM compiled_expressions"
+DELETE_STATEMENT = "DELETE FROM compiled_expressions"
+
+
+@pydantic.validate_call(validate_return=True)
+def create_cache_key(
+    expression: str, allow_variables: bool = False, optimise: bool = True, version: str = ""
+) -> str:
+    """Derive identifier of compiled arithmetic expression in persistent cache.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    allow_variables : bool, optional
+        whether named variables are accepted, by default False
+    optimise : bool, optional
+        whether constants are folded and redundant operations removed, by default True
+    version : str, optional
+        version of the package that compiled the expression, by default empty
+
+    Returns
+    -------
+    str
+        hexadecimal SHA-256 digest
+
+    Notes
+    -----
+    #. Expressions differing only in acceptable characters such as spaces share a key.
+    #. Byte order of the platform is part of the key, as bytecode is stored in native order.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.persistent_cache_module import create_cache_key
+        >>> create_cache_key("1 + 2") == create_cache_key("1+2")
+        True
+    """
+    key_components = (
+        version,
+        sys.byteorder,
+        str(int(allow_variables)),
+        str(int(optimise)),
+        normalise_expression(expression),
+    )
+
+    return hashlib.sha256("\0".join(key_components).encode("utf-8")).hexdigest()
+
+
+class PersistentExpressionCache:
+    """Store compiled arithmetic expressions in a SQLite database file.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        location of database file, created if absent unless `read_only` is set
+    read_only : bool, optional
+        whether to only look up entries, without creating or updating the file, by default False
+    memory_map_size : int, optional
+        maximum number of bytes of database file read through memory mapping, by default 64 MiB
+    busy_timeout : float, optional
+        seconds to wait for a lock held by another process, by default 30
+
+    Notes
+    -----
+    #. Entries are keyed by `create_cache_key`, so upgrading the package never reuses entries
+       compiled by another version.
+    #. Database uses write-ahead logging, so any number of processes can read while one writes.
+    #. Entries are stored as output of `ExpressionBytecode.to_bytes`, never as pickles.
+    #. Connection is opened on first use and reopened after ``fork``, so a cache can be created
+       before starting worker processes.
+    #. Lookups are guarded by a lock, so one cache can be shared between threads.
+    """
+
+    def __init__(
+        self: "PersistentExpressionCache",
+        path: str | os.PathLike[str],
+        read_only: bool = False,
+        memory_map_size: int = DEFAULT_MEMORY_MAP_SIZE,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self.read_only = read_only
+        self.memory_map_size = memory_map_size
+        self.busy_timeout = busy_timeout
+        self.version = read_package_version()
+
+        self._connection: sqlite3.Connection | None = None
+        self._connection_process: int | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self: "PersistentExpressionCache") -> sqlite3.Connection:
+        """Open connection to database file, unless already open in current process.
+
+        Returns
+        -------
+        sqlite3.Connection
+            connection in autocommit mode
+        """
+        if self._connection is not None and self._connection_process == os.getpid():
+            return self._connection
+
+        if self.read_only:
+            connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro",
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+                uri=True,
+            )
+        else:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            _ = connection.execute("PRAGMA journal_mode = WAL")
+            _ = connection.execute("PRAGMA synchronous = NORMAL")
+            _ = connection.execute(SCHEMA_STATEMENT)
+
+        _ = connection.execute(f"PRAGMA mmap_size = {int(self.memory_map_size)}")
+
+        self._connection = connection
+        self._connection_process = os.getpid()
+
+        return connection
+
+    def __len__(self: "PersistentExpressionCache") -> int:
+        """Count stored entries.
+
+        Returns
+        -------
+        int
+            number of compiled expressions in database file
+        """
+        with self._lock:
+            (number_of_entries,) = self._connect().execute(COUNT_STATEMENT).fetchone()
+
+        return int(number_of_entries)
+
+    def get_bytecode(
+        self: "PersistentExpressionCache",
+        expression: str,
+        allow_variables: bool = False,
+        optimise: bool = True,
+    ) -> ExpressionBytecode | None:
+        """Look up stored bytecode of arithmetic expression.
+
+        Parameters
+        ----------
+        expression : str
+            standard arithmetic expression
+        allow_variables : bool, optional
+            whether to accept named variables such as ``x`` or ``rate_2``, by default False
+        optimise : bool, optional
+            whether to fold constants and remove redundant operations, by default True
+
+        Returns
+        -------
+        ExpressionBytecode | None
+            stored bytecode, if expression was compiled before by same package version
+        """
+        key = create_cache_key(
+            expression, allow_variables=allow_variables, optimise=optimise, version=self.version
+        )
+
+        with self._lock:
+            row = self._connect().execute(SELECT_STATEMENT, (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        return ExpressionBytecode.from_bytes(row[0])
+
+    def compile_bytecode(
+        self: "PersistentExpressionCache",
+        expression: str,
+        allow_variables: bool = False,
+        optimise: bool = True,
+    ) -> ExpressionBytecode:
+        """Return stored bytecode of arithmetic expression, compiling and storing it if absent.
+
+        Parameters
+        ----------
+        expression : str
+            standard arithmetic expression
+        allow_variables : bool, optional
+            whether to accept named variables such as ``x`` or ``rate_2``, by default False
+        optimise : bool, optional
+            whether to fold constants and remove redundant operations, by default True
+
+        Returns
+        -------
+        ExpressionBytecode
+            stored or freshly compiled bytecode
+
+        Notes
+        -----
+        #. Compilation runs outside the lock, so concurrent misses for same expression may
+           compile twice, and only first result is stored.
+        #. Failed compilations are not stored.
+        """
+        key = create_cache_key(
+            expression, allow_variables=allow_variables, optimise=optimise, version=self.version
+        )
+
+        with self._lock:
+            row = self._connect().execute(SELECT_STATEMENT, (key,)).fetchone()
+
+        if row is not None:
+            return ExpressionBytecode.from_bytes(row[0])
+
+        bytecode = compile_bytecode(expression, allow_variables=allow_variables, optimise=optimise)
+
+        if not self.read_only:
+            with self._lock:
+                _ = self._connect().execute(INSERT_STATEMENT, (key, bytecode.to_bytes()))
+
+        return bytecode
+
+    def compile_expression(
+        self: "PersistentExpressionCache",
+        expression: str,
+        allow_variables: bool = False,
+        optimise: bool = True,
+    ) -> CompiledExpression:
+        """Return compiled arithmetic expression, reusing stored bytecode if present.
+
+        Parameters
+        ----------
+        expression : str
+            standard arithmetic expression
+        allow_variables : bool, optional
+            whether to accept named variables such as ``x`` or ``rate_2``, by default False
+        optimise : bool, optional
+            whether to fold constants and remove redundant operations, by default True
+
+        Returns
+        -------
+        CompiledExpression
+            expression in reverse Polish notation
+
+        Examples
+        --------
+        .. code-block:: pycon
+
+            >>> import pathlib
+            >>> import tempfile
+            >>> from package_name_to_import_with.persistent_cache_module import (
+            ...     PersistentExpressionCache,
+            ... )
+            >>> with tempfile.TemporaryDirectory() as directory:
+            ...     cache = PersistentExpressionCache(pathlib.Path(directory, "cache.db"))
+            ...     first = cache.compile_expression("x * (2 + 3)", allow_variables=True)
+            ...     second = cache.compile_expression("x*(2+3)", allow_variables=True)
+            ...     print(len(cache), second.evaluate(variable_values={"x": 2}))
+            ...     cache.close()
+            1 10.0
+        """
+        bytecode = self.compile_bytecode(
+            expression, allow_variables=allow_variables, optimise=optimise
+        )
+
+        return CompiledExpression.model_construct(
+            expression=expression, postfix_expression=tuple(bytecode.to_postfix_expression())
+        )
+
+    def clear(self: "PersistentExpressionCache") -> None:
+        """Discard all entries."""
+        with self._lock:
+            _ = self._connect().execute(DELETE_STATEMENT)
+
+    def close(self: "PersistentExpressionCache") -> None:
+        """Close connection to database file, it is reopened on next use."""
+        with self._lock:
+            if self._connection is not None and self._connection_process == os.getpid():
+                self._connection.close()
+
+            self._connection = None
+            self._connection_process = None
+
+
+__all__ = [
+    "COUNT_STATEMENT",
+    "DEFAULT_BUSY_TIMEOUT",
+    "DEFAULT_MEMORY_MAP_SIZE",
+    "DELETE_STATEMENT",
+    "INSERT_STATEMENT",
+    "SCHEMA_STATEMENT",
+    "SELECT_STATEMENT",
+    "PersistentExpressionCache",
+    "create_cache_key",
+]
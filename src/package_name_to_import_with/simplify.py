@@ -1,15 +1,26 @@
 """Evaluate simplification expressions."""
 
 import collections.abc
+import contextlib
 import enum
+import functools
 import re
 import string
+import time
 import typing
 
 import pydantic
 
-from .calculator_sub_package import BinaryArithmeticOperator, calculate_results
-from .utils import CustomStrEnum
+from .caching_module import BoundedCache
+from .calculator_sub_package import (
+    TRUSTED_BINARY_ARITHMETIC_OPERATIONS,
+    BinaryArithmeticOperator,
+    IdentityElements,
+    InverseElements,
+    calculate_results,
+)
+from .instrumentation_module import STAGE_OBSERVERS, Stage, StageTiming, report_stage_timing
+from .utils import CustomPydanticBaseModel, CustomStrEnum
 
 
 @enum.unique
@@ -29,26 +40,62 @@ class TokenType(CustomStrEnum):
     OPERATOR = "operator"
     LEFT_PARENTHESIS = "left_parenthesis"
     RIGHT_PARENTHESIS = "right_parenthesis"
+    VARIABLE = "variable"
 
 
 SUPPORTED_CHARACTERS = set.union(
     set(string.digits + "."), set(BinaryArithmeticOperator), set(Parentheses)
 )
 ACCEPTABLE_CHARACTERS = set(" ")
+VARIABLE_CHARACTERS = set(string.ascii_letters + string.digits + "_")
 
 REGULAR_EXPRESSION_PATTERNS = {
     TokenType.POSITIVE_NUMBER: r"\d+(?:\.\d+)?",
-    TokenType.NEGATIVE_NUMBER: rf"(?<![\d|{Parentheses.RIGHT}])-\d+(?:\.\d+)?",
+    TokenType.NEGATIVE_NUMBER: rf"(?<![\w{Parentheses.RIGHT}])-\d+(?:\.\d+)?",
     TokenType.OPERATOR: (
         "[" + "".join(rf"\{operator}" for operator in BinaryArithmeticOperator) + "]"
     ),
     TokenType.LEFT_PARENTHESIS: rf"\{Parentheses.LEFT}",
     TokenType.RIGHT_PARENTHESIS: rf"\{Parentheses.RIGHT}",
+    TokenType.VARIABLE: r"[A-Za-z_][A-Za-z0-9_]*",
 }
 SUPPORTED_TOKEN_PATTERN = "|".join(
     f"(?P<{token_type}>{token_pattern})"
     for token_type, token_pattern in REGULAR_EXPRESSION_PATTERNS.items()
 )
+SUPPORTED_TOKEN_REGULAR_EXPRESSION = re.compile(SUPPORTED_TOKEN_PATTERN)
+UNTYPED_TOKEN_REGULAR_EXPRESSION = re.compile(
+    "|".join(f"(?:{token_pattern})" for token_pattern in REGULAR_EXPRESSION_PATTERNS.values())
+)
+TOKEN_TYPES: dict[str, TokenType] = {token_type.value: token_type for token_type in TokenType}
+OPERATOR_TOKENS: dict[str, BinaryArithmeticOperator] = {
+    operator.value: operator for operator in BinaryArithmeticOperator
+}
+NUMBER_TOKEN_TYPES = frozenset({TokenType.POSITIVE_NUMBER, TokenType.NEGATIVE_NUMBER})
+FIRST_CHARACTER_TOKEN_TYPES: dict[str, TokenType] = {
+    **dict.fromkeys(VARIABLE_CHARACTERS.difference(string.digits), TokenType.VARIABLE),
+    **dict.fromkeys(string.digits, TokenType.POSITIVE_NUMBER),
+    **dict.fromkeys(OPERATOR_TOKENS, TokenType.OPERATOR),
+    Parentheses.LEFT.value: TokenType.LEFT_PARENTHESIS,
+    Parentheses.RIGHT.value: TokenType.RIGHT_PARENTHESIS,
+}
+
+
+class Variable(CustomPydanticBaseModel):
+    """Define named placeholder for a real number in arithmetic expression.
+
+    Attributes
+    ----------
+    name : str
+        identifier of the placeholder
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    name: str = pydantic.Field(
+        description="identifier of the placeholder", pattern=r"^[A-Za-z_][A-Za-z0-9_]*$"
+    )
+
 
 OPERATION_PRECEDENCES: dict[BinaryArithmeticOperator | Parentheses, int] = {
     Parentheses.LEFT: 0,
@@ -60,9 +107,73 @@ class TokenType(CustomStrEnum):
 }
 
 
+@pydantic.validate_call(validate_return=True)
+def normalise_expression(raw_expression: str) -> str:
+    """Remove acceptable but insignificant characters from arithmetic expression.
+
+    Parameters
+    ----------
+    raw_expression : str
+        infix expression
+
+    Returns
+    -------
+    str
+        infix expression without acceptable characters
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.simplify import normalise_expression
+        >>> normalise_expression(" 1 +  2 ")
+        '1+2'
+    """
+    clean_expression = raw_expression.translate(
+        str.maketrans(dict.fromkeys(ACCEPTABLE_CHARACTERS, None))
+    )
+
+    return clean_expression
+
+
+@pydantic.validate_call(validate_return=True)
+def validate_expression_characters(raw_expression: str, allow_variables: bool = False) -> str:
+    """Remove acceptable characters and check remaining characters are supported.
+
+    Parameters
+    ----------
+    raw_expression : str
+        infix expression
+    allow_variables : bool, optional
+        whether to accept named variables such as ``x`` or ``rate_2``, by default False
+
+    Returns
+    -------
+    str
+        infix expression without acceptable characters
+
+    Raises
+    ------
+    ValueError
+        if unsupported characters are passed
+    """
+    clean_expression = normalise_expression(raw_expression)
+
+    supported_characters = (
+        SUPPORTED_CHARACTERS.union(VARIABLE_CHARACTERS)
+        if allow_variables
+        else SUPPORTED_CHARACTERS
+    )
+
+    if unsupported_characters := set(clean_expression).difference(supported_characters):
+        raise ValueError(f"Unexpected characters: {unsupported_characters}")
+
+    return clean_expression
+
+
 @pydantic.validate_call(validate_return=True)
 def clean_and_tokenise_expression(
-    raw_expression: str,
+    raw_expression: str, allow_variables: bool = False
 ) -> pydantic.InstanceOf[collections.abc.Iterator[re.Match[str]]]:
     """Extract tokens from arithmetic expression after pre-processing.
 
@@ -70,6 +181,8 @@ def clean_and_tokenise_expression(
     ----------
     raw_expression : str
         infix expression
+    allow_variables : bool, optional
+        whether to accept named variables such as ``x`` or ``rate_2``, by default False
 
     Returns
     -------
@@ -81,34 +194,106 @@ def clean_and_tokenise_expression(
     ValueError
         if unsupported characters are passed
     """
-    clean_expression = raw_expression.translate(
-        str.maketrans(dict.fromkeys(ACCEPTABLE_CHARACTERS, None))
+    clean_expression = validate_expression_characters(
+        raw_expression, allow_variables=allow_variables
     )
 
-    if unsupported_characters := set(clean_expression).difference(SUPPORTED_CHARACTERS):
-        raise ValueError(f"Unexpected characters: {unsupported_characters}")
-
-    tokens = re.finditer(SUPPORTED_TOKEN_PATTERN, clean_expression)
+    tokens = SUPPORTED_TOKEN_REGULAR_EXPRESSION.finditer(clean_expression)
 
     return tokens
 
 
+def classify_tokens(
+    token_values: collections.abc.Iterable[str],
+) -> collections.abc.Iterator[tuple[TokenType, str]]:
+    """Attach types to values of tokens extracted from a clean arithmetic expression.
+
+    Parameters
+    ----------
+    token_values : collections.abc.Iterable[str]
+        values of supported tokens, in order of appearance
+
+    Yields
+    ------
+    tuple[TokenType, str]
+        pair of type and value of every token
+    """
+    # attribute lookups on enum classes are slow, so members are bound once
+    operator_token_type = TokenType.OPERATOR
+    negative_number_token_type = TokenType.NEGATIVE_NUMBER
+
+    for token_value in token_values:
+        token_type = FIRST_CHARACTER_TOKEN_TYPES[token_value[0]]
+
+        if token_type is operator_token_type and len(token_value) > 1:
+            token_type = negative_number_token_type
+
+        yield token_type, token_value
+
+
 @pydantic.validate_call(validate_return=True)
-def convert_infix_expression(  # noqa: C901 # skipcq: PY-R1000
-    infix_expression_tokens: pydantic.InstanceOf[collections.abc.Iterator[re.Match[str]]],
-) -> list[BinaryArithmeticOperator | float]:
+def tokenise_expression(
+    raw_expression: str, allow_variables: bool = False
+) -> pydantic.InstanceOf[collections.abc.Iterator[tuple[TokenType, str]]]:
+    """Extract typed tokens from arithmetic expression after pre-processing.
+
+    Parameters
+    ----------
+    raw_expression : str
+        infix expression
+    allow_variables : bool, optional
+        whether to accept named variables such as ``x`` or ``rate_2``, by default False
+
+    Returns
+    -------
+    collections.abc.Iterator[tuple[TokenType, str]]
+        pairs of type and value of tokens in standard arithmetic expression
+
+    Raises
+    ------
+    ValueError
+        if unsupported characters are passed
+
+    Notes
+    -----
+    #. Token values are extracted in one call of `re.findall`, without creating match objects.
+    #. Type of each token is decided by its first character, and negative numbers are the only
+       tokens longer than one character to start with an operator.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.simplify import tokenise_expression
+        >>> [token_value for _, token_value in tokenise_expression("1 - -2*(3)")]
+        ['1', '-', '-2', '*', '(', '3', ')']
+    """
+    clean_expression = validate_expression_characters(
+        raw_expression, allow_variables=allow_variables
+    )
+
+    return classify_tokens(UNTYPED_TOKEN_REGULAR_EXPRESSION.findall(clean_expression))
+
+
+@pydantic.validate_call
+def convert_infix_expression(  # noqa: C901, PLR0912 # skipcq: PY-R1000
+    infix_expression_tokens: pydantic.InstanceOf[
+        collections.abc.Iterator[re.Match[str] | tuple[TokenType, str]]
+    ],
+) -> list[BinaryArithmeticOperator | Variable | float]:
     """Convert standard arithmetic expression into reverse Polish notation.
 
     This implements shunting yard algorithm following pseudocode section in Wikipedia.
 
     Parameters
     ----------
-    infix_expression_tokens : collections.abc.Iterator[re.Match[str]]
-        tokens in standard arithmetic expression
+    infix_expression_tokens : collections.abc.Iterator[re.Match[str] | tuple[TokenType, str]]
+        tokens in standard arithmetic expression, either as matches from
+        `clean_and_tokenise_expression` or as pairs from `tokenise_expression`
 
     Returns
     -------
-    list[BinaryArithmeticOperator | float]
+    list[BinaryArithmeticOperator | Variable | float]
         postfix arithmetic expression
 
     Raises
@@ -126,155 +311,82 @@ def convert_infix_expression(  # noqa: C901 # skipcq: PY-R1000
             #. Convert to number (using `float`).
             #. Add to ``output_queue``.
 
+        * Variable
+
+            #. Convert to placeholder (using `Variable`).
+            #. Add to ``output_queue``.
+
         * Operator
 
-            #. Convert to operator (using `BinaryArithmeticOperator`).
+            #. Convert to operator (using `OPERATOR_TOKENS`).
             #. Move top lower precedence operators from ``operator_stack`` into ``output_queue``.
             #. Add to ``operator_stack``.
 
         * Left Parenthesis
 
-            #. Convert to bracket (using `Parentheses`).
+            #. Add left bracket (`Parentheses.LEFT`) to ``operator_stack``.
 
         * Right Parenthesis
 
-            #. Convert to bracket (using `Parentheses`).
             #. Move operators from ``operator_stack`` into ``output_queue`` till left bracket.
             #. Discard left bracket from top of ``operator_stack``.
 
+    #. Tokens are processed inline, without per-token function calls or validation.
+    #. Repeated variables share one placeholder.
+    #. Time is linear in number of tokens, and nesting depth only affects size of
+       ``operator_stack``, so arbitrarily deep expressions are supported.
+
     References
     ----------
     `Wikipedia <https://en.wikipedia.org/wiki/Shunting_yard_algorithm#The_algorithm_in_detail>`_.
     """
     operator_stack: list[BinaryArithmeticOperator | typing.Literal[Parentheses.LEFT]] = []
-    output_queue: list[BinaryArithmeticOperator | float] = []
-
-    @pydantic.validate_call
-    def __process_number_token(number_token: str) -> None:
-        """Modify ``output_queue``.
-
-        Parameters
-        ----------
-        number_token : str
-            a real number as a string
-
-        Notes
-        -----
-        #. Convert to number.
-        #. Add to ``output_queue``.
-        """
-        valid_number = float(number_token)
-
-        output_queue.append(valid_number)
-
-    @pydantic.validate_call
-    def __process_operator_token(operator_token: str) -> None:
-        """Modify ``operator_stack`` and ``output_queue``.
-
-        Parameters
-        ----------
-        operator_token : str
-            a binary operator as a string
-
-        Notes
-        -----
-        #. Convert to operator.
-        #. Move previous lower precedence operators from ``operator_stack`` into ``output_queue``.
-        #. Add to ``operator_stack``.
-        """
-        valid_operator = BinaryArithmeticOperator(operator_token)
-
-        while (
-            operator_stack
-            and (last_operator := operator_stack[-1]) != Parentheses.LEFT
-            and OPERATION_PRECEDENCES[last_operator] >= OPERATION_PRECEDENCES[valid_operator]
-        ):
-            _ = operator_stack.pop()
-            output_queue.append(last_operator)
-
-        operator_stack.append(valid_operator)
-
-    @pydantic.validate_call
-    def __process_left_parenthesis_token(parenthesis_token: str) -> None:
-        """Modify ``operator_stack``.
-
-        Parameters
-        ----------
-        parenthesis_token : str
-            left bracket as a string
-
-        Raises
-        ------
-        ValueError
-            if token is not left bracket
-
-        Notes
-        -----
-        #. Convert to bracket.
-        #. Add to ``operator_stack``.
-        """
-        valid_parenthesis = Parentheses(parenthesis_token)
+    output_queue: list[BinaryArithmeticOperator | Variable | float] = []
+    variable_placeholders: dict[str, Variable] = {}
 
-        if valid_parenthesis != Parentheses.LEFT:
-            raise ValueError(f"Unexpected token: {parenthesis_token}")  # pragma: no cover
+    # attribute lookups on enum classes are slow, so members are bound once
+    left_parenthesis: typing.Literal[Parentheses.LEFT] = Parentheses.LEFT
+    operator_token_type = TokenType.OPERATOR
+    variable_token_type = TokenType.VARIABLE
+    left_parenthesis_token_type = TokenType.LEFT_PARENTHESIS
+    right_parenthesis_token_type = TokenType.RIGHT_PARENTHESIS
 
-        operator_stack.append(valid_parenthesis)
-
-    @pydantic.validate_call
-    def __process_right_parenthesis_token(parenthesis_token: str) -> None:
-        """Modify ``operator_stack`` and ``output_queue``.
-
-        Parameters
-        ----------
-        parenthesis_token : str
-            right bracket as a string
-
-        Raises
-        ------
-        ValueError
-            if token is not right bracket
-        ValueError
-            if brackets are not matching
-
-        Notes
-        -----
-        #. Convert to bracket.
-        #. Move operators from ``operator_stack`` into ``output_queue`` till left bracket.
-        #. Discard left bracket from top of ``operator_stack``.
-        """
-        valid_parenthesis = Parentheses(parenthesis_token)
-
-        if valid_parenthesis != Parentheses.RIGHT:
-            raise ValueError(f"Unexpected token: {parenthesis_token}")  # pragma: no cover
+    for token in infix_expression_tokens:
+        if isinstance(token, re.Match):
+            token_type = TOKEN_TYPES[typing.cast("str", token.lastgroup)]
+            token_value = token.group()
+        else:
+            token_type, token_value = token
+
+        if token_type in NUMBER_TOKEN_TYPES:
+            output_queue.append(float(token_value))
+        elif token_type is operator_token_type:
+            valid_operator = OPERATOR_TOKENS[token_value]
+            valid_precedence = OPERATION_PRECEDENCES[valid_operator]
+
+            while (
+                operator_stack
+                and (last_operator := operator_stack[-1]) is not left_parenthesis
+                and OPERATION_PRECEDENCES[last_operator] >= valid_precedence
+            ):
+                output_queue.append(typing.cast("BinaryArithmeticOperator", operator_stack.pop()))
+
+            operator_stack.append(valid_operator)
+        elif token_type is left_parenthesis_token_type:
+            operator_stack.append(left_parenthesis)
+        elif token_type is right_parenthesis_token_type:
+            while operator_stack and (last_operator := operator_stack[-1]) is not left_parenthesis:
+                output_queue.append(typing.cast("BinaryArithmeticOperator", operator_stack.pop()))
+
+            if not operator_stack:
+                raise ValueError("Mismatched right parenthesis")
 
-        while operator_stack and (last_operator := operator_stack[-1]) != Parentheses.LEFT:
             _ = operator_stack.pop()
-            output_queue.append(last_operator)
-
-        if not operator_stack or (last_operator := operator_stack[-1]) != Parentheses.LEFT:
-            raise ValueError("Mismatched right parenthesis")
+        elif token_type is variable_token_type:
+            if (valid_variable := variable_placeholders.get(token_value)) is None:
+                valid_variable = variable_placeholders[token_value] = Variable(name=token_value)
 
-        _ = operator_stack.pop()
-
-    for token in infix_expression_tokens:
-        try:
-            token_type, token_value = next(
-                (element_type, element_value)
-                for element_type, element_value in token.groupdict().items()
-                if element_value is not None
-            )
-        except StopIteration:  # pragma: no cover
-            continue
-
-        match token_type:
-            case TokenType.POSITIVE_NUMBER | TokenType.NEGATIVE_NUMBER:
-                __process_number_token(token_value)
-            case TokenType.OPERATOR:
-                __process_operator_token(token_value)
-            case TokenType.LEFT_PARENTHESIS:
-                __process_left_parenthesis_token(token_value)
-            case TokenType.RIGHT_PARENTHESIS:
-                __process_right_parenthesis_token(token_value)
+            output_queue.append(valid_variable)
 
     while operator_stack:
         if (last_operator := operator_stack[-1]) is Parentheses.LEFT:
@@ -318,14 +430,394 @@ def evaluate_postfix_expression(
     return stack.pop()
 
 
+def evaluate_trusted_postfix_expression(
+    postfix_expression: collections.abc.Iterable[BinaryArithmeticOperator | float],
+) -> float:
+    """Evaluate postfix arithmetic expression without validating every operation.
+
+    Parameters
+    ----------
+    postfix_expression : collections.abc.Iterable[BinaryArithmeticOperator | float]
+        elements of arithmetic expression in postfix format, as produced by
+        `convert_infix_expression`
+
+    Returns
+    -------
+    float
+        result of arithmetic expression
+
+    Raises
+    ------
+    ValueError
+        if division by zero is attempted
+
+    Notes
+    -----
+    #. Intended for expressions parsed by this module, so elements are not validated.
+    #. Operations are performed on plain floats using `TRUSTED_BINARY_ARITHMETIC_OPERATIONS`.
+    """
+    stack: list[float] = []
+    for element in postfix_expression:
+        if isinstance(element, BinaryArithmeticOperator):
+            second_input = stack.pop()
+            first_input = stack.pop()
+
+            stack.append(TRUSTED_BINARY_ARITHMETIC_OPERATIONS[element](first_input, second_input))
+        else:
+            stack.append(element)
+
+    return stack.pop()
+
+
+def optimise_binary_operation(
+    first_operand: list[BinaryArithmeticOperator | Variable | float],
+    operator: BinaryArithmeticOperator,
+    second_operand: list[BinaryArithmeticOperator | Variable | float],
+) -> list[BinaryArithmeticOperator | Variable | float]:
+    """Simplify one binary operation whose operands are already simplified.
+
+    Parameters
+    ----------
+    first_operand : list[BinaryArithmeticOperator | Variable | float]
+        postfix elements of left operand, reused for the result
+    operator : BinaryArithmeticOperator
+        kind of binary arithmetic expression
+    second_operand : list[BinaryArithmeticOperator | Variable | float]
+        postfix elements of right operand
+
+    Returns
+    -------
+    list[BinaryArithmeticOperator | Variable | float]
+        postfix elements of simplified operation
+    """
+    first_constant = first_operand[0] if len(first_operand) == 1 else None
+    second_constant = second_operand[0] if len(second_operand) == 1 else None
+
+    if isinstance(second_constant, float | int):
+        if isinstance(first_constant, float | int):
+            with contextlib.suppress(ValueError):
+                return [
+                    TRUSTED_BINARY_ARITHMETIC_OPERATIONS[operator](first_constant, second_constant)
+                ]
+
+        match operator:
+            case BinaryArithmeticOperator.ADDITION | BinaryArithmeticOperator.SUBTRACTION if (
+                second_constant == IdentityElements.ADDITIVE_IDENTITY
+            ):
+                return first_operand
+            case BinaryArithmeticOperator.MULTIPLICATION | BinaryArithmeticOperator.DIVISION if (
+                second_constant == IdentityElements.MULTIPLICATIVE_IDENTITY
+            ):
+                return first_operand
+            case BinaryArithmeticOperator.DIVISION if (
+                second_constant != IdentityElements.ADDITIVE_IDENTITY
+            ):
+                operator = BinaryArithmeticOperator.MULTIPLICATION
+                second_operand = [InverseElements.MULTIPLICATIVE_INVERSE / second_constant]
+    elif isinstance(first_constant, float | int):
+        match operator:
+            case BinaryArithmeticOperator.ADDITION if (
+                first_constant == IdentityElements.ADDITIVE_IDENTITY
+            ):
+                return second_operand
+            case BinaryArithmeticOperator.MULTIPLICATION if (
+                first_constant == IdentityElements.MULTIPLICATIVE_IDENTITY
+            ):
+                return second_operand
+
+    first_operand.extend(second_operand)
+    first_operand.append(operator)
+
+    return first_operand
+
+
+def optimise_postfix_expression(
+    postfix_expression: collections.abc.Iterable[BinaryArithmeticOperator | Variable | float],
+) -> list[BinaryArithmeticOperator | Variable | float]:
+    """Fold constant subexpressions and remove redundant operations.
+
+    Parameters
+    ----------
+    postfix_expression : collections.abc.Iterable[BinaryArithmeticOperator | Variable | float]
+        elements of arithmetic expression in postfix format, as produced by
+        `convert_infix_expression`
+
+    Returns
+    -------
+    list[BinaryArithmeticOperator | Variable | float]
+        elements of equivalent arithmetic expression in postfix format
+
+    Notes
+    -----
+    #. Operations on two numbers are replaced by their results, computed as in evaluation.
+    #. Divisions of numbers by zero are kept, so that failure is raised during evaluation.
+    #. Additions and subtractions of `IdentityElements.ADDITIVE_IDENTITY` are removed.
+    #. Multiplications and divisions by `IdentityElements.MULTIPLICATIVE_IDENTITY` are removed.
+    #. Divisions by other numbers become multiplications by their reciprocals, which gives
+       same results as evaluation computes quotients the same way.
+    #. Operands are never reordered or regrouped, as that could change rounding of results.
+    #. Removing addition of zero can turn result ``-0.0`` into ``0.0``.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.simplify import (
+        ...     optimise_postfix_expression,
+        ...     tokenise_expression,
+        ...     convert_infix_expression,
+        ... )
+        >>> postfix_expression = convert_infix_expression(
+        ...     tokenise_expression("(x + 0) * 1 + 2 * 3 / 4", allow_variables=True)
+        ... )
+        >>> len(postfix_expression)
+        11
+        >>> optimise_postfix_expression(postfix_expression)
+        [Variable(name='x'), 1.5, <BinaryArithmeticOperator.ADDITION: '+'>]
+    """
+    stack: list[list[BinaryArithmeticOperator | Variable | float]] = []
+    for element in postfix_expression:
+        if isinstance(element, BinaryArithmeticOperator):
+            second_operand = stack.pop()
+            first_operand = stack.pop()
+
+            stack.append(optimise_binary_operation(first_operand, element, second_operand))
+        else:
+            stack.append([element])
+
+    return stack.pop()
+
+
+@pydantic.validate_call(validate_return=True)
+def substitute_variables(
+    postfix_expression: list[BinaryArithmeticOperator | Variable | float],
+    variable_values: dict[str, float],
+) -> list[BinaryArithmeticOperator | float]:
+    """Replace variables in postfix arithmetic expression with provided numbers.
+
+    Parameters
+    ----------
+    postfix_expression : list[BinaryArithmeticOperator | Variable | float]
+        elements of arithmetic expression in postfix format
+    variable_values : dict[str, float]
+        numbers keyed by variable names, unused names are ignored
+
+    Returns
+    -------
+    list[BinaryArithmeticOperator | float]
+        elements of arithmetic expression in postfix format without variables
+
+    Raises
+    ------
+    ValueError
+        if numbers are not provided for all variables
+    """
+    if missing_variables := {
+        element.name for element in postfix_expression if isinstance(element, Variable)
+    }.difference(variable_values):
+        raise ValueError(f"Missing values for variables: {missing_variables}")
+
+    return [
+        variable_values[element.name] if isinstance(element, Variable) else element
+        for element in postfix_expression
+    ]
+
+
+class CompiledExpression(CustomPydanticBaseModel):
+    """Define arithmetic expression already converted into reverse Polish notation.
+
+    Attributes
+    ----------
+    expression : str
+        standard arithmetic expression
+    postfix_expression : tuple[BinaryArithmeticOperator | Variable | float, ...]
+        elements of arithmetic expression in postfix format
+    variables : tuple[str, ...]
+        sorted names of variables in arithmetic expression
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    expression: str = pydantic.Field(description="standard arithmetic expression")
+    postfix_expression: tuple[BinaryArithmeticOperator | Variable | float, ...] = pydantic.Field(
+        description="elements of arithmetic expression in postfix format"
+    )
+
+    @pydantic.computed_field  # type: ignore[misc] # will allow serialisation
+    @functools.cached_property  # will be computed just once unless deleted
+    def variables(self: "CompiledExpression") -> tuple[str, ...]:
+        """Store names of variables in arithmetic expression.
+
+        Returns
+        -------
+        tuple[str, ...]
+            sorted unique variable names
+        """
+        return tuple(
+            sorted(
+                {
+                    element.name
+                    for element in self.postfix_expression
+                    if isinstance(element, Variable)
+                }
+            )
+        )
+
+    def evaluate(
+        self: "CompiledExpression",
+        validate: bool = True,
+        variable_values: dict[str, float] | None = None,
+    ) -> float:
+        """Evaluate stored postfix expression without parsing it again.
+
+        Parameters
+        ----------
+        validate : bool, optional
+            whether to validate every operation, by default True
+        variable_values : dict[str, float] | None, optional
+            numbers keyed by variable names, by default no variables
+
+        Returns
+        -------
+        float
+            result of arithmetic expression
+        """
+        postfix_expression: collections.abc.Sequence[BinaryArithmeticOperator | float]
+        if self.variables:
+            postfix_expression = substitute_variables(
+                list(self.postfix_expression), variable_values or {}
+            )
+        else:
+            postfix_expression = typing.cast(
+                "tuple[BinaryArithmeticOperator | float, ...]", self.postfix_expression
+            )
+
+        if not validate:
+            return evaluate_trusted_postfix_expression(postfix_expression)
+
+        return evaluate_postfix_expression(list(postfix_expression))
+
+
+@pydantic.validate_call(validate_return=True)
+def compile_expression(
+    expression: str, allow_variables: bool = False, optimise: bool = True
+) -> CompiledExpression:
+    """Parse arithmetic expression once for repeated evaluations.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    allow_variables : bool, optional
+        whether to accept named variables such as ``x`` or ``rate_2``, by default False
+    optimise : bool, optional
+        whether to fold constants and remove redundant operations, by default True
+
+    Returns
+    -------
+    CompiledExpression
+        expression in reverse Polish notation
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with import compile_expression
+        >>> compiled_expression = compile_expression("5 * 6 / (7 + 8) - 9")
+        >>> compiled_expression.evaluate()
+        -7.0
+        >>> compiled_expression = compile_expression("x * (y + 2)", allow_variables=True)
+        >>> compiled_expression.variables
+        ('x', 'y')
+        >>> compiled_expression.evaluate(variable_values={"x": 3, "y": 4})
+        18.0
+
+    Constant parts are evaluated once, during compilation.
+
+    .. code-block:: pycon
+
+        >>> compile_expression("x * (2 + 3) / 1", allow_variables=True).postfix_expression
+        (Variable(name='x'), 5.0, <BinaryArithmeticOperator.MULTIPLICATION: '*'>)
+    """
+    raw_infix_tokens = tokenise_expression(expression, allow_variables=allow_variables)
+    ordered_postfix_tokens = convert_infix_expression(raw_infix_tokens)
+
+    if optimise:
+        ordered_postfix_tokens = optimise_postfix_expression(ordered_postfix_tokens)
+
+    return CompiledExpression.model_construct(
+        expression=expression, postfix_expression=tuple(ordered_postfix_tokens)
+    )
+
+
+def solve_instrumented_simplification(expression: str, validate: bool = True) -> float:
+    """Evaluate arithmetic expression, reporting duration and size of every stage.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    validate : bool, optional
+        whether to validate every intermediate operation, by default True
+
+    Returns
+    -------
+    float
+        result of arithmetic expression
+
+    Notes
+    -----
+    #. Tokens are collected in a list to be counted, unlike in `compile_expression`.
+    #. A stage that fails is not reported.
+    """
+    stage_start = time.perf_counter()
+    infix_tokens = list(tokenise_expression(expression))
+    stage_end = time.perf_counter()
+    report_stage_timing(
+        StageTiming(Stage.TOKENISATION, stage_end - stage_start, len(infix_tokens))
+    )
+
+    stage_start = time.perf_counter()
+    postfix_expression = convert_infix_expression(iter(infix_tokens))
+    stage_end = time.perf_counter()
+    report_stage_timing(
+        StageTiming(Stage.CONVERSION, stage_end - stage_start, len(postfix_expression))
+    )
+
+    compiled_expression = CompiledExpression.model_construct(
+        expression=expression, postfix_expression=tuple(postfix_expression)
+    )
+
+    stage_start = time.perf_counter()
+    expression_value = compiled_expression.evaluate(validate=validate)
+    stage_end = time.perf_counter()
+    report_stage_timing(
+        StageTiming(
+            Stage.EVALUATION,
+            stage_end - stage_start,
+            sum(isinstance(element, BinaryArithmeticOperator) for element in postfix_expression),
+        )
+    )
+
+    return expression_value
+
+
 @pydantic.validate_call(validate_return=True)
-def solve_simplification(expression: str) -> float:
+def solve_simplification(
+    expression: str,
+    cache: pydantic.InstanceOf[BoundedCache[float]] | None = None,
+    validate: bool = True,
+) -> float:
     """Evaluate arithmetic expression.
 
     Parameters
     ----------
     expression : str
         standard arithmetic expression
+    cache : BoundedCache[float] | None, optional
+        cache of results keyed by normalised expressions, by default not used
+    validate : bool, optional
+        whether to validate every intermediate operation, by default True
 
     Returns
     -------
@@ -341,19 +833,76 @@ def solve_simplification(expression: str) -> float:
         -0.5
         >>> solve_simplification("5 * 6 / (7 + 8) - 9")
         -7.0
+
+    Repeated expressions can be answered from a bounded cache.
+
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with import BoundedCache
+        >>> cache = BoundedCache(maximum_size=128)
+        >>> solve_simplification("1 + 2", cache=cache)
+        3.0
+        >>> solve_simplification("1+2", cache=cache)
+        3.0
+        >>> cache.statistics.hits, cache.statistics.misses
+        (1, 1)
+
+    Intermediate operations can skip validation, as parsed numbers are already real numbers.
+
+    .. code-block:: pycon
+
+        >>> solve_simplification("5 * 6 / (7 + 8) - 9", validate=False)
+        -7.0
+
+    Durations of stages are reported only while observers from `instrumentation_module` are
+    registered, and cache hits report nothing.
     """
-    raw_infix_tokens = clean_and_tokenise_expression(expression)
-    ordered_postfix_tokens = convert_infix_expression(raw_infix_tokens)
-    expression_value = evaluate_postfix_expression(ordered_postfix_tokens)
+    if STAGE_OBSERVERS:
+        if cache is not None:
+            return cache.get_or_compute(
+                normalise_expression(expression),
+                lambda clean_expression: solve_instrumented_simplification(
+                    clean_expression, validate=validate
+                ),
+            )
+
+        return solve_instrumented_simplification(expression, validate=validate)
+
+    if cache is not None:
+        return cache.get_or_compute(
+            normalise_expression(expression),
+            lambda clean_expression: compile_expression(clean_expression, optimise=False).evaluate(
+                validate=validate
+            ),
+        )
+
+    compiled_expression = compile_expression(expression, optimise=False)
+    expression_value = compiled_expression.evaluate(validate=validate)
 
     return expression_value
 
 
 __all__ = [
+    "FIRST_CHARACTER_TOKEN_TYPES",
+    "NUMBER_TOKEN_TYPES",
     "OPERATION_PRECEDENCES",
+    "OPERATOR_TOKENS",
+    "CompiledExpression",
     "Parentheses",
+    "TokenType",
+    "Variable",
+    "classify_tokens",
     "clean_and_tokenise_expression",
+    "compile_expression",
     "convert_infix_expression",
     "evaluate_postfix_expression",
+    "evaluate_trusted_postfix_expression",
+    "normalise_expression",
+    "optimise_binary_operation",
+    "optimise_postfix_expression",
+    "solve_instrumented_simplification",
     "solve_simplification",
+    "substitute_variables",
+    "tokenise_expression",
+    "validate_expression_characters",
 ]
@@ -0,0 +1,137 @@
+"""Evaluate streams of arithmetic expressions one at a time."""
+
+import collections.abc
+import typing
+
+import pydantic
+
+from .caching_module import BoundedCache
+from .simplify import solve_simplification
+
+
+class EvaluationRecord(typing.NamedTuple):
+    """Define outcome of evaluating one arithmetic expression.
+
+    Attributes
+    ----------
+    expression : str
+        standard arithmetic expression
+    result : float | None
+        result of arithmetic expression, if evaluation succeeded
+    error : str | None
+        reason of failure, if evaluation failed
+    """
+
+    expression: str
+    result: float | None
+    error: str | None
+
+
+def evaluate_expression(
+    expression: str, cache: BoundedCache[float] | None = None, validate: bool = False
+) -> EvaluationRecord:
+    """Evaluate one arithmetic expression, capturing failure instead of raising it.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    cache : BoundedCache[float] | None, optional
+        cache of results keyed by normalised expressions, by default not used
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Returns
+    -------
+    EvaluationRecord
+        result or reason of failure of evaluation
+    """
+    if not expression.strip():
+        return EvaluationRecord(expression, None, "Empty expression")
+
+    try:
+        result = solve_simplification(expression, cache=cache, validate=validate)
+    except Exception as error:  # noqa: BLE001  # pylint: disable=broad-except
+        return EvaluationRecord(expression, None, " ".join(str(error).split()))
+
+    return EvaluationRecord(expression, result, None)
+
+
+@pydantic.validate_call
+def solve_simplification_stream(
+    expressions: collections.abc.Iterable[str],
+    cache: pydantic.InstanceOf[BoundedCache[float]] | None = None,
+    validate: bool = False,
+) -> collections.abc.Iterator[EvaluationRecord]:
+    """Evaluate arithmetic expressions lazily, one record per expression.
+
+    Parameters
+    ----------
+    expressions : collections.abc.Iterable[str]
+        standard arithmetic expressions, consumed one at a time
+    cache : BoundedCache[float] | None, optional
+        cache of results keyed by normalised expressions, by default not used
+    validate : bool, optional
+        whether to validate every intermediate operation, by default False
+
+    Yields
+    ------
+    EvaluationRecord
+        result or reason of failure of every expression, in order of `expressions`
+
+    Notes
+    -----
+    #. Failures are reported in records and never stop the stream.
+    #. Memory usage does not depend on number of expressions.
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.streaming_module import solve_simplification_stream
+        >>> for record in solve_simplification_stream(["1 + 2", "1 / 0"]):
+        ...     print(record.result, record.error)
+        3.0 None
+        None Division by zero is attempted.
+    """
+    for expression in expressions:
+        yield evaluate_expression(expression, cache=cache, validate=validate)
+
+
+@pydantic.validate_call(validate_return=True)
+def format_evaluation_record(record: EvaluationRecord) -> str:
+    r"""Prepare single line representation of an evaluation record.
+
+    Parameters
+    ----------
+    record : EvaluationRecord
+        result or reason of failure of evaluation
+
+    Returns
+    -------
+    str
+        ``Result = <result>`` or ``Error: <reason>``, terminated by a newline
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> from package_name_to_import_with.streaming_module import (
+        ...     EvaluationRecord,
+        ...     format_evaluation_record,
+        ... )
+        >>> format_evaluation_record(EvaluationRecord("1 + 2", 3.0, None))
+        'Result = 3.0\n'
+    """
+    if record.error is not None:
+        return f"Error: {record.error}\n"
+
+    return f"Result = {record.result}\n"
+
+
+__all__ = [
+    "EvaluationRecord",
+    "evaluate_expression",
+    "format_evaluation_record",
+    "solve_simplification_stream",
+]
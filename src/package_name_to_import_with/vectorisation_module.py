@@ -0,0 +1,328 @@
+"""Evaluate arithmetic expressions over arrays of numbers.
+
+This requires optional dependency ``numpy``, available through ``vectorisation`` extra.
+"""
+
+import collections.abc
+import typing
+
+import numpy
+import numpy.typing
+import pydantic
+
+from .calculator_sub_package import BinaryArithmeticOperator
+from .simplify import Variable, compile_expression
+
+FloatArray = numpy.typing.NDArray[numpy.float64]
+BooleanArray = numpy.typing.NDArray[numpy.bool_]
+MAXIMUM_REPORTED_INDICES = 10
+REAL_NUMBER_KINDS = frozenset("biuf")
+
+VectorisedBinaryArithmeticOperation: typing.TypeAlias = collections.abc.Callable[
+    [FloatArray, FloatArray], FloatArray
+]
+
+
+def detect_zero_division(
+    operator: BinaryArithmeticOperator, second_values: FloatArray
+) -> BooleanArray:
+    """Flag elements where binary arithmetic expression attempts division by zero.
+
+    Parameters
+    ----------
+    operator : BinaryArithmeticOperator
+        kind of binary arithmetic expression
+    second_values : FloatArray
+        right operands
+
+    Returns
+    -------
+    BooleanArray
+        whether division by zero is attempted, per element of `second_values`
+    """
+    if operator is not BinaryArithmeticOperator.DIVISION:
+        return numpy.zeros(numpy.shape(second_values), dtype=numpy.bool_)
+
+    return numpy.equal(second_values, 0)
+
+
+def find_zero_division_indices(
+    operator: BinaryArithmeticOperator, second_values: FloatArray
+) -> numpy.typing.NDArray[numpy.intp]:
+    """Locate elements where binary arithmetic expression attempts division by zero.
+
+    Parameters
+    ----------
+    operator : BinaryArithmeticOperator
+        kind of binary arithmetic expression
+    second_values : FloatArray
+        right operands
+
+    Returns
+    -------
+    numpy.typing.NDArray[numpy.intp]
+        flat indices of offending elements, in row-major order
+    """
+    return numpy.flatnonzero(detect_zero_division(operator, second_values))
+
+
+def divide_arrays(dividend: FloatArray, divisor: FloatArray) -> FloatArray:
+    """Perform element-wise division, treating division by zero as division by one.
+
+    Parameters
+    ----------
+    dividend : FloatArray
+        numbers which are divided
+    divisor : FloatArray
+        numbers which divide
+
+    Returns
+    -------
+    FloatArray
+        quotients of `dividend` by `divisor`, meaningless where `divisor` is zero
+
+    Notes
+    -----
+    #. Multiplies by reciprocal like `divide_numbers`, so that results match exactly.
+    #. Callers are expected to mask elements where `divisor` is zero.
+    """
+    safe_divisor = numpy.where(divisor == 0, 1.0, divisor)
+
+    return numpy.multiply(dividend, numpy.reciprocal(safe_divisor))
+
+
+def convert_to_float_array(inputs: numpy.typing.ArrayLike) -> FloatArray:
+    """Convert operands to array of floating point numbers, refusing anything else.
+
+    Parameters
+    ----------
+    inputs : numpy.typing.ArrayLike
+        operands, as an array, a buffer-protocol object or a sequence of numbers
+
+    Returns
+    -------
+    FloatArray
+        operands as floating point numbers
+
+    Raises
+    ------
+    ValueError
+        if operands are not booleans, integers or floating point numbers
+
+    Notes
+    -----
+    #. Casting directly to ``float64`` silently turns ``None`` into ``nan``, so data type
+       inferred by ``numpy`` is checked first.
+    #. Strings, complex numbers and objects are rejected, even if they could be cast.
+    """
+    values = numpy.asarray(inputs)
+
+    if values.dtype.kind not in REAL_NUMBER_KINDS:
+        raise ValueError(f"Operands must be real numbers, not {values.dtype}")
+
+    return values.astype(numpy.float64, copy=False)
+
+
+VECTORISED_BINARY_ARITHMETIC_OPERATIONS: dict[
+    BinaryArithmeticOperator, VectorisedBinaryArithmeticOperation
+] = {
+    BinaryArithmeticOperator.ADDITION: numpy.add,
+    BinaryArithmeticOperator.SUBTRACTION: numpy.subtract,
+    BinaryArithmeticOperator.MULTIPLICATION: numpy.multiply,
+    BinaryArithmeticOperator.DIVISION: divide_arrays,
+}
+
+
+def calculate_results_batch(
+    first_inputs: numpy.typing.ArrayLike,
+    operator: BinaryArithmeticOperator | str,
+    second_inputs: numpy.typing.ArrayLike,
+) -> FloatArray:
+    """Perform basic binary arithmetic expressions element-wise over arrays of numbers.
+
+    Parameters
+    ----------
+    first_inputs : numpy.typing.ArrayLike
+        left operands, as an array, a buffer-protocol object or a sequence of numbers
+    operator : BinaryArithmeticOperator | str
+        kind of binary arithmetic expression
+    second_inputs : numpy.typing.ArrayLike
+        right operands, broadcastable to shape of `first_inputs`
+
+    Returns
+    -------
+    FloatArray
+        results of binary arithmetic expressions
+
+    Raises
+    ------
+    ValueError
+        if `operator` is not supported
+    ValueError
+        if operands are not real numbers or shapes are not broadcastable
+    ValueError
+        if division by zero is attempted for any element, with offending indices
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> import array
+        >>> from package_name_to_import_with.vectorisation_module import calculate_results_batch
+        >>> calculate_results_batch(array.array("d", [1, 2, 3]), "/", [2, 4, 8])
+        array([0.5  , 0.5  , 0.375])
+        >>> calculate_results_batch([1, 2, 3], "/", [2, 0, 0])
+        Traceback (most recent call last):
+        ...
+        ValueError: Division by zero is attempted at 2 indices: [1, 2]
+    """
+    valid_operator = BinaryArithmeticOperator(operator)
+    first_values = convert_to_float_array(first_inputs)
+    second_values = convert_to_float_array(second_inputs)
+
+    result_shape = numpy.broadcast_shapes(first_values.shape, second_values.shape)
+    zero_division_indices = find_zero_division_indices(
+        valid_operator, numpy.broadcast_to(second_values, result_shape)
+    )
+
+    if zero_division_indices.size:
+        raise ValueError(
+            f"Division by zero is attempted at {zero_division_indices.size} indices: "
+            f"{zero_division_indices[:MAXIMUM_REPORTED_INDICES].tolist()}"
+        )
+
+    with numpy.errstate(all="ignore"):
+        return VECTORISED_BINARY_ARITHMETIC_OPERATIONS[valid_operator](first_values, second_values)
+
+
+def evaluate_postfix_expression_batch(
+    postfix_expression: collections.abc.Iterable[BinaryArithmeticOperator | Variable | float],
+    columns: collections.abc.Mapping[str, FloatArray],
+) -> numpy.ma.MaskedArray:
+    """Evaluate postfix arithmetic expression with whole-array operations.
+
+    Parameters
+    ----------
+    postfix_expression : collections.abc.Iterable[BinaryArithmeticOperator | Variable | float]
+        elements of arithmetic expression in postfix format
+    columns : collections.abc.Mapping[str, FloatArray]
+        arrays of numbers keyed by variable names, all broadcastable to a common shape
+
+    Returns
+    -------
+    numpy.ma.MaskedArray
+        results of arithmetic expression, masked where division by zero is attempted
+
+    Notes
+    -----
+    #. Stack holds pairs of values and masks of division by zero.
+    #. Masks propagate through later operations, so affected elements stay masked.
+    #. Overflows follow floating point arithmetic of Python and are not masked.
+    """
+    stack: list[tuple[FloatArray, BooleanArray]] = []
+
+    with numpy.errstate(all="ignore"):
+        for element in postfix_expression:
+            if isinstance(element, BinaryArithmeticOperator):
+                second_values, second_mask = stack.pop()
+                first_values, first_mask = stack.pop()
+
+                operation_values = VECTORISED_BINARY_ARITHMETIC_OPERATIONS[element](
+                    first_values, second_values
+                )
+                operation_mask = (
+                    first_mask | second_mask | detect_zero_division(element, second_values)
+                )
+
+                stack.append((operation_values, operation_mask))
+            elif isinstance(element, Variable):
+                stack.append((columns[element.name], numpy.zeros((), dtype=numpy.bool_)))
+            else:
+                stack.append(
+                    (
+                        numpy.asarray(element, dtype=numpy.float64),
+                        numpy.zeros((), dtype=numpy.bool_),
+                    )
+                )
+
+    result_values, result_mask = stack.pop()
+    result_shape = numpy.broadcast_shapes(result_values.shape, result_mask.shape)
+    result_mask = numpy.broadcast_to(result_mask, result_shape)
+
+    return numpy.ma.MaskedArray(
+        numpy.where(result_mask, numpy.nan, result_values), mask=result_mask
+    )
+
+
+@pydantic.validate_call(validate_return=True)
+def solve_simplification_batch(
+    expression: str, /, **columns: pydantic.InstanceOf[numpy.ndarray]
+) -> pydantic.InstanceOf[numpy.ma.MaskedArray]:
+    """Evaluate arithmetic expression with variables over arrays of numbers.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression with variables
+    **columns : numpy.ndarray
+        arrays of numbers keyed by variable names, unused names are ignored, any name is
+        allowed as `expression` is positional only
+
+    Returns
+    -------
+    numpy.ma.MaskedArray
+        results of arithmetic expression, masked where division by zero is attempted
+
+    Raises
+    ------
+    ValueError
+        if arrays are not provided for all variables
+    ValueError
+        if arrays of variables are not real numbers
+
+    Examples
+    --------
+    .. code-block:: pycon
+
+        >>> import numpy
+        >>> from package_name_to_import_with.vectorisation_module import (
+        ...     solve_simplification_batch,
+        ... )
+        >>> solve_simplification_batch(
+        ...     "x * (y + 2) / z",
+        ...     x=numpy.array([1.0, 2.0, 3.0]),
+        ...     y=numpy.array([4.0, 5.0, 6.0]),
+        ...     z=numpy.array([2.0, 0.0, 4.0]),
+        ... )
+        masked_array(data=[3.0, --, 6.0],
+                     mask=[False,  True, False],
+               fill_value=1e+20)
+    """
+    compiled_expression = compile_expression(expression, allow_variables=True)
+
+    if missing_variables := set(compiled_expression.variables).difference(columns):
+        raise ValueError(f"Missing values for variables: {missing_variables}")
+
+    float_columns = {
+        variable: convert_to_float_array(columns[variable])
+        for variable in compiled_expression.variables
+    }
+
+    return evaluate_postfix_expression_batch(compiled_expression.postfix_expression, float_columns)
+
+
+__all__ = [
+    "MAXIMUM_REPORTED_INDICES",
+    "REAL_NUMBER_KINDS",
+    "VECTORISED_BINARY_ARITHMETIC_OPERATIONS",
+    "BooleanArray",
+    "FloatArray",
+    "VectorisedBinaryArithmeticOperation",
+    "calculate_results_batch",
+    "convert_to_float_array",
+    "detect_zero_division",
+    "divide_arrays",
+    "evaluate_postfix_expression_batch",
+    "find_zero_division_indices",
+    "solve_simplification_batch",
+]
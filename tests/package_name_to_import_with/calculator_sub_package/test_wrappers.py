@@ -7,10 +7,21 @@
 import pytest
 
 from package_name_to_import_with.calculator_sub_package import (
+    BinaryArithmeticExpression,
     BinaryArithmeticOperator,
+    BinaryArithmeticRecord,
     calculate_results,
+    validate_binary_arithmetic_expressions,
+    validate_binary_arithmetic_expressions_json,
 )
 
+BULK_EXPRESSIONS = [
+    {"left_operand": 1, "binary_operator": "+", "right_operand": 2},
+    {"left_operand": 5, "binary_operator": "-", "right_operand": 7},
+    {"left_operand": 3, "binary_operator": "*", "right_operand": 0.5},
+    {"left_operand": 1, "binary_operator": "/", "right_operand": 3},
+]
+
 
 def test_successful_operation(
     first_number: float,
@@ -67,3 +78,79 @@ def test_operation_failure(
     """
     with pytest.raises(pydantic.ValidationError):
         calculate_results(first_input, operator, second_input)
+
+
+@pytest.mark.parametrize("compute_results", [True, False])
+def test_bulk_validation(compute_results: bool) -> None:
+    """Check bulk validation matches validation of expressions one by one.
+
+    Parameters
+    ----------
+    compute_results : bool
+        whether results are computed during bulk validation
+    """
+    arithmetic_expressions = validate_binary_arithmetic_expressions(
+        iter(BULK_EXPRESSIONS), compute_results=compute_results
+    )
+    expected_expressions = [
+        BinaryArithmeticExpression.model_validate(expression) for expression in BULK_EXPRESSIONS
+    ]
+
+    assert arithmetic_expressions == expected_expressions  # nosec B101
+    assert [  # nosec B101
+        arithmetic_expression.model_dump() for arithmetic_expression in arithmetic_expressions
+    ] == [expected_expression.model_dump() for expected_expression in expected_expressions]
+
+
+def test_bulk_json_validation() -> None:
+    """Check bulk validation of JSON matches validation of equivalent mappings."""
+    arithmetic_expressions = validate_binary_arithmetic_expressions_json(
+        pydantic.TypeAdapter(list[dict[str, typing.Any]]).dump_json(BULK_EXPRESSIONS)
+    )
+
+    assert arithmetic_expressions == validate_binary_arithmetic_expressions(  # nosec B101
+        BULK_EXPRESSIONS
+    )
+
+
+def test_bulk_validation_failure() -> None:
+    """Check bulk validation locates every invalid expression by its position."""
+    with pytest.raises(pydantic.ValidationError) as error_information:
+        validate_binary_arithmetic_expressions(
+            [
+                *BULK_EXPRESSIONS,
+                {"left_operand": 1, "binary_operator": "/", "right_operand": 0},
+                {"left_operand": "not_number", "binary_operator": "+", "right_operand": 1},
+            ]
+        )
+
+    error_positions = {error["loc"][0] for error in error_information.value.errors()}
+    assert error_positions == {len(BULK_EXPRESSIONS), len(BULK_EXPRESSIONS) + 1}  # nosec B101
+
+
+def test_record_matches_expression() -> None:
+    """Check records give same fields, computed ones included, as validated expressions."""
+    for arithmetic_expression in validate_binary_arithmetic_expressions(BULK_EXPRESSIONS):
+        arithmetic_record = BinaryArithmeticRecord.from_expression(arithmetic_expression)
+
+        assert arithmetic_record.model_dump() == arithmetic_expression.model_dump()  # nosec B101
+        assert arithmetic_record.to_expression() == arithmetic_expression  # nosec B101
+        assert arithmetic_record == BinaryArithmeticRecord(  # nosec B101
+            arithmetic_expression.left_operand,
+            arithmetic_expression.binary_operator,
+            arithmetic_expression.right_operand,
+        )
+        assert hash(arithmetic_record) == hash(  # nosec B101
+            BinaryArithmeticRecord.from_expression(arithmetic_expression)
+        )
+
+
+def test_record_zero_division() -> None:
+    """Check records fail lazily on division by zero."""
+    arithmetic_record = BinaryArithmeticRecord(1.0, BinaryArithmeticOperator.DIVISION, 0.0)
+
+    with pytest.raises(ValueError, match="Division by zero"):
+        _ = arithmetic_record.result
+
+    with pytest.raises(pydantic.ValidationError):
+        arithmetic_record.to_expression()
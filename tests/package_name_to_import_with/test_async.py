@@ -0,0 +1,183 @@
+"""Define unit tests for asynchronous evaluation of arithmetic expressions."""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+import typing
+
+import pytest
+
+from package_name_to_import_with import async_module
+from package_name_to_import_with.async_module import (
+    evaluate_expression_async,
+    run_evaluation,
+    solve_many_async,
+    solve_many_async_stream,
+    solve_simplification_async,
+)
+from package_name_to_import_with.simplify import solve_simplification
+from package_name_to_import_with.streaming_module import solve_simplification_stream
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+EXPRESSIONS = [f"{number} / ({number % 3} - 1)" for number in range(50)]
+LONG_EXPRESSION = " + ".join(["1"] * 1000)
+MAXIMUM_IN_FLIGHT = 3
+
+
+@pytest.mark.parametrize("expression", ["5 * 6 / (7 + 8) - 9", LONG_EXPRESSION])
+def test_solve_simplification_async(expression: str) -> None:
+    """Check asynchronous result matches synchronous result, inline and in executor.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    """
+    result = asyncio.run(solve_simplification_async(expression))
+
+    assert result == solve_simplification(expression)  # nosec B101
+
+
+def test_solve_simplification_async_executor() -> None:
+    """Check evaluation runs in given executor."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        result = asyncio.run(solve_simplification_async("1 + 2", executor=executor))
+
+    assert result == solve_simplification("1 + 2")  # nosec B101
+
+
+def test_solve_simplification_async_timeout() -> None:
+    """Check failure when evaluation in executor takes longer than timeout."""
+    release = threading.Event()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        _ = executor.submit(release.wait)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(solve_simplification_async("1 + 2", executor=executor, timeout=0.01))
+
+        release.set()
+
+
+def test_solve_many_async_order() -> None:
+    """Check asynchronous records match serial records in order."""
+    serial_records = list(solve_simplification_stream(EXPRESSIONS))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        records = asyncio.run(
+            solve_many_async(EXPRESSIONS, executor=executor, maximum_in_flight=7)
+        )
+
+    assert records == serial_records  # nosec B101
+
+
+def test_solve_many_async_timeout() -> None:
+    """Check timeouts are reported in records without stopping evaluation."""
+    release = threading.Event()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        _ = executor.submit(release.wait)
+        records = asyncio.run(solve_many_async(["1 + 2"], executor=executor, timeout=0.01))
+        release.set()
+
+    assert records[0].error == "Evaluation timed out after 0.01 seconds"  # nosec B101
+
+
+def test_solve_many_async_stream_backpressure() -> None:
+    """Check input is consumed only as far as allowed by maximum number in flight."""
+    consumed_expressions: list[str] = []
+
+    def generate_expressions() -> "collections.abc.Iterator[str]":
+        for expression in EXPRESSIONS:
+            consumed_expressions.append(expression)
+            yield expression
+
+    async def read_first_record() -> None:
+        records = solve_many_async_stream(
+            generate_expressions(), maximum_in_flight=MAXIMUM_IN_FLIGHT
+        )
+        _ = await anext(records)
+        await records.aclose()
+
+    asyncio.run(read_first_record())
+
+    assert len(consumed_expressions) == MAXIMUM_IN_FLIGHT  # nosec B101
+
+
+def test_solve_many_async_maximum_in_flight_failure() -> None:
+    """Check failure for non-positive maximum number of evaluations in flight."""
+    with pytest.raises(ValueError, match="greater than 0"):
+        asyncio.run(solve_many_async(EXPRESSIONS, maximum_in_flight=0))
+
+
+def test_shared_submission_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check concurrent callers never run more evaluations in executor than shared limit.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        fixture lowering limit of evaluations in executor
+    """
+    monkeypatch.setattr(async_module, "MAXIMUM_EXECUTOR_SUBMISSIONS", 2)
+    counter_lock = threading.Lock()
+    running_evaluations = 0
+    peak_running_evaluations = 0
+
+    def evaluation() -> float:
+        nonlocal running_evaluations, peak_running_evaluations
+
+        with counter_lock:
+            running_evaluations += 1
+            peak_running_evaluations = max(peak_running_evaluations, running_evaluations)
+
+        time.sleep(0.01)
+
+        with counter_lock:
+            running_evaluations -= 1
+
+        return 1.0
+
+    async def evaluate_concurrently(executor: concurrent.futures.Executor) -> list[float]:
+        return list(
+            await asyncio.gather(
+                *(run_evaluation(evaluation, inline=False, executor=executor) for _ in range(10))
+            )
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = asyncio.run(evaluate_concurrently(executor))
+
+    assert results == [1.0] * 10  # nosec B101
+    assert peak_running_evaluations == 2  # nosec B101 # noqa: PLR2004
+
+
+def test_timed_out_evaluation_keeps_submission(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check evaluation abandoned after timeout counts against limit until it finishes.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        fixture lowering limit of evaluations in executor
+    """
+    monkeypatch.setattr(async_module, "MAXIMUM_EXECUTOR_SUBMISSIONS", 1)
+    release = threading.Event()
+
+    async def evaluate_after_timeout(executor: concurrent.futures.Executor) -> tuple[str, float]:
+        with pytest.raises(asyncio.TimeoutError):
+            await run_evaluation(release.wait, inline=False, executor=executor, timeout=0.01)
+
+        waiting_record = await evaluate_expression_async("1 + 2", executor=executor, timeout=0.05)
+        release.set()
+
+        return str(waiting_record.error), await solve_simplification_async(
+            "1 + 2", executor=executor, timeout=1
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        error, result = asyncio.run(evaluate_after_timeout(executor))
+
+    assert error == "Evaluation timed out after 0.05 seconds"  # nosec B101
+    assert result == solve_simplification("1 + 2")  # nosec B101
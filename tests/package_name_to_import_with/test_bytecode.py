@@ -0,0 +1,89 @@
+"""Define unit tests for array-backed bytecode of arithmetic expressions."""
+
+import math
+import pickle  # nosec B403
+
+import pytest
+
+from package_name_to_import_with import compile_expression
+from package_name_to_import_with.bytecode_module import ExpressionBytecode, compile_bytecode
+
+
+@pytest.mark.parametrize(
+    ("expression", "variable_values"),
+    [
+        ("11+(12-13)*14/ -15", {}),
+        ("x * (y + 2) / z", {"x": 3, "y": -4.5, "z": 2}),
+        ("rate_2 / -2 - (x1) + rate_2", {"rate_2": 5, "x1": 6}),
+    ],
+)
+def test_bytecode_evaluation(expression: str, variable_values: dict[str, float]) -> None:
+    """Check bytecode evaluates to same result as compiled expression.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression with variables
+    variable_values : dict[str, float]
+        numbers keyed by variable names
+    """
+    compiled_expression = compile_expression(expression, allow_variables=True, optimise=False)
+    bytecode = ExpressionBytecode.from_postfix_expression(compiled_expression.postfix_expression)
+
+    assert bytecode.to_postfix_expression() == list(  # nosec B101
+        compiled_expression.postfix_expression
+    )
+    assert bytecode.variables == compiled_expression.variables  # nosec B101
+    assert math.isclose(  # nosec B101
+        bytecode.evaluate(variable_values),
+        compiled_expression.evaluate(variable_values=variable_values),
+    )
+
+
+def test_bytecode_serialisation() -> None:
+    """Check bytecode survives pickling and byte serialisation with same hash."""
+    bytecode = compile_bytecode("(a - 1.5) * b / 3", allow_variables=True)
+
+    for restored_bytecode in [
+        pickle.loads(pickle.dumps(bytecode)),  # noqa: S301 # nosec B301
+        ExpressionBytecode.from_bytes(bytecode.to_bytes()),
+    ]:
+        assert restored_bytecode == bytecode  # nosec B101
+        assert hash(restored_bytecode) == hash(bytecode)  # nosec B101
+        assert restored_bytecode.evaluate({"a": 4.5, "b": 2}) == 2.0  # nosec B101 # noqa: PLR2004
+
+
+def test_bytecode_size() -> None:
+    """Check bytecode stores large expressions in one byte per operator."""
+    number_of_operands = 1000
+    bytecode = compile_bytecode(" + ".join(["x"] * number_of_operands), allow_variables=True)
+
+    assert len(bytecode.opcodes) == 2 * number_of_operands - 1  # nosec B101
+    assert bytecode.nbytes == len(bytecode.opcodes) + 2 * number_of_operands  # nosec B101
+
+
+@pytest.mark.parametrize(
+    ("expression", "variable_values", "error"),
+    [
+        ("x + 1", {"y": 1}, "Missing values for variables"),
+        ("x / 0", {"x": 1}, "Division by zero is attempted"),
+    ],
+)
+def test_bytecode_evaluation_failure(
+    expression: str, variable_values: dict[str, float], error: str
+) -> None:
+    """Check failures of bytecode evaluation.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression with variables
+    variable_values : dict[str, float]
+        numbers keyed by variable names
+    error : str
+        expected error message
+    """
+    bytecode = compile_bytecode(expression, allow_variables=True)
+
+    with pytest.raises(ValueError, match=error):
+        bytecode.evaluate(variable_values)
@@ -0,0 +1,65 @@
+"""Define unit tests for bounded caches."""
+
+import math
+
+import pytest
+
+from package_name_to_import_with import BoundedCache, EvictionPolicy, solve_simplification
+
+
+def test_cached_simplification() -> None:
+    """Check expressions differing only in spaces share one cache entry."""
+    cache: BoundedCache[float] = BoundedCache(maximum_size=4)
+
+    first_result = solve_simplification("1 + 2 * 3", cache=cache)
+    second_result = solve_simplification("1+2*3", cache=cache)
+
+    assert first_result == second_result  # nosec B101
+    assert cache.statistics.hits == 1  # nosec B101
+    assert cache.statistics.misses == 1  # nosec B101
+    assert cache.statistics.size == 1  # nosec B101
+    assert math.isclose(cache.statistics.hit_ratio, 1 / 2)  # nosec B101
+
+
+@pytest.mark.parametrize(
+    ("eviction_policy", "retained_key"),
+    [(EvictionPolicy.LEAST_RECENTLY_USED, "a"), (EvictionPolicy.FIRST_IN_FIRST_OUT, "b")],
+)
+def test_cache_eviction(eviction_policy: EvictionPolicy, retained_key: str) -> None:
+    """Check entries are discarded following eviction policy.
+
+    Parameters
+    ----------
+    eviction_policy : EvictionPolicy
+        strategy to discard entries from a full cache
+    retained_key : str
+        key expected to survive eviction
+    """
+    cache: BoundedCache[str] = BoundedCache(maximum_size=2, eviction_policy=eviction_policy)
+
+    for key in ["a", "b", "a", "c"]:
+        cache.get_or_compute(key, str.upper)
+
+    assert retained_key in cache  # nosec B101
+    assert "c" in cache  # nosec B101
+    assert len(cache) == cache.maximum_size  # nosec B101
+    assert cache.statistics.evictions == 1  # nosec B101
+
+
+def test_cache_failure_not_stored() -> None:
+    """Check failed evaluations are raised every time and never stored."""
+    cache: BoundedCache[float] = BoundedCache(maximum_size=4)
+
+    number_of_attempts = 2
+    for _ in range(number_of_attempts):
+        with pytest.raises(ValueError, match=r"Division by zero is attempted\."):
+            solve_simplification("1 / 0", cache=cache)
+
+    assert len(cache) == 0  # nosec B101
+    assert cache.statistics.misses == number_of_attempts  # nosec B101
+
+
+def test_cache_size_failure() -> None:
+    """Check failure for non-positive cache sizes."""
+    with pytest.raises(ValueError, match="Cache size must be positive"):
+        BoundedCache(maximum_size=0)
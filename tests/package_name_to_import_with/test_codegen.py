@@ -0,0 +1,111 @@
+"""Define unit tests for Python functions generated from arithmetic expressions."""
+
+import inspect
+import math
+
+import pytest
+
+from package_name_to_import_with import BinaryArithmeticOperator, compile_expression
+from package_name_to_import_with.codegen_module import (
+    compile_function,
+    generate_function,
+    generate_source,
+)
+
+
+@pytest.mark.parametrize("optimise", [False, True])
+@pytest.mark.parametrize(
+    ("expression", "variable_values"),
+    [
+        ("11+(12-13)*14/ -15", {}),
+        ("x * (y + 2) / z", {"x": 3, "y": -4.5, "z": 2}),
+        ("rate_2 / -2 - (x1) + rate_2", {"rate_2": 5, "x1": 6}),
+        ("0.1 + 0.2 * x / 3 - x", {"x": 7}),
+        ("x", {"x": 4}),
+    ],
+)
+def test_generated_evaluation(
+    expression: str, variable_values: dict[str, float], optimise: bool
+) -> None:
+    """Check generated function evaluates to exactly same result as compiled expression.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression with variables
+    variable_values : dict[str, float]
+        numbers keyed by variable names
+    optimise : bool
+        whether to fold constants and remove redundant operations
+    """
+    compiled_expression = compile_expression(expression, allow_variables=True, optimise=optimise)
+    generated_function = generate_function(expression, allow_variables=True, optimise=optimise)
+
+    result = generated_function(
+        *(variable_values[variable] for variable in compiled_expression.variables)
+    )
+
+    assert isinstance(result, float)  # nosec B101
+    assert result == compiled_expression.evaluate(  # nosec B101
+        validate=False, variable_values=variable_values
+    )
+
+
+def test_zero_division_failure() -> None:
+    """Check division by zero raises same error as evaluation."""
+    generated_function = generate_function("1 / (x - x)", allow_variables=True)
+
+    with pytest.raises(ValueError, match="Division by zero is attempted"):
+        generated_function(1)
+
+
+def test_reserved_parameter_names() -> None:
+    """Check keywords and reserved names are replaced, keeping positional order."""
+    generated_function = generate_function("if - float + stack_0 * z", allow_variables=True)
+    parameters = inspect.signature(generated_function).parameters
+
+    assert list(parameters)[-1] == "z"  # nosec B101
+    assert all(  # nosec B101
+        parameter.kind == inspect.Parameter.POSITIONAL_ONLY for parameter in parameters.values()
+    )
+    assert generated_function(1, 2, 3, 4) == 2 - 1 + 3 * 4  # nosec B101
+
+
+def test_long_expression() -> None:
+    """Check expressions beyond limits of nested Python source are compiled."""
+    number_of_operands = 10000
+    expression = "(" * 500 + " + ".join(["1"] * number_of_operands) + ")" * 500
+
+    assert generate_function(expression, optimise=False)() == number_of_operands  # nosec B101
+
+
+def test_non_finite_constants() -> None:
+    """Check infinite and missing numbers are written as valid source."""
+    postfix_expression = [float("inf"), float("nan"), BinaryArithmeticOperator.ADDITION]
+
+    assert 'float("inf")' in generate_source(postfix_expression)  # nosec B101
+    assert math.isnan(compile_function(postfix_expression)())  # nosec B101
+
+
+@pytest.mark.parametrize(
+    ("postfix_expression", "error"),
+    [
+        ([1.0, BinaryArithmeticOperator.ADDITION], "lacks operands"),
+        ([1.0, 2.0], "2 operands remain instead of one"),
+        ([], "0 operands remain instead of one"),
+    ],
+)
+def test_malformed_postfix_expression_failure(
+    postfix_expression: list[BinaryArithmeticOperator | float], error: str
+) -> None:
+    """Check malformed postfix expressions are reported instead of failing to unpack.
+
+    Parameters
+    ----------
+    postfix_expression : list[BinaryArithmeticOperator | float]
+        elements in postfix format which do not form one expression
+    error : str
+        expected part of error message
+    """
+    with pytest.raises(ValueError, match=f"^Malformed postfix expression: .*{error}"):
+        generate_source(postfix_expression)
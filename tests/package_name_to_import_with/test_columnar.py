@@ -0,0 +1,169 @@
+"""Define unit tests for columnar export of results of binary arithmetic expressions."""
+
+import csv
+import io
+import math
+import pickle  # nosec B403
+
+import pydantic
+import pytest
+
+from package_name_to_import_with.calculator_sub_package import (
+    BinaryArithmeticOperator,
+    BinaryArithmeticRecord,
+    calculate_results,
+    validate_binary_arithmetic_expressions,
+)
+from package_name_to_import_with.columnar_module import (
+    COLUMNAR_HEADER,
+    CSV_HEADER,
+    ResultColumns,
+    ResultStatus,
+    tabulate_results,
+)
+
+LEFT_OPERANDS = [1.5, -4.0, 123456.789, 7.0, 1.0]
+BINARY_OPERATORS = [*BinaryArithmeticOperator, BinaryArithmeticOperator.DIVISION]
+RIGHT_OPERANDS = [2.25, 3.0, -0.000321, 8.0, 0.0]
+
+
+@pytest.fixture(name="result_columns")
+def fixture_result_columns() -> ResultColumns:
+    """Evaluate binary arithmetic expressions with one division by zero.
+
+    Returns
+    -------
+    ResultColumns
+        expressions and results in typed columns
+    """
+    return tabulate_results(LEFT_OPERANDS, BINARY_OPERATORS, RIGHT_OPERANDS)
+
+
+def test_results_match_calculation(result_columns: ResultColumns) -> None:
+    """Check results match validated calculation, and failures are flagged.
+
+    Parameters
+    ----------
+    result_columns : ResultColumns
+        expressions and results in typed columns
+    """
+    for (
+        left_operand,
+        binary_operator,
+        right_operand,
+        result,
+        status,
+    ) in result_columns.iterate_rows():
+        if status is ResultStatus.ZERO_DIVISION:
+            assert math.isnan(result)  # nosec B101
+
+            with pytest.raises(pydantic.ValidationError):
+                calculate_results(left_operand, binary_operator, right_operand)
+        else:
+            assert result == calculate_results(  # nosec B101
+                left_operand, binary_operator, right_operand
+            )
+
+    assert len(result_columns) == len(LEFT_OPERANDS)  # nosec B101
+    assert result_columns.statuses.count(ResultStatus.ZERO_DIVISION) == 1  # nosec B101
+
+
+def test_expressions_and_records_match_operands(result_columns: ResultColumns) -> None:
+    """Check appending validated expressions or records gives same columns as operands.
+
+    Parameters
+    ----------
+    result_columns : ResultColumns
+        expressions and results in typed columns
+    """
+    arithmetic_expressions = validate_binary_arithmetic_expressions(
+        {"left_operand": left_operand, "binary_operator": operator, "right_operand": right_operand}
+        for left_operand, operator, right_operand in zip(
+            LEFT_OPERANDS[:-1], BINARY_OPERATORS[:-1], RIGHT_OPERANDS[:-1], strict=True
+        )
+    )
+    expression_columns = ResultColumns()
+    expression_columns.extend_expressions(arithmetic_expressions)
+    expression_columns.extend_expressions(
+        [BinaryArithmeticRecord(LEFT_OPERANDS[-1], BINARY_OPERATORS[-1], RIGHT_OPERANDS[-1])]
+    )
+
+    assert expression_columns == result_columns  # nosec B101
+
+
+def test_csv_export(result_columns: ResultColumns) -> None:
+    """Check CSV export has header and one row per expression.
+
+    Parameters
+    ----------
+    result_columns : ResultColumns
+        expressions and results in typed columns
+    """
+    header, *rows = csv.reader(io.StringIO(result_columns.to_csv()))
+
+    assert tuple(header) == CSV_HEADER  # nosec B101
+    operator_symbols = [str(operator) for operator in BINARY_OPERATORS]
+    assert [row[1] for row in rows] == operator_symbols  # nosec B101
+    assert [float(row[3]) for row in rows[:-1]] == list(result_columns.results[:-1])  # nosec B101
+    assert rows[-1][3:] == ["nan", "zero_division"]  # nosec B101
+
+
+def test_binary_export(result_columns: ResultColumns) -> None:
+    """Check binary export survives round trips, including pickling, with fixed size.
+
+    Parameters
+    ----------
+    result_columns : ResultColumns
+        expressions and results in typed columns
+    """
+    data = result_columns.to_bytes()
+
+    assert len(data) == COLUMNAR_HEADER.size + result_columns.nbytes  # nosec B101
+    assert result_columns.nbytes == 26 * len(result_columns)  # nosec B101
+
+    for restored_columns in [
+        ResultColumns.from_bytes(data),
+        pickle.loads(pickle.dumps(result_columns)),  # noqa: S301 # nosec B301
+    ]:
+        assert restored_columns == result_columns  # nosec B101
+        assert (
+            list(restored_columns.iterate_rows())[:-1]
+            == list(result_columns.iterate_rows())[:-1]  # nosec B101
+        )
+
+
+@pytest.mark.parametrize(
+    ("data", "error"),
+    [
+        (b"PNRC", "too short"),
+        (b"JUNK" + bytes(COLUMNAR_HEADER.size), "Unsupported columnar results format"),
+        (COLUMNAR_HEADER.pack(b"PNRC", 1, 2) + bytes(10), "truncated"),
+        (COLUMNAR_HEADER.pack(b"PNRC", 1, 0) + bytes(1), "1 trailing bytes"),
+        (
+            COLUMNAR_HEADER.pack(b"PNRC", 1, 1) + bytes(8) + b"\x00" + bytes(16) + b"\x00",
+            "operator",
+        ),
+        (
+            COLUMNAR_HEADER.pack(b"PNRC", 1, 1) + bytes(8) + b"\x02" + bytes(16) + b"\x07",
+            "statuses",
+        ),
+    ],
+)
+def test_binary_import_failure(data: bytes, error: str) -> None:
+    """Check invalid binary data is rejected.
+
+    Parameters
+    ----------
+    data : bytes
+        data which is not a complete columnar export
+    error : str
+        expected part of error message
+    """
+    with pytest.raises(ValueError, match=error):
+        ResultColumns.from_bytes(data)
+
+
+def test_tabulation_failure() -> None:
+    """Check operands and operators of different lengths are rejected."""
+    with pytest.raises(ValueError, match="same lengths"):
+        tabulate_results([1, 2], ["+"], [3, 4])
@@ -0,0 +1,219 @@
+"""Define unit tests for garbage collection policies."""
+
+import gc
+import typing
+
+import pytest
+
+from package_name_to_import_with.garbage_collection_module import (
+    GarbageCollectionPolicy,
+    GarbageCollector,
+    define_garbage_collection_decorator,
+    monitor_collection_pauses,
+    pause_garbage_collection,
+)
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+NUMBER_OF_CALLS = 12
+
+
+class ReferenceCycle:
+    """Define object referencing itself, freed only by cyclic garbage collection."""
+
+    def __init__(self: "ReferenceCycle") -> None:
+        self.reference = self
+
+
+def create_reference_cycle() -> None:
+    """Create and drop a reference cycle."""
+    _ = ReferenceCycle()
+
+
+@pytest.fixture(name="garbage_collection_disabled")
+def fixture_garbage_collection_disabled() -> "collections.abc.Iterator[None]":
+    """Disable automatic garbage collection during a test.
+
+    Yields
+    ------
+    None
+        nothing, automatic garbage collection is enabled again afterwards
+    """
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def test_default_decorator() -> None:
+    """Check default decorator keeps behaviour of decorated function."""
+    decorated_function = define_garbage_collection_decorator(sum)
+
+    assert decorated_function([1, 2, 3]) == sum([1, 2, 3])  # nosec B101
+    assert decorated_function.__name__ == "sum"  # nosec B101
+
+
+@pytest.mark.usefixtures("garbage_collection_disabled")
+def test_every_call() -> None:
+    """Check every call collects garbage, and collected objects are counted."""
+    garbage_collector = GarbageCollector()
+    decorated_function = garbage_collector.decorate(create_reference_cycle)
+
+    for _ in range(NUMBER_OF_CALLS):
+        decorated_function()
+
+    statistics = garbage_collector.statistics
+
+    assert statistics.calls == NUMBER_OF_CALLS  # nosec B101
+    assert statistics.collections == NUMBER_OF_CALLS  # nosec B101
+    assert statistics.collected_objects >= NUMBER_OF_CALLS  # nosec B101
+    assert statistics.seconds > 0  # nosec B101
+
+
+@pytest.mark.usefixtures("garbage_collection_disabled")
+@pytest.mark.parametrize("every_n_calls", [1, 5, NUMBER_OF_CALLS + 1])
+def test_every_n_calls(every_n_calls: int) -> None:
+    """Check collections happen once per given number of calls.
+
+    Parameters
+    ----------
+    every_n_calls : int
+        number of calls between collections
+    """
+    garbage_collector = GarbageCollector(
+        GarbageCollectionPolicy(generation=0, every_n_calls=every_n_calls)
+    )
+    decorated_function = garbage_collector.decorate(create_reference_cycle)
+
+    for _ in range(NUMBER_OF_CALLS):
+        decorated_function()
+
+    assert garbage_collector.statistics.collections == (  # nosec B101
+        NUMBER_OF_CALLS // every_n_calls
+    )
+
+
+@pytest.mark.usefixtures("garbage_collection_disabled")
+def test_allocation_threshold() -> None:
+    """Check collections are skipped until enough objects are allocated."""
+    garbage_collector = GarbageCollector(GarbageCollectionPolicy(allocation_threshold=10**9))
+    decorated_function = garbage_collector.decorate(create_reference_cycle)
+
+    decorated_function()
+
+    assert not garbage_collector.statistics.collections  # nosec B101
+
+    garbage_collector.policy = GarbageCollectionPolicy(allocation_threshold=0)
+    decorated_function()
+
+    assert garbage_collector.statistics.collections == 1  # nosec B101
+
+
+def test_freeze() -> None:
+    """Check surviving objects are moved to permanent generation."""
+    garbage_collector = GarbageCollector(GarbageCollectionPolicy(freeze=True))
+    decorated_function = garbage_collector.decorate(create_reference_cycle)
+
+    try:
+        decorated_function()
+
+        assert gc.get_freeze_count() > 0  # nosec B101
+    finally:
+        gc.unfreeze()
+
+
+def test_reset() -> None:
+    """Check counters are reset."""
+    garbage_collector = GarbageCollector()
+    garbage_collector.decorate(create_reference_cycle)()
+    garbage_collector.reset()
+
+    assert garbage_collector.statistics.calls == 0  # nosec B101
+
+
+def test_policy_generation_failure() -> None:
+    """Check failure for generation that does not exist."""
+    with pytest.raises(ValueError, match="less than or equal to 2"):
+        _ = GarbageCollectionPolicy(generation=3)
+
+
+def test_monitor_collection_pauses() -> None:
+    """Check explicit collections are measured, and monitor is removed afterwards."""
+    with monitor_collection_pauses() as monitor:
+        create_reference_cycle()
+        _ = gc.collect()
+
+    pauses = monitor.pauses
+
+    assert pauses.collections >= 1  # nosec B101
+    assert pauses.collected_objects >= 1  # nosec B101
+    assert monitor not in gc.callbacks  # nosec B101
+
+
+def test_pause_garbage_collection() -> None:
+    """Check automatic collection is disabled during batch and restored afterwards."""
+    previous_thresholds = gc.get_threshold()
+
+    with pause_garbage_collection() as batch:
+        assert not gc.isenabled()  # nosec B101
+
+        for _ in range(NUMBER_OF_CALLS):
+            create_reference_cycle()
+
+    assert gc.isenabled()  # nosec B101
+    assert gc.get_threshold() == previous_thresholds  # nosec B101
+    assert batch.report is not None  # nosec B101
+    assert batch.report.automatic_pauses.collections == 0  # nosec B101
+    assert batch.report.final_collection.collections == 1  # nosec B101
+    assert batch.report.final_collection.collected_objects >= NUMBER_OF_CALLS  # nosec B101
+    assert batch.report.pause_seconds == batch.report.final_collection.seconds  # nosec B101
+    assert batch.report.saved_seconds is None  # nosec B101
+
+
+def test_pause_garbage_collection_thresholds() -> None:
+    """Check thresholds are retuned during batch, keeping automatic collection enabled."""
+    previous_thresholds = gc.get_threshold()
+
+    with pause_garbage_collection(thresholds=(1, 1, 1)) as batch:
+        assert gc.isenabled()  # nosec B101
+
+        for _ in range(NUMBER_OF_CALLS):
+            create_reference_cycle()
+
+    assert gc.get_threshold() == previous_thresholds  # nosec B101
+    assert batch.report is not None  # nosec B101
+    assert batch.report.automatic_pauses.collections > 0  # nosec B101
+    assert batch.report.final_collection.collections == 0  # nosec B101
+
+
+def test_pause_garbage_collection_saving() -> None:
+    """Check time saved is measured against pauses of same workload without batch."""
+    with monitor_collection_pauses() as monitor:
+        for _ in range(NUMBER_OF_CALLS):
+            create_reference_cycle()
+
+        _ = gc.collect()
+
+    with pause_garbage_collection(baseline=monitor.pauses) as batch:
+        for _ in range(NUMBER_OF_CALLS):
+            create_reference_cycle()
+
+    assert batch.report is not None  # nosec B101
+    assert batch.report.saved_seconds == pytest.approx(  # nosec B101
+        monitor.pauses.seconds - batch.report.pause_seconds
+    )
+    assert batch.report.format_summary().endswith(  # nosec B101
+        f", saving {batch.report.saved_seconds:.6f} seconds\n"
+    )
+
+
+@pytest.mark.usefixtures("garbage_collection_disabled")
+def test_nested_pause_garbage_collection() -> None:
+    """Check automatic collection stays disabled after a nested batch."""
+    with pause_garbage_collection():
+        pass
+
+    assert not gc.isenabled()  # nosec B101
@@ -8,7 +8,7 @@
 import hypothesis.strategies
 import pydantic
 
-from package_name_to_import_with import solve_simplification
+from package_name_to_import_with import compile_expression, solve_simplification
 from package_name_to_import_with.calculator_sub_package import (
     BinaryArithmeticOperator,
     IdentityElements,
@@ -20,6 +20,11 @@
     multiply_numbers,
     subtract_numbers,
 )
+from package_name_to_import_with.simplify import (
+    clean_and_tokenise_expression,
+    convert_infix_expression,
+    tokenise_expression,
+)
 
 
 def generate_finite_numbers() -> hypothesis.strategies.SearchStrategy:
@@ -280,3 +285,48 @@ def test_simplification_hypothesis(expression: str) -> None:
         else:
             assert math.isinf(calculated_result) is math.isinf(expected_result)
             assert math.isnan(calculated_result) is math.isnan(expected_result)
+
+
+@hypothesis.given(expression=generate_arithmetic_expression())
+def test_tokenisation_hypothesis(expression: str) -> None:
+    """Check typed tokens convert to same postfix expression as regular expression matches.
+
+    Parameters
+    ----------
+    expression : str
+        arbitrary arithmetic expression
+    """
+    matched_postfix_expression = convert_infix_expression(
+        clean_and_tokenise_expression(expression)
+    )
+    typed_postfix_expression = convert_infix_expression(tokenise_expression(expression))
+
+    assert typed_postfix_expression == matched_postfix_expression
+
+
+@hypothesis.given(expression=generate_arithmetic_expression())
+def test_optimisation_hypothesis(expression: str) -> None:
+    """Check optimised expressions evaluate to same results as unoptimised expressions.
+
+    Parameters
+    ----------
+    expression : str
+        arbitrary arithmetic expression
+    """
+    try:
+        unoptimised_result = compile_expression(expression, optimise=False).evaluate(
+            validate=False
+        )
+    except ValueError as error:
+        unoptimised_result = str(error)
+
+    try:
+        optimised_result = compile_expression(expression).evaluate(validate=False)
+    except ValueError as error:
+        optimised_result = str(error)
+
+    if isinstance(unoptimised_result, float) and math.isnan(unoptimised_result):
+        assert isinstance(optimised_result, float)
+        assert math.isnan(optimised_result)
+    else:
+        assert optimised_result == unoptimised_result
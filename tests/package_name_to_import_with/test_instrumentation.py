@@ -0,0 +1,82 @@
+"""Define unit tests for instrumentation of stages of evaluation."""
+
+import pytest
+
+from package_name_to_import_with.caching_module import BoundedCache
+from package_name_to_import_with.instrumentation_module import (
+    STAGE_OBSERVERS,
+    Stage,
+    StageMetrics,
+    StageTiming,
+    observe_stages,
+)
+from package_name_to_import_with.simplify import solve_simplification
+
+EXPRESSION = "(1 + 2) * 3 - 4 / 5"
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_observe_stages(validate: bool) -> None:
+    """Check every stage is reported once with its size, and result is unchanged.
+
+    Parameters
+    ----------
+    validate : bool
+        whether to validate every intermediate operation
+    """
+    stage_timings: list[StageTiming] = []
+
+    with observe_stages(stage_timings.append):
+        result = solve_simplification(EXPRESSION, validate=validate)
+
+    assert result == solve_simplification(EXPRESSION, validate=validate)  # nosec B101
+    assert [stage_timing.stage for stage_timing in stage_timings] == list(Stage)  # nosec B101
+    assert [stage_timing.size for stage_timing in stage_timings] == [11, 9, 4]  # nosec B101
+    assert all(stage_timing.seconds >= 0 for stage_timing in stage_timings)  # nosec B101
+    assert not STAGE_OBSERVERS  # nosec B101
+
+
+def test_observe_stages_cache() -> None:
+    """Check cache hits are not reported."""
+    stage_timings: list[StageTiming] = []
+    cache: BoundedCache[float] = BoundedCache()
+
+    with observe_stages(stage_timings.append):
+        _ = solve_simplification(EXPRESSION, cache=cache)
+        _ = solve_simplification(EXPRESSION, cache=cache)
+
+    assert len(stage_timings) == len(Stage)  # nosec B101
+
+
+def test_observe_stages_failure() -> None:
+    """Check failed stages are not reported and observer is removed after failure."""
+    stage_timings: list[StageTiming] = []
+
+    with pytest.raises(ValueError, match="Division by zero"), observe_stages(stage_timings.append):
+        _ = solve_simplification("1 / 0")
+
+    assert [stage_timing.stage for stage_timing in stage_timings] == [  # nosec B101
+        Stage.TOKENISATION,
+        Stage.CONVERSION,
+    ]
+    assert not STAGE_OBSERVERS  # nosec B101
+
+
+def test_stage_metrics() -> None:
+    """Check cumulative histogram buckets and Prometheus rendering."""
+    metrics = StageMetrics(duration_buckets=[1.0, 0.1])
+
+    metrics(StageTiming(Stage.EVALUATION, 0.05, 3))
+    metrics(StageTiming(Stage.EVALUATION, 0.5, 4))
+    metrics(StageTiming(Stage.EVALUATION, 5.0, 5))
+
+    assert metrics.bucket_counts[Stage.EVALUATION] == [1, 2]  # nosec B101
+    assert metrics.sizes[Stage.EVALUATION] == 12  # noqa: PLR2004 # nosec B101
+
+    prometheus_text = metrics.to_prometheus_text(prefix="calculator")
+
+    assert (  # nosec B101
+        'calculator_stage_duration_seconds_bucket{stage="evaluation",le="+Inf"} 3'
+        in prometheus_text
+    )
+    assert 'calculator_stage_size_total{stage="evaluation"} 12' in prometheus_text  # nosec B101
@@ -0,0 +1,110 @@
+"""Define unit tests for lazy imports of package contents."""
+
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+import package_name_to_import_with
+from package_name_to_import_with import data_using_module, simplify
+
+EAGERLY_AVOIDED_MODULES = {
+    "numpy",
+    "package_name_to_import_with.calculator_sub_package",
+    "package_name_to_import_with.data_using_module",
+    "package_name_to_import_with.simplify",
+    "pydantic",
+}
+
+
+def find_imported_modules(statement: str) -> set[str]:
+    """Find modules imported by a statement in a fresh interpreter.
+
+    Parameters
+    ----------
+    statement : str
+        Python code to execute
+
+    Returns
+    -------
+    set[str]
+        names of modules reported by ``python -X importtime``
+    """
+    completed_process = subprocess.run(  # noqa: S603 # nosec B603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return {
+        line.rsplit("|", maxsplit=1)[-1].strip()
+        for line in completed_process.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import package_name_to_import_with",
+        "from package_name_to_import_with import __version__",
+    ],
+)
+def test_package_import_is_lazy(statement: str) -> None:
+    """Check importing the package or its version does not import its heavy contents.
+
+    Parameters
+    ----------
+    statement : str
+        import statement to execute
+    """
+    imported_modules = find_imported_modules(statement)
+
+    assert "package_name_to_import_with" in imported_modules  # nosec B101
+    assert not imported_modules & EAGERLY_AVOIDED_MODULES  # nosec B101
+
+
+def test_lazy_attribute() -> None:
+    """Check lazily imported contents are same objects as in submodules."""
+    assert (  # nosec B101
+        package_name_to_import_with.solve_simplification is simplify.solve_simplification
+    )
+    assert "solve_simplification" in dir(package_name_to_import_with)  # nosec B101
+
+
+@pytest.mark.parametrize("submodule", ["calculator_sub_package", "data_using_module", "simplify"])
+def test_lazy_submodule(submodule: str) -> None:
+    """Check submodules are imported on first access after importing only the package.
+
+    Parameters
+    ----------
+    submodule : str
+        name of submodule
+    """
+    statement = (
+        f"import package_name_to_import_with; "
+        f"print(package_name_to_import_with.{submodule}.__name__)"
+    )
+    completed_process = subprocess.run(  # noqa: S603 # nosec B603
+        [sys.executable, "-c", statement], capture_output=True, check=True, text=True
+    )
+
+    assert (  # nosec B101
+        completed_process.stdout.strip() == f"package_name_to_import_with.{submodule}"
+    )
+    assert submodule in dir(package_name_to_import_with)  # nosec B101
+
+
+def test_missing_attribute_failure() -> None:
+    """Check failure for contents not exposed by the package."""
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        _ = package_name_to_import_with.missing
+
+
+def test_cached_metadata() -> None:
+    """Check metadata is validated once and matches version of the package."""
+    assert data_using_module.METADATA is data_using_module.load_metadata()  # nosec B101
+    assert (  # nosec B101
+        package_name_to_import_with.read_package_version() == data_using_module.METADATA.Version
+    )
@@ -0,0 +1,179 @@
+"""Define unit tests for memory profiling of evaluations."""
+
+import sys
+import tracemalloc
+
+import pytest
+
+from package_name_to_import_with import calculate_results
+from package_name_to_import_with.instrumentation_module import (
+    STAGE_OBSERVERS,
+    Stage,
+    StageTiming,
+    report_stage_timing,
+)
+from package_name_to_import_with.memory_profiling_module import (
+    MemoryProfiler,
+    define_memory_profiling_decorator,
+)
+from package_name_to_import_with.simplify import solve_simplification
+
+EXPRESSION = "(1 + 2) * 3 - 4 / 5"
+NO_OPERATION_TOLERANCE = 4096
+LIVE_LISTS = 1_000
+
+
+def allocate_list(size: int) -> list[int]:
+    """Allocate a list, kept alive by caller.
+
+    Parameters
+    ----------
+    size : int
+        number of elements
+
+    Returns
+    -------
+    list[int]
+        newly allocated list
+    """
+    return list(range(size))
+
+
+def test_profile_stages() -> None:
+    """Check every stage and the whole call are profiled, and result is unchanged."""
+    memory_profiler = MemoryProfiler()
+    profiled_function = memory_profiler.decorate(solve_simplification)
+
+    assert profiled_function(EXPRESSION) == solve_simplification(EXPRESSION)  # nosec B101
+    assert [memory_profile.label for memory_profile in memory_profiler.profiles] == [  # nosec B101
+        *Stage,
+        "solve_simplification",
+    ]
+    assert all(  # nosec B101
+        memory_profile.peak_bytes > 0 for memory_profile in memory_profiler.profiles
+    )
+    assert not STAGE_OBSERVERS  # nosec B101
+    assert not tracemalloc.is_tracing()  # nosec B101
+
+
+def test_define_memory_profiling_decorator() -> None:
+    """Check binary calculation is profiled as a single call."""
+    memory_profiler = MemoryProfiler()
+    profiled_function = define_memory_profiling_decorator(calculate_results, memory_profiler)
+
+    assert profiled_function(1, "+", 2) == calculate_results(1, "+", 2)  # nosec B101
+    assert [memory_profile.label for memory_profile in memory_profiler.profiles] == [  # nosec B101
+        "calculate_results"
+    ]
+
+
+def test_allocations() -> None:
+    """Check memory kept alive by a call is counted, and peak covers it."""
+    size = 10_000
+    memory_profiler = MemoryProfiler()
+
+    allocated_list = memory_profiler.decorate(allocate_list)(size)
+    (memory_profile,) = memory_profiler.profiles
+
+    assert len(allocated_list) == size  # nosec B101
+    assert memory_profile.allocated_blocks  # nosec B101
+    assert memory_profile.allocated_bytes >= sys.getsizeof(allocated_list)  # nosec B101
+    assert memory_profile.peak_bytes >= memory_profile.allocated_bytes  # nosec B101
+
+
+def test_nested_calls() -> None:
+    """Check nested profiled calls are only recorded once, at outermost level."""
+    memory_profiler = MemoryProfiler()
+    profiled_calculate_results = memory_profiler.decorate(calculate_results)
+
+    def calculate_twice() -> float:
+        """Calculate a sum twice.
+
+        Returns
+        -------
+        float
+            sum of both calculations
+        """
+        return profiled_calculate_results(1, "+", 2) + profiled_calculate_results(3, "+", 4)
+
+    _ = memory_profiler.decorate(calculate_twice)()
+
+    assert [memory_profile.label for memory_profile in memory_profiler.profiles] == [  # nosec B101
+        "calculate_twice"
+    ]
+
+
+def test_tracing_left_running() -> None:
+    """Check tracing started outside profiler is not stopped."""
+    memory_profiler = MemoryProfiler()
+
+    tracemalloc.start()
+    try:
+        _ = memory_profiler.decorate(solve_simplification)(EXPRESSION)
+
+        assert tracemalloc.is_tracing()  # nosec B101
+    finally:
+        tracemalloc.stop()
+
+
+def report_empty_stages() -> None:
+    """Report every stage without doing any work in between."""
+    for stage in Stage:
+        report_stage_timing(StageTiming(stage, 0.0, 0))
+
+
+def test_no_operation_stages() -> None:
+    """Check stages without work report almost nothing, even with many live traces."""
+    memory_profiler = MemoryProfiler()
+
+    tracemalloc.start()
+    try:
+        live_lists = [allocate_list(100) for _ in range(LIVE_LISTS)]
+        memory_profiler.decorate(report_empty_stages)()
+    finally:
+        tracemalloc.stop()
+
+    *stage_profiles, call_profile = memory_profiler.profiles
+
+    assert len(live_lists) == LIVE_LISTS  # nosec B101
+    assert [memory_profile.label for memory_profile in stage_profiles] == [*Stage]  # nosec B101
+    assert all(  # nosec B101
+        memory_profile.peak_bytes < NO_OPERATION_TOLERANCE
+        and 0 <= memory_profile.allocated_bytes < NO_OPERATION_TOLERANCE
+        and memory_profile.allocated_blocks is None
+        for memory_profile in stage_profiles
+    )
+    assert call_profile.peak_bytes < NO_OPERATION_TOLERANCE  # nosec B101
+    assert call_profile.allocated_blocks is None  # nosec B101
+
+
+def test_failure() -> None:
+    """Check failed calls are not recorded, and tracing and observers are cleaned up."""
+    memory_profiler = MemoryProfiler()
+
+    with pytest.raises(ValueError, match="Division by zero"):
+        _ = memory_profiler.decorate(solve_simplification)("1 / 0")
+
+    assert [memory_profile.label for memory_profile in memory_profiler.profiles] == [  # nosec B101
+        Stage.TOKENISATION,
+        Stage.CONVERSION,
+    ]
+    assert not STAGE_OBSERVERS  # nosec B101
+    assert not tracemalloc.is_tracing()  # nosec B101
+
+
+def test_format_summary() -> None:
+    """Check profiles are aggregated per label, and reset discards them."""
+    memory_profiler = MemoryProfiler()
+    profiled_function = memory_profiler.decorate(calculate_results)
+
+    _ = profiled_function(1, "+", 2)
+    _ = profiled_function(3, "+", 4)
+
+    assert memory_profiler.format_summary().startswith(  # nosec B101
+        "Memory of calculate_results: 2 calls, peak "
+    )
+
+    memory_profiler.reset()
+
+    assert not memory_profiler.format_summary()  # nosec B101
@@ -0,0 +1,59 @@
+"""Define unit tests for parallel evaluation of arithmetic expressions."""
+
+import typing
+
+import pytest
+
+from package_name_to_import_with.parallel_module import (
+    solve_many,
+    solve_many_as_completed,
+    solve_many_stream,
+)
+from package_name_to_import_with.streaming_module import solve_simplification_stream
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+EXPRESSIONS = [f"{number} / ({number % 3} - 1)" for number in range(50)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many_order(workers: int) -> None:
+    """Check parallel records match serial records in order.
+
+    Parameters
+    ----------
+    workers : int
+        number of worker processes
+    """
+    serial_records = list(solve_simplification_stream(EXPRESSIONS))
+
+    assert solve_many(EXPRESSIONS, workers=workers, chunksize=7) == serial_records  # nosec B101
+
+
+def test_solve_many_stream_laziness() -> None:
+    """Check records are yielded before input is exhausted."""
+
+    def generate_expressions() -> "collections.abc.Iterator[str]":
+        yield "1 + 1"
+        raise RuntimeError("Input exhausted too early.")
+
+    records = solve_many_stream(generate_expressions(), workers=1, chunksize=1)
+
+    assert next(records).expression == "1 + 1"  # nosec B101
+
+
+def test_solve_many_as_completed() -> None:
+    """Check every record is yielded once with its position."""
+    indexed_records = sorted(solve_many_as_completed(EXPRESSIONS, workers=2, chunksize=7))
+
+    assert [index for index, _ in indexed_records] == list(range(len(EXPRESSIONS)))  # nosec B101
+    assert [record for _, record in indexed_records] == solve_many(  # nosec B101
+        EXPRESSIONS, workers=1
+    )
+
+
+def test_solve_many_workers_failure() -> None:
+    """Check failure for non-positive number of workers."""
+    with pytest.raises(ValueError, match="greater than 0"):
+        solve_many(EXPRESSIONS, workers=0)
@@ -0,0 +1,157 @@
+"""Define unit tests for persistent cache of compiled arithmetic expressions."""
+
+import concurrent.futures
+import typing
+
+import pytest
+
+from package_name_to_import_with.persistent_cache_module import (
+    PersistentExpressionCache,
+    create_cache_key,
+)
+from package_name_to_import_with.simplify import compile_expression
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+EXPRESSIONS = [f"x * ({number} + 2) / (y - {number})" for number in range(20)]
+
+
+def evaluate_from_cache(path: "pathlib.Path", expression: str) -> float:
+    """Evaluate arithmetic expression from a read-only cache in a fresh process.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        location of database file
+    expression : str
+        standard arithmetic expression
+
+    Returns
+    -------
+    float
+        result of arithmetic expression for ``x = 3`` and ``y = 25``
+    """
+    cache = PersistentExpressionCache(path, read_only=True)
+    bytecode = cache.get_bytecode(expression, allow_variables=True)
+    cache.close()
+
+    if bytecode is None:
+        raise LookupError(f"Missing entry: {expression}")
+
+    return bytecode.evaluate({"x": 3, "y": 25})
+
+
+def test_persistent_cache_round_trip(tmp_path: "pathlib.Path") -> None:
+    """Check cached compilations match direct compilations across reopened caches.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        temporary directory
+    """
+    cache = PersistentExpressionCache(tmp_path / "cache.db")
+    for expression in EXPRESSIONS:
+        _ = cache.compile_expression(expression, allow_variables=True)
+    cache.close()
+
+    reopened_cache = PersistentExpressionCache(tmp_path / "cache.db")
+
+    assert len(reopened_cache) == len(EXPRESSIONS)  # nosec B101
+    for expression in EXPRESSIONS:
+        assert reopened_cache.compile_expression(  # nosec B101
+            expression, allow_variables=True
+        ) == compile_expression(expression, allow_variables=True)
+
+    reopened_cache.close()
+
+
+def test_persistent_cache_key() -> None:
+    """Check keys ignore spaces but distinguish versions and compilation options."""
+    key = create_cache_key("1 + 2", version="1.0.0")
+
+    assert key == create_cache_key("1+2", version="1.0.0")  # nosec B101
+    assert key != create_cache_key("1 + 2", version="1.0.1")  # nosec B101
+    assert key != create_cache_key("1 + 2", optimise=False, version="1.0.0")  # nosec B101
+    assert key != create_cache_key("1 + 2", allow_variables=True, version="1.0.0")  # nosec B101
+
+
+def test_persistent_cache_version(tmp_path: "pathlib.Path") -> None:
+    """Check entries compiled by another package version are not reused.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        temporary directory
+    """
+    cache = PersistentExpressionCache(tmp_path / "cache.db")
+    _ = cache.compile_bytecode("1 + 2")
+    cache.version = "0.0.0"
+
+    assert cache.get_bytecode("1 + 2") is None  # nosec B101
+
+    cache.close()
+
+
+def test_persistent_cache_failure(tmp_path: "pathlib.Path") -> None:
+    """Check failed compilations are not stored.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        temporary directory
+    """
+    cache = PersistentExpressionCache(tmp_path / "cache.db")
+
+    with pytest.raises(ValueError, match="Unexpected characters"):
+        _ = cache.compile_bytecode("1 + x")
+
+    assert not len(cache)  # nosec B101
+
+    cache.close()
+
+
+def test_persistent_cache_read_only(tmp_path: "pathlib.Path") -> None:
+    """Check read-only cache compiles misses without storing them.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        temporary directory
+    """
+    cache = PersistentExpressionCache(tmp_path / "cache.db")
+    cache.clear()
+    cache.close()
+
+    read_only_cache = PersistentExpressionCache(tmp_path / "cache.db", read_only=True)
+
+    assert read_only_cache.compile_expression("1 + 2") == compile_expression("1 + 2")  # nosec B101
+    assert not len(read_only_cache)  # nosec B101
+
+    read_only_cache.close()
+
+
+def test_persistent_cache_concurrent_readers(tmp_path: "pathlib.Path") -> None:
+    """Check entries written by one process are read by several other processes.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        temporary directory
+    """
+    cache = PersistentExpressionCache(tmp_path / "cache.db")
+    expected_results = [
+        cache.compile_bytecode(expression, allow_variables=True).evaluate({"x": 3, "y": 25})
+        for expression in EXPRESSIONS
+    ]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(
+                evaluate_from_cache, [tmp_path / "cache.db"] * len(EXPRESSIONS), EXPRESSIONS
+            )
+        )
+
+    cache.close()
+
+    assert results == expected_results  # nosec B101
@@ -1,10 +1,11 @@
 """Define unit tests for simplification problems."""
 
 import math
+import sys
 
 import pytest
 
-from package_name_to_import_with import solve_simplification
+from package_name_to_import_with import compile_expression, solve_simplification
 
 
 @pytest.mark.parametrize(
@@ -55,3 +56,153 @@ def test_simplification_failure(expression: str, error: str) -> None:
     """
     with pytest.raises(ValueError, match=error):
         solve_simplification(expression)
+
+
+@pytest.mark.parametrize(
+    ("expression"),
+    [
+        "0 + 1",
+        "4.5*6.7 /8.9",
+        "(-16)* (17.18/(19.20+ 21.22-(23*24))) ",
+    ],
+)
+def test_compiled_expression(expression: str) -> None:
+    """Check repeated evaluations of compiled infix expressions.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    """
+    compiled_expression = compile_expression(expression)
+    expected_result = solve_simplification(expression)
+
+    for _ in range(3):
+        assert math.isclose(compiled_expression.evaluate(), expected_result)
+
+
+def test_compiled_expression_failure() -> None:
+    """Check parsing failures are raised during compilation."""
+    with pytest.raises(ValueError, match="Mismatched left parenthesis"):
+        compile_expression("1+(2*3")
+
+
+@pytest.mark.parametrize(
+    ("expression"),
+    [
+        "2-3",
+        "11+(12-13)*14/ -15",
+        "(-16)* (17.18/(19.20+ 21.22-(23*24))) ",
+        "  25.26--27.28  -29.30",
+    ],
+)
+def test_trusted_simplification(expression: str) -> None:
+    """Check evaluation without intermediate validation matches validated evaluation.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression
+    """
+    validated_result = solve_simplification(expression)
+    trusted_result = solve_simplification(expression, validate=False)
+
+    assert trusted_result == validated_result
+
+
+def test_trusted_simplification_failure() -> None:
+    """Check division by zero is reported without intermediate validation."""
+    with pytest.raises(ValueError, match="Division by zero is attempted"):
+        solve_simplification("1 / (2 - 2)", validate=False)
+
+
+@pytest.mark.parametrize(
+    ("expression", "variable_values"),
+    [
+        ("x-1", {"x": 3}),
+        ("x * (y + 2)", {"x": 3, "y": -4.5}),
+        ("rate_2 / -2 - (x1)", {"rate_2": 5, "x1": 6, "unused": 7}),
+    ],
+)
+def test_variable_simplification(expression: str, variable_values: dict[str, float]) -> None:
+    """Check evaluation of infix expressions with variables.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression with variables
+    variable_values : dict[str, float]
+        numbers keyed by variable names
+    """
+    compiled_expression = compile_expression(expression, allow_variables=True)
+    expected_result = eval(  # noqa: PGH001, S307  # pylint: disable=eval-used
+        expression, {"__builtins__": {}}, variable_values
+    )
+
+    assert math.isclose(
+        compiled_expression.evaluate(variable_values=variable_values), expected_result
+    )
+    assert math.isclose(
+        compiled_expression.evaluate(validate=False, variable_values=variable_values),
+        expected_result,
+    )
+
+
+def test_variable_simplification_failure() -> None:
+    """Check failure if numbers are not provided for every variable."""
+    compiled_expression = compile_expression("x + y", allow_variables=True)
+
+    with pytest.raises(ValueError, match="Missing values for variables"):
+        compiled_expression.evaluate(variable_values={"x": 1})
+
+
+@pytest.mark.parametrize(
+    ("expression", "number_of_elements"),
+    [
+        ("2 * 3 + 4", 1),
+        ("(x - 0) * 1 + 0", 1),
+        ("1 * (x + y) / 1", 3),
+        ("x / 4 * (2 + 6)", 5),
+    ],
+)
+def test_optimised_expression(expression: str, number_of_elements: int) -> None:
+    """Check optimisation shortens compiled expressions without changing results.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression with variables
+    number_of_elements : int
+        expected number of postfix elements after optimisation
+    """
+    variable_values = {"x": 3, "y": -4.5}
+    optimised_expression = compile_expression(expression, allow_variables=True)
+    unoptimised_expression = compile_expression(expression, allow_variables=True, optimise=False)
+
+    assert len(optimised_expression.postfix_expression) == number_of_elements
+    assert optimised_expression.evaluate(
+        variable_values=variable_values
+    ) == unoptimised_expression.evaluate(variable_values=variable_values)
+
+
+def test_optimised_expression_failure() -> None:
+    """Check division by zero is still raised during evaluation of optimised expressions."""
+    compiled_expression = compile_expression("x + 1 / (2 - 2)", allow_variables=True)
+
+    with pytest.raises(ValueError, match="Division by zero is attempted"):
+        compiled_expression.evaluate(variable_values={"x": 1})
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_deeply_nested_simplification(validate: bool) -> None:
+    """Check nesting far beyond recursion limit is evaluated.
+
+    Parameters
+    ----------
+    validate : bool
+        whether to validate every intermediate operation
+    """
+    depth = 10 * sys.getrecursionlimit()
+    expression = "(1 - " * depth + "1" + ")" * depth
+
+    assert solve_simplification(expression, validate=validate) == float(depth % 2 == 0)
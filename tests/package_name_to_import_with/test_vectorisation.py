@@ -0,0 +1,151 @@
+"""Define unit tests for vectorised evaluations."""
+
+import array
+
+import pytest
+
+from package_name_to_import_with import (
+    BinaryArithmeticOperator,
+    calculate_results,
+    compile_expression,
+)
+
+numpy = pytest.importorskip("numpy")
+vectorisation_module = pytest.importorskip("package_name_to_import_with.vectorisation_module")
+
+
+@pytest.mark.parametrize(
+    ("expression"),
+    [
+        "x + y",
+        "x * (y + 2)",
+        "(x - -1.5) / (y * 3 - x)",
+        "2 - x / 4 * y",
+    ],
+)
+def test_batch_simplification(expression: str) -> None:
+    """Check vectorised evaluation matches element-wise evaluation.
+
+    Parameters
+    ----------
+    expression : str
+        standard arithmetic expression with variables
+    """
+    random_generator = numpy.random.default_rng(seed=0)
+    first_column = random_generator.uniform(-100, 100, size=64)
+    second_column = random_generator.uniform(-100, 100, size=64)
+
+    batch_results = vectorisation_module.solve_simplification_batch(
+        expression, x=first_column, y=second_column
+    )
+
+    compiled_expression = compile_expression(expression, allow_variables=True)
+    expected_results = [
+        compiled_expression.evaluate(variable_values={"x": first_number, "y": second_number})
+        for first_number, second_number in zip(first_column, second_column, strict=True)
+    ]
+
+    assert not batch_results.mask.any()  # nosec B101
+    assert batch_results.tolist() == expected_results  # nosec B101
+
+
+def test_batch_zero_division_mask() -> None:
+    """Check division by zero is masked per element, including dependent operations."""
+    batch_results = vectorisation_module.solve_simplification_batch(
+        "1 + x / (y - 1)", x=numpy.array([1.0, 2.0, 3.0]), y=numpy.array([2.0, 1.0, 0.0])
+    )
+
+    assert batch_results.mask.tolist() == [False, True, False]  # nosec B101
+    assert batch_results.compressed().tolist() == [2.0, -2.0]  # nosec B101
+
+
+def test_batch_missing_variable_failure() -> None:
+    """Check failure if array is not provided for every variable."""
+    with pytest.raises(ValueError, match="Missing values for variables"):
+        vectorisation_module.solve_simplification_batch("x + y", x=numpy.ones(3))
+
+
+def test_batch_variable_named_expression() -> None:
+    """Check a variable may share its name with the expression parameter."""
+    batch_results = vectorisation_module.solve_simplification_batch(
+        "expression * 2", expression=numpy.array([1.0, 2.0])
+    )
+
+    assert batch_results.tolist() == [2.0, 4.0]  # nosec B101
+
+
+@pytest.mark.parametrize(
+    "column", [numpy.array([1.0, None], dtype=object), numpy.array(["1", "2"])]
+)
+def test_batch_variable_type_failure(column: object) -> None:
+    """Check failure for columns which are not real numbers, instead of coercion.
+
+    Parameters
+    ----------
+    column : object
+        array of a variable which are not real numbers
+    """
+    with pytest.raises(ValueError, match="Operands must be real numbers"):
+        vectorisation_module.solve_simplification_batch("x + 1", x=column)
+
+
+@pytest.mark.parametrize(("operator"), list(BinaryArithmeticOperator))
+def test_batch_operation(operator: BinaryArithmeticOperator) -> None:
+    """Check vectorised binary operations match scalar operations.
+
+    Parameters
+    ----------
+    operator : BinaryArithmeticOperator
+        type of arithmetic operation
+    """
+    first_numbers = array.array("d", [4, -9, 1.02, -3.4])
+    second_numbers = [5, 10, -5.6, 7.89]
+
+    batch_results = vectorisation_module.calculate_results_batch(
+        first_numbers, operator, second_numbers
+    )
+    expected_results = [
+        calculate_results(first_number, operator, second_number)
+        for first_number, second_number in zip(first_numbers, second_numbers, strict=True)
+    ]
+
+    assert batch_results.tolist() == expected_results  # nosec B101
+
+
+def test_batch_operation_zero_division_failure() -> None:
+    """Check division by zero reports offending indices."""
+    with pytest.raises(ValueError, match=r"Division by zero is attempted at 2 indices: \[0, 3\]"):
+        vectorisation_module.calculate_results_batch(
+            numpy.ones(4), BinaryArithmeticOperator.DIVISION, numpy.array([0, 1, 2, 0])
+        )
+
+
+def test_batch_operation_operator_failure() -> None:
+    """Check failure for unsupported operator."""
+    with pytest.raises(ValueError, match="is not a valid BinaryArithmeticOperator"):
+        vectorisation_module.calculate_results_batch(numpy.ones(2), "^", numpy.ones(2))
+
+
+@pytest.mark.parametrize(
+    "first_inputs",
+    [[1.0, None], ["1", "2"], [1j, 2j], numpy.array([1, 2], dtype=object)],
+)
+def test_batch_operation_operand_failure(first_inputs: object) -> None:
+    """Check failure for operands which are not real numbers, instead of coercion to NaN.
+
+    Parameters
+    ----------
+    first_inputs : object
+        left operands which are not real numbers
+    """
+    with pytest.raises(ValueError, match="Operands must be real numbers"):
+        vectorisation_module.calculate_results_batch(first_inputs, "+", [1, 2])
+
+
+def test_batch_operation_boolean_operands() -> None:
+    """Check booleans and integers are accepted as real numbers."""
+    batch_results = vectorisation_module.calculate_results_batch(
+        numpy.array([True, False]), "+", array.array("i", [1, 2])
+    )
+
+    assert batch_results.tolist() == [2.0, 2.0]  # nosec B101
@@ -1,11 +1,16 @@
 """Define unit tests for console calculator."""
 
+import io
+import typing
 import unittest.mock
 
 import pytest
 
 import module_that_can_be_invoked_from_cli
 
+if typing.TYPE_CHECKING:
+    import pathlib
+
 PYDANTIC_VALIDATION_ERROR_MESSAGE = "validation error for calculate_results"
 
 
@@ -130,3 +135,217 @@ def test_sub_parser_input_failure() -> None:
     """Check failure in sub-command input."""
     with pytest.raises(SystemExit), unittest.mock.patch("sys.argv", ["prog", "unknown"]):
         module_that_can_be_invoked_from_cli.console_calculator()
+
+
+def test_stream_from_standard_input(capsys: pytest.CaptureFixture) -> None:
+    """Check evaluation of expressions from standard input, one result per line.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    """
+    with (
+        unittest.mock.patch("sys.argv", ["prog", "--stream"]),
+        unittest.mock.patch("sys.stdin", io.StringIO("1 + 2\n3 / (1 - 1)\n\n4 * 5")),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+        stream_result, _ = capsys.readouterr()
+
+    assert stream_result.splitlines() == [  # nosec B101
+        "Result = 3.0",
+        "Error: Division by zero is attempted.",
+        "Error: Empty expression",
+        "Result = 20.0",
+    ]
+
+
+def test_stream_from_file(capsys: pytest.CaptureFixture, tmp_path: "pathlib.Path") -> None:
+    """Check evaluation of expressions from a file, continuing after failures.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    tmp_path : pathlib.Path
+        fixture providing a temporary directory
+    """
+    expressions_file = tmp_path / "expressions.txt"
+    expressions_file.write_text("one plus one\r\n(2 - 3) * 4\r\n", encoding="utf-8")
+
+    with unittest.mock.patch("sys.argv", ["prog", "--stream", str(expressions_file)]):
+        module_that_can_be_invoked_from_cli.console_calculator()
+        stream_result, _ = capsys.readouterr()
+
+    first_line, second_line = stream_result.splitlines()
+
+    assert first_line.startswith("Error: Unexpected characters")  # nosec B101
+    assert second_line == "Result = -4.0"  # nosec B101
+
+
+def test_stream_file_failure(capsys: pytest.CaptureFixture, tmp_path: "pathlib.Path") -> None:
+    """Check failure for missing file of expressions.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    tmp_path : pathlib.Path
+        fixture providing a temporary directory
+    """
+    with unittest.mock.patch("sys.argv", ["prog", "--stream", str(tmp_path / "missing.txt")]):
+        module_that_can_be_invoked_from_cli.console_calculator()
+        _, result_error = capsys.readouterr()
+
+    assert "No such file or directory" in result_error  # nosec B101
+
+
+def test_stream_sub_parser_failure() -> None:
+    """Check failure when streaming is combined with a sub-command."""
+    with (
+        pytest.raises(SystemExit),
+        unittest.mock.patch("sys.argv", ["prog", "--stream", "file", "general", "1"]),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+
+
+def test_stream_in_parallel(capsys: pytest.CaptureFixture, tmp_path: "pathlib.Path") -> None:
+    """Check parallel evaluation of expressions preserves order of lines.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    tmp_path : pathlib.Path
+        fixture providing a temporary directory
+    """
+    expressions_file = tmp_path / "expressions.txt"
+    expressions_file.write_text(
+        "".join(f"{number} * 2\n" for number in range(10)), encoding="utf-8"
+    )
+
+    with unittest.mock.patch(
+        "sys.argv",
+        ["prog", "--stream", str(expressions_file), "--workers", "2", "--chunksize", "3"],
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+        stream_result, _ = capsys.readouterr()
+
+    assert stream_result.splitlines() == [  # nosec B101
+        f"Result = {number * 2.0}" for number in range(10)
+    ]
+
+
+def test_workers_without_stream_failure() -> None:
+    """Check failure when parallel workers are requested without streaming."""
+    with (
+        pytest.raises(SystemExit),
+        unittest.mock.patch("sys.argv", ["prog", "--workers", "2", "general", "1"]),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+
+
+def test_stream_with_paused_garbage_collection(capsys: pytest.CaptureFixture) -> None:
+    """Check paused garbage collection keeps results and reports pauses on standard error.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    """
+    with (
+        unittest.mock.patch("sys.argv", ["prog", "--stream", "--pause-gc"]),
+        unittest.mock.patch("sys.stdin", io.StringIO("1 + 2\n3 / (1 - 1)\n")),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+        stream_result, stream_error = capsys.readouterr()
+
+    assert stream_result.splitlines() == [  # nosec B101
+        "Result = 3.0",
+        "Error: Division by zero is attempted.",
+    ]
+    assert stream_error.startswith("Garbage collection: 0 automatic collections")  # nosec B101
+
+
+def test_pause_gc_without_stream_failure() -> None:
+    """Check failure when garbage collection is paused without streaming."""
+    with (
+        pytest.raises(SystemExit),
+        unittest.mock.patch("sys.argv", ["prog", "--pause-gc", "general", "1"]),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+
+
+def test_profile_memory(capsys: pytest.CaptureFixture) -> None:
+    """Check memory profiling keeps result and reports every stage on standard error.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    """
+    with unittest.mock.patch("sys.argv", ["prog", "--profile-memory", "general", "1 + 2"]):
+        module_that_can_be_invoked_from_cli.console_calculator()
+        profiled_result, profiled_error = capsys.readouterr()
+
+    assert profiled_result == "Result = 3.0"  # nosec B101
+    assert [line.split(":")[0] for line in profiled_error.splitlines()] == [  # nosec B101
+        "Memory of tokenisation",
+        "Memory of conversion",
+        "Memory of evaluation",
+        "Memory of solve_simplification",
+    ]
+
+
+def test_stream_with_memory_profile(capsys: pytest.CaptureFixture) -> None:
+    """Check memory of streamed expressions is summarised over all of them.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    """
+    with (
+        unittest.mock.patch("sys.argv", ["prog", "--stream", "--profile-memory"]),
+        unittest.mock.patch("sys.stdin", io.StringIO("1 + 2\n3 + 4\n")),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+        stream_result, stream_error = capsys.readouterr()
+
+    assert stream_result.splitlines() == ["Result = 3.0", "Result = 7.0"]  # nosec B101
+    assert "Memory of tokenisation: 2 calls" in stream_error  # nosec B101
+    assert "Memory of stream: 1 calls" in stream_error  # nosec B101
+
+
+def test_profile_memory_with_workers_failure() -> None:
+    """Check failure when memory is profiled over worker processes."""
+    with (
+        pytest.raises(SystemExit),
+        unittest.mock.patch(
+            "sys.argv", ["prog", "--stream", "--workers", "2", "--profile-memory"]
+        ),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+
+
+@pytest.mark.parametrize("argument", ["--str", "--strea=-", "--profile-mem", "--dae"])
+def test_abbreviated_flag(capsys: pytest.CaptureFixture, argument: str) -> None:
+    """Check abbreviated flags are ignored like other unknown arguments, instead of guessed.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        standard output and error
+    argument : str
+        abbreviation of a flag
+    """
+    with (
+        unittest.mock.patch("sys.argv", ["prog", argument, "general", "1 + 2"]),
+        unittest.mock.patch("sys.stdin", io.StringIO("3 + 4\n")),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
+
+    captured = capsys.readouterr()
+
+    assert captured.out == "Result = 3.0"  # nosec B101
+    assert not captured.err  # nosec B101
@@ -0,0 +1,308 @@
+"""Define unit tests for console calculator daemon and its client."""
+
+import contextlib
+import os
+import pathlib
+import socket
+import subprocess  # nosec B404
+import sys
+import threading
+import typing
+import unittest.mock
+
+import pytest
+
+import module_that_can_be_invoked_from_cli
+import module_that_can_forward_to_daemon
+from module_that_can_forward_to_daemon import (
+    SOCKET_ENVIRONMENT_VARIABLE,
+    can_forward,
+    define_socket_path,
+    forward_to_daemon,
+    is_own_socket,
+)
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+
+@pytest.fixture(name="socket_path")
+def fixture_socket_path(tmp_path: "pathlib.Path") -> "collections.abc.Iterator[str]":
+    """Provide Unix socket path of daemon, also through environment variable.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        temporary directory unique to test
+
+    Yields
+    ------
+    str
+        path of Unix socket
+    """
+    socket_path = str(tmp_path / "daemon.sock")
+
+    with unittest.mock.patch.dict(os.environ, {SOCKET_ENVIRONMENT_VARIABLE: socket_path}):
+        yield socket_path
+
+
+@contextlib.contextmanager
+def running_daemon(socket_path: str) -> "collections.abc.Iterator[None]":
+    """Serve forwarded invocations in a background thread.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket to listen on
+
+    Yields
+    ------
+    None
+        nothing, daemon is stopped afterwards
+    """
+    daemon_server = module_that_can_be_invoked_from_cli.create_daemon_server(socket_path)
+    daemon_thread = threading.Thread(target=daemon_server.serve_forever)
+    daemon_thread.start()
+
+    try:
+        yield
+    finally:
+        daemon_server.shutdown()
+        daemon_thread.join()
+        daemon_server.server_close()
+
+
+def test_client_imports() -> None:
+    """Check client imports neither pydantic nor calculator."""
+    imported_modules = subprocess.run(  # nosec B603
+        [
+            sys.executable,
+            "-c",
+            "import sys, module_that_can_forward_to_daemon; print(*sorted(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+    assert "pydantic" not in imported_modules  # nosec B101
+    assert "package_name_to_import_with" not in imported_modules  # nosec B101
+
+
+def test_define_socket_path(socket_path: str) -> None:
+    """Check environment variable overrides default socket path.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    """
+    assert define_socket_path() == socket_path  # nosec B101
+
+    with unittest.mock.patch.dict(os.environ, {SOCKET_ENVIRONMENT_VARIABLE: ""}):
+        assert define_socket_path().endswith(".sock")  # nosec B101
+
+
+@pytest.mark.parametrize(
+    ("arguments", "forwarded"),
+    [
+        (["general", "1 + 2"], True),
+        (["--profile-memory", "binary", "1", "+", "2"], True),
+        (["--stream"], False),
+        (["--stream=expressions.txt"], False),
+        (["--daemon"], False),
+        (["--str", "expressions.txt"], False),
+        (["--strea", "-"], False),
+        (["--stre=expressions.txt"], False),
+        (["--d"], False),
+        (["--profile-mem", "--str"], False),
+        (["--", "general", "1 + 2"], True),
+    ],
+)
+def test_can_forward(arguments: list[str], forwarded: bool) -> None:
+    """Check invocations depending on invoking process are not forwarded.
+
+    Parameters
+    ----------
+    arguments : list[str]
+        command line arguments, without program name
+    forwarded : bool
+        whether invocation can be forwarded
+    """
+    assert can_forward(arguments) == forwarded  # nosec B101
+
+
+def test_forward_without_daemon(socket_path: str) -> None:
+    """Check nothing is forwarded without a running daemon.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    """
+    assert forward_to_daemon(["general", "1 + 2"], socket_path) is None  # nosec B101
+
+
+@pytest.mark.parametrize(
+    ("arguments", "stdout", "exit_code"),
+    [
+        (["general", "1 + 2"], "Result = 3.0", 0),
+        (["binary", "1", "x", "2"], "", module_that_can_be_invoked_from_cli.USAGE_EXIT_CODE),
+        (["--stream"], "", module_that_can_be_invoked_from_cli.USAGE_EXIT_CODE),
+    ],
+)
+def test_forward_to_daemon(
+    socket_path: str, arguments: list[str], stdout: str, exit_code: int
+) -> None:
+    """Check daemon answers outputs and exit status of invocation.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    arguments : list[str]
+        command line arguments, without program name
+    stdout : str
+        expected standard output
+    exit_code : int
+        expected exit status
+    """
+    with running_daemon(socket_path):
+        response = forward_to_daemon(arguments, socket_path)
+
+    assert response is not None  # nosec B101
+    assert response["stdout"] == stdout  # nosec B101
+    assert response["exit_code"] == exit_code  # nosec B101
+    assert bool(response["stderr"]) == bool(exit_code)  # nosec B101
+
+
+def test_client_console_calculator(socket_path: str, capsys: pytest.CaptureFixture) -> None:
+    """Check client gets same output with and without daemon.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    capsys : pytest.CaptureFixture
+        fixture capturing `sys.stdout` and `sys.stderr`
+    """
+    with unittest.mock.patch("sys.argv", ["prog", "general", "2 * 3"]):
+        module_that_can_forward_to_daemon.console_calculator()
+        local_result, _ = capsys.readouterr()
+
+        with running_daemon(socket_path):
+            module_that_can_forward_to_daemon.console_calculator()
+            forwarded_result, _ = capsys.readouterr()
+
+    assert local_result == forwarded_result == "Result = 6.0"  # nosec B101
+
+
+def test_client_exit_code(socket_path: str) -> None:
+    """Check client exits with status answered by daemon.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    """
+    with (
+        running_daemon(socket_path),
+        unittest.mock.patch("sys.argv", ["prog", "binary", "1"]),
+        pytest.raises(SystemExit) as exit_request,
+    ):
+        module_that_can_forward_to_daemon.console_calculator()
+
+    assert (
+        exit_request.value.code == module_that_can_be_invoked_from_cli.USAGE_EXIT_CODE
+    )  # nosec B101
+
+
+def test_stale_socket(socket_path: str) -> None:
+    """Check socket of a stopped daemon is replaced, and a running daemon is not.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    """
+    module_that_can_be_invoked_from_cli.create_daemon_server(socket_path).server_close()
+
+    with running_daemon(socket_path):
+        with pytest.raises(FileExistsError, match="already listening"):
+            module_that_can_be_invoked_from_cli.create_daemon_server(socket_path)
+
+        assert forward_to_daemon(["general", "1"], socket_path) is not None  # nosec B101
+
+
+def test_foreign_socket_path(socket_path: str) -> None:
+    """Check paths which are not sockets of current user are neither used nor replaced.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    """
+    planted_file = pathlib.Path(socket_path)
+    planted_file.write_text("not a socket", encoding="utf-8")
+
+    assert not is_own_socket(socket_path)  # nosec B101
+    assert forward_to_daemon(["general", "1"], socket_path) is None  # nosec B101
+
+    with pytest.raises(FileExistsError, match="not a socket owned by current user"):
+        module_that_can_be_invoked_from_cli.create_daemon_server(socket_path)
+
+    assert planted_file.read_text(encoding="utf-8") == "not a socket"  # nosec B101
+
+
+def test_socket_of_other_user(socket_path: str) -> None:
+    """Check socket created by another user is neither used nor replaced.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    """
+    with running_daemon(socket_path):
+        assert is_own_socket(socket_path)  # nosec B101
+
+        with unittest.mock.patch("os.getuid", return_value=os.getuid() + 1):
+            assert forward_to_daemon(["general", "1"], socket_path) is None  # nosec B101
+
+            with pytest.raises(FileExistsError, match="not a socket owned by current user"):
+                module_that_can_be_invoked_from_cli.create_daemon_server(socket_path)
+
+
+def test_stalled_client(socket_path: str) -> None:
+    """Check a client that never finishes its invocation does not block daemon.
+
+    Parameters
+    ----------
+    socket_path : str
+        path of Unix socket
+    """
+    with (
+        unittest.mock.patch.object(
+            module_that_can_be_invoked_from_cli.DaemonRequestHandler, "timeout", 0.1
+        ),
+        running_daemon(socket_path),
+        socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled_client,
+    ):
+        stalled_client.connect(socket_path)
+        stalled_client.sendall(b'{"arguments": ')
+
+        response = forward_to_daemon(["general", "1 + 2"], socket_path)
+        stalled_client.settimeout(module_that_can_forward_to_daemon.DAEMON_TIMEOUT)
+
+        assert stalled_client.recv(1) == b""  # nosec B101
+
+    assert response is not None  # nosec B101
+    assert response["stdout"] == "Result = 3.0"  # nosec B101
+
+
+def test_daemon_sub_parser_failure() -> None:
+    """Check failure when daemon is combined with a sub-command."""
+    with (
+        pytest.raises(SystemExit),
+        unittest.mock.patch("sys.argv", ["prog", "--daemon", "general", "1"]),
+    ):
+        module_that_can_be_invoked_from_cli.console_calculator()
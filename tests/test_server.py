@@ -0,0 +1,331 @@
+"""Define unit tests for HTTP calculator."""
+
+import asyncio
+import concurrent.futures
+import http
+import json
+import typing
+import unittest.mock
+
+import pytest
+
+import module_that_can_serve_http_from_cli
+from module_that_can_serve_http_from_cli import (
+    BATCH_PATH,
+    EVALUATE_PATH,
+    MAXIMUM_BATCH_SIZE,
+    MAXIMUM_BODY_SIZE,
+    STATISTICS_PATH,
+    EvaluationServer,
+)
+
+BINARY_PAYLOAD = {
+    "inputs": {"calculator_type": "binary", "first_number": 1, "operator": "+", "second_number": 2}
+}
+GENERAL_PAYLOAD = {"inputs": {"calculator_type": "general", "expression": "(1 + 2) * 3"}}
+FAILING_PAYLOAD = {"inputs": {"calculator_type": "general", "expression": "1 / 0"}}
+
+
+def format_request(method: str, path: str, payload: typing.Any = None) -> bytes:  # noqa: ANN401
+    """Serialise HTTP/1.1 request with JSON body.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method
+    path : str
+        requested path
+    payload : typing.Any, optional
+        body of request, by default empty
+
+    Returns
+    -------
+    bytes
+        request line, headers and body
+    """
+    body = b"" if payload is None else json.dumps(payload).encode()
+
+    return (
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, dict[str, str], typing.Any]:
+    """Read one HTTP response.
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+        incoming stream of connection
+
+    Returns
+    -------
+    tuple[int, dict[str, str], typing.Any]
+        status code, headers and decoded JSON body
+    """
+    status_line = await reader.readline()
+    headers = {}
+    while (header_line := await reader.readline()).strip():
+        name, _, value = header_line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    body = await reader.readexactly(int(headers["content-length"]))
+
+    return int(status_line.split()[1]), headers, json.loads(body)
+
+
+async def exchange(requests: list[bytes]) -> list[tuple[int, dict[str, str], typing.Any]]:
+    """Send requests one after another over a single connection to a fresh server.
+
+    Parameters
+    ----------
+    requests : list[bytes]
+        serialised requests
+
+    Returns
+    -------
+    list[tuple[int, dict[str, str], typing.Any]]
+        status code, headers and decoded JSON body of every response
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        evaluation_server = EvaluationServer(executor=executor)
+        server = await asyncio.start_server(evaluation_server.handle_connection, "127.0.0.1", 0)
+
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            responses = []
+            for request in requests:
+                writer.write(request)
+                await writer.drain()
+                responses.append(await read_response(reader))
+
+            writer.close()
+            await writer.wait_closed()
+
+    return responses
+
+
+def test_keep_alive_connection() -> None:
+    """Check several requests are answered over one connection, and counted in statistics."""
+    responses = asyncio.run(
+        exchange(
+            [
+                format_request("POST", EVALUATE_PATH, GENERAL_PAYLOAD),
+                format_request("POST", EVALUATE_PATH, FAILING_PAYLOAD),
+                format_request(
+                    "POST", BATCH_PATH, [BINARY_PAYLOAD, FAILING_PAYLOAD, GENERAL_PAYLOAD]
+                ),
+                format_request("GET", STATISTICS_PATH),
+            ]
+        )
+    )
+    general, failing, batch, statistics = responses
+
+    assert general[0] == http.HTTPStatus.OK  # nosec B101
+    assert general[1]["connection"] == "keep-alive"  # nosec B101
+    assert general[2] == {"result": 9.0}  # nosec B101
+    assert failing[0] == http.HTTPStatus.UNPROCESSABLE_ENTITY  # nosec B101
+    assert "Division by zero" in failing[2]["error"]  # nosec B101
+    assert batch[0] == http.HTTPStatus.OK  # nosec B101
+    assert [sorted(record) for record in batch[2]] == [  # nosec B101
+        ["result"],
+        ["error"],
+        ["result"],
+    ]
+    assert statistics[2]["requests"] == len(responses) - 1  # nosec B101
+    assert statistics[2]["evaluations"] == len(batch[2]) + 2  # nosec B101
+    assert statistics[2]["failures"] == 2  # noqa: PLR2004 # nosec B101
+
+
+def test_connection_close() -> None:
+    """Check connection is closed when client asks for it."""
+    request = (
+        f"GET {STATISTICS_PATH} HTTP/1.1\r\nConnection: close\r\nContent-Length: 0\r\n\r\n"
+    ).encode()
+    ((status, headers, _),) = asyncio.run(exchange([request]))
+
+    assert status == http.HTTPStatus.OK  # nosec B101
+    assert headers["connection"] == "close"  # nosec B101
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body", "status"),
+    [
+        ("GET", "/unknown", b"", http.HTTPStatus.NOT_FOUND),
+        ("GET", EVALUATE_PATH, b"", http.HTTPStatus.METHOD_NOT_ALLOWED),
+        ("POST", STATISTICS_PATH, b"", http.HTTPStatus.METHOD_NOT_ALLOWED),
+        ("POST", EVALUATE_PATH, b"not json", http.HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("POST", EVALUATE_PATH, b'{"inputs": {}}', http.HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("POST", BATCH_PATH, b"{}", http.HTTPStatus.UNPROCESSABLE_ENTITY),
+        (
+            "POST",
+            BATCH_PATH,
+            json.dumps([BINARY_PAYLOAD] * (MAXIMUM_BATCH_SIZE + 1)).encode(),
+            http.HTTPStatus.UNPROCESSABLE_ENTITY,
+        ),
+    ],
+)
+def test_dispatch_failure(method: str, path: str, body: bytes, status: http.HTTPStatus) -> None:
+    """Check failure statuses of unsupported requests.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method
+    path : str
+        requested path
+    body : bytes
+        content of request
+    status : http.HTTPStatus
+        expected status of response
+    """
+    response_status, payload = asyncio.run(EvaluationServer().dispatch(method, path, body))
+
+    assert response_status == status  # nosec B101
+    assert "error" in payload  # nosec B101
+
+
+@pytest.mark.parametrize(
+    "partial_request",
+    [b"Host: localhost\r\n", b"Content-Length: 10\r\n\r\n{}"],
+)
+def test_stalled_request(partial_request: bytes) -> None:
+    """Check client stopping in middle of headers or body is answered and disconnected.
+
+    Parameters
+    ----------
+    partial_request : bytes
+        incomplete headers and body sent after request line
+    """
+
+    async def handle_partial_request() -> tuple[http.HTTPStatus, typing.Any, bool]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(partial_request)
+
+        return await EvaluationServer(request_timeout=0.01).handle_request(
+            f"POST {EVALUATE_PATH} HTTP/1.1\r\n".encode(), reader
+        )
+
+    status, payload, keep_alive = asyncio.run(handle_partial_request())
+
+    assert status == http.HTTPStatus.REQUEST_TIMEOUT  # nosec B101
+    assert payload == {"error": "Request was not received in time."}  # nosec B101
+    assert not keep_alive  # nosec B101
+
+
+@pytest.mark.parametrize(
+    ("content_length", "status"),
+    [
+        ("ten", http.HTTPStatus.BAD_REQUEST),
+        ("-1", http.HTTPStatus.BAD_REQUEST),
+        (str(MAXIMUM_BODY_SIZE + 1), http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE),
+    ],
+)
+def test_rejected_content_length(content_length: str, status: http.HTTPStatus) -> None:
+    """Check malformed and oversized bodies are rejected before being read.
+
+    Parameters
+    ----------
+    content_length : str
+        value of ``Content-Length`` header
+    status : http.HTTPStatus
+        expected status of response
+    """
+
+    async def handle_rejected_request() -> tuple[http.HTTPStatus, typing.Any, bool]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(f"Content-Length: {content_length}\r\n\r\n".encode())
+
+        return await EvaluationServer().handle_request(
+            f"POST {EVALUATE_PATH} HTTP/1.1\r\n".encode(), reader
+        )
+
+    response_status, payload, keep_alive = asyncio.run(handle_rejected_request())
+
+    assert response_status == status  # nosec B101
+    assert "error" in payload  # nosec B101
+    assert not keep_alive  # nosec B101
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [
+        {"calculator_type": "general", "expression": "9" * 400 + " * 10"},
+        {"calculator_type": "general", "expression": "9" * 400 + " - " + "9" * 400},
+        {"calculator_type": "binary", "first_number": 1e308, "operator": "*", "second_number": 10},
+    ],
+)
+def test_non_finite_result(inputs: dict[str, typing.Any]) -> None:
+    """Check infinite and NaN results are answered as errors in valid JSON.
+
+    Parameters
+    ----------
+    inputs : dict[str, typing.Any]
+        inputs for the calculator with a result that is not finite
+    """
+    request = format_request("POST", EVALUATE_PATH, {"inputs": inputs})
+    ((status, _, payload),) = asyncio.run(exchange([request]))
+
+    assert status == http.HTTPStatus.UNPROCESSABLE_ENTITY  # nosec B101
+    assert payload["error"].startswith("Result is not finite")  # nosec B101
+
+
+def test_format_response_non_finite() -> None:
+    """Check payloads which can not be represented in JSON are answered as server errors."""
+    response = module_that_can_serve_http_from_cli.format_response(
+        http.HTTPStatus.OK, {"result": float("inf")}, keep_alive=False
+    )
+    head, _, body = response.partition(b"\r\n\r\n")
+
+    assert head.startswith(b"HTTP/1.1 500 ")  # nosec B101
+    assert json.loads(body) == {"error": "Response can not be represented in JSON."}  # nosec B101
+
+
+def test_chunked_batch() -> None:
+    """Check batch split into several chunks is answered in order."""
+    batch = [GENERAL_PAYLOAD, FAILING_PAYLOAD, BINARY_PAYLOAD] * 3
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        status, response = asyncio.run(
+            EvaluationServer(executor=executor, chunksize=2).dispatch(
+                "POST", BATCH_PATH, json.dumps(batch).encode()
+            )
+        )
+
+    assert status == http.HTTPStatus.OK  # nosec B101
+    assert isinstance(response, list)  # nosec B101
+    assert [record.get("result") for record in response] == [9.0, None, 3.0] * 3  # nosec B101
+
+
+def test_evaluation_timeout() -> None:
+    """Check evaluations exceeding timeout are answered with an error."""
+    evaluation_server = EvaluationServer(timeout=1e-9)
+    payload = {"inputs": {"calculator_type": "general", "expression": " + ".join(["1"] * 10000)}}
+
+    status, response = asyncio.run(
+        evaluation_server.dispatch("POST", EVALUATE_PATH, json.dumps(payload).encode())
+    )
+
+    assert status == http.HTTPStatus.UNPROCESSABLE_ENTITY  # nosec B101
+    assert isinstance(response, dict)  # nosec B101
+    assert response["error"].startswith("Evaluation timed out")  # nosec B101
+
+
+def test_capture_server_inputs() -> None:
+    """Check command line arguments are captured."""
+    with unittest.mock.patch("sys.argv", ["prog", "--port", "0", "--workers", "2"]):
+        server_inputs = module_that_can_serve_http_from_cli.capture_server_inputs()
+
+    assert server_inputs.port == 0  # nosec B101
+    assert server_inputs.workers == 2  # noqa: PLR2004 # nosec B101
+
+
+def test_capture_server_inputs_failure() -> None:
+    """Check failure for invalid number of workers."""
+    with (
+        pytest.raises(ValueError, match="greater than 0"),
+        unittest.mock.patch("sys.argv", ["prog", "--workers", "0"]),
+    ):
+        module_that_can_serve_http_from_cli.capture_server_inputs()
@@ -1,3 +1,4 @@
+import socketserver
 import typing
 
 from package_name_to_import_with import (
@@ -6,9 +7,16 @@ from package_name_to_import_with import (
     CustomStrEnum,
 )
 
+STANDARD_INPUT: str
+STREAM_PROFILE_LABEL: str
+USAGE_EXIT_CODE: int
+DAEMON_REQUEST_TIMEOUT: float
+
 class CalculatorType(CustomStrEnum):
     BINARY: str
     GENERAL: str
+    STREAM: str
+    DAEMON: str
 
 class BinaryInputs(CustomPydanticBaseModel):
     calculator_type: typing.Literal[CalculatorType.BINARY]
@@ -20,8 +28,44 @@ class GeneralInputs(CustomPydanticBaseModel):
     calculator_type: typing.Literal[CalculatorType.GENERAL]
     expression: str
 
+class StreamInputs(CustomPydanticBaseModel):
+    calculator_type: typing.Literal[CalculatorType.STREAM]
+    source: str
+    workers: int | None
+    chunksize: int
+    pause_gc: bool
+
+class DaemonInputs(CustomPydanticBaseModel):
+    calculator_type: typing.Literal[CalculatorType.DAEMON]
+    socket_path: str
+
 class UserInputs(CustomPydanticBaseModel):
-    inputs: BinaryInputs | GeneralInputs
+    inputs: BinaryInputs | GeneralInputs | StreamInputs | DaemonInputs
+    profile_memory: bool
+
+def capture_user_inputs(command_line_arguments: list[str] | None = ...) -> UserInputs: ...
+def stream_calculator(
+    source: str,
+    workers: int | None = ...,
+    chunksize: int = ...,
+    pause_gc: bool = ...,
+    profile_memory: bool = ...,
+) -> None: ...
+
+class DaemonRequest(CustomPydanticBaseModel):
+    arguments: list[str]
+
+class DaemonResponse(CustomPydanticBaseModel):
+    stdout: str
+    stderr: str
+    exit_code: int
+
+def run_console_calculator(command_line_arguments: list[str]) -> DaemonResponse: ...
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    timeout: float
+    def handle(self: DaemonRequestHandler) -> None: ...
 
-def capture_user_inputs() -> UserInputs: ...
-def console_calculator() -> None: ...
+def create_daemon_server(socket_path: str) -> socketserver.UnixStreamServer: ...
+def serve_daemon(socket_path: str) -> None: ...
+def console_calculator(command_line_arguments: list[str] | None = ...) -> None: ...
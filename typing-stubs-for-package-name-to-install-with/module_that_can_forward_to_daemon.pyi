@@ -0,0 +1,15 @@
+import typing
+
+SOCKET_ENVIRONMENT_VARIABLE: str
+SOCKET_FILE_NAME: str
+DAEMON_TIMEOUT: float
+LOCAL_ONLY_FLAGS: frozenset[str]
+
+def define_socket_path() -> str: ...
+def is_own_socket(socket_path: str) -> bool: ...
+def is_local_only_flag(name: str) -> bool: ...
+def can_forward(arguments: list[str]) -> bool: ...
+def forward_to_daemon(
+    arguments: list[str], socket_path: str | None = ...
+) -> dict[str, typing.Any] | None: ...
+def console_calculator() -> None: ...
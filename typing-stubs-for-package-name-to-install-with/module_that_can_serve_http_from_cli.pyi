@@ -0,0 +1,112 @@
+import asyncio
+import concurrent.futures
+import http
+import typing
+
+import pydantic
+
+from module_that_can_be_invoked_from_cli import BinaryInputs, GeneralInputs
+from package_name_to_import_with import CustomPydanticBaseModel
+
+DEFAULT_HOST: str
+DEFAULT_PORT: int
+DEFAULT_KEEP_ALIVE_TIMEOUT: float
+DEFAULT_REQUEST_TIMEOUT: float
+MAXIMUM_BODY_SIZE: int
+MAXIMUM_HEADER_COUNT: int
+MAXIMUM_BATCH_SIZE: int
+
+EVALUATE_PATH: str
+BATCH_PATH: str
+STATISTICS_PATH: str
+
+JSON_CONTENT_TYPE: str
+
+JsonPayload: typing.TypeAlias = dict[str, typing.Any] | list[dict[str, typing.Any]]
+
+class RequestRejectedError(ValueError):
+    status: http.HTTPStatus
+    def __init__(self: RequestRejectedError, status: http.HTTPStatus, message: str) -> None: ...
+
+class EvaluationInputs(CustomPydanticBaseModel):
+    inputs: BinaryInputs | GeneralInputs
+
+BATCH_ADAPTER: pydantic.TypeAdapter[list[EvaluationInputs]]
+
+class ServerStatistics(CustomPydanticBaseModel):
+    requests: int
+    evaluations: int
+    failures: int
+    uptime_seconds: float
+    evaluations_per_second: float
+    mean_latency_seconds: float
+    maximum_latency_seconds: float
+
+class StatisticsRecorder:
+    def __init__(self: StatisticsRecorder) -> None: ...
+    def record(
+        self: StatisticsRecorder, latency: float, evaluations: int, failures: int
+    ) -> None: ...
+    @property
+    def statistics(self: StatisticsRecorder) -> ServerStatistics: ...
+
+def evaluate_inputs(inputs: BinaryInputs | GeneralInputs) -> dict[str, typing.Any]: ...
+def evaluate_batch_inputs(
+    batch_inputs: list[BinaryInputs | GeneralInputs],
+) -> list[dict[str, typing.Any]]: ...
+def format_validation_error(error: pydantic.ValidationError) -> dict[str, typing.Any]: ...
+def format_response(status: http.HTTPStatus, payload: JsonPayload, keep_alive: bool) -> bytes: ...
+
+class EvaluationServer:
+    executor: concurrent.futures.Executor | None
+    timeout: float | None
+    keep_alive_timeout: float
+    chunksize: int
+    request_timeout: float
+    statistics_recorder: StatisticsRecorder
+    def __init__(
+        self: EvaluationServer,
+        executor: concurrent.futures.Executor | None = ...,
+        timeout: float | None = ...,
+        keep_alive_timeout: float = ...,
+        chunksize: int = ...,
+        request_timeout: float = ...,
+    ) -> None: ...
+    async def evaluate(
+        self: EvaluationServer, inputs: BinaryInputs | GeneralInputs
+    ) -> dict[str, typing.Any]: ...
+    async def evaluate_chunk(
+        self: EvaluationServer, batch_inputs: list[BinaryInputs | GeneralInputs]
+    ) -> list[dict[str, typing.Any]]: ...
+    async def dispatch(
+        self: EvaluationServer, method: str, path: str, body: bytes
+    ) -> tuple[http.HTTPStatus, JsonPayload]: ...
+    async def handle_connection(
+        self: EvaluationServer, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None: ...
+    @staticmethod
+    async def read_headers(reader: asyncio.StreamReader) -> dict[str, str] | None: ...
+    async def read_request(
+        self: EvaluationServer, request_line: bytes, reader: asyncio.StreamReader
+    ) -> tuple[str, str, bytes, bool]: ...
+    async def handle_request(
+        self: EvaluationServer, request_line: bytes, reader: asyncio.StreamReader
+    ) -> tuple[http.HTTPStatus, JsonPayload, bool]: ...
+
+async def serve(
+    host: str = ...,
+    port: int = ...,
+    workers: int | None = ...,
+    timeout: float | None = ...,
+    keep_alive_timeout: float = ...,
+) -> None: ...
+
+class ServerInputs(CustomPydanticBaseModel):
+    host: str
+    port: int
+    workers: int | None
+    timeout: float | None
+    keep_alive_timeout: float
+
+def capture_server_inputs() -> ServerInputs: ...
+def http_calculator() -> None: ...
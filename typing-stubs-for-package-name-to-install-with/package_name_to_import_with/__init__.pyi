@@ -1,14 +1,30 @@
+from .caching_module import BoundedCache, CacheStatistics, EvictionPolicy
 from .calculator_sub_package import BinaryArithmeticOperator, calculate_results
-from .garbage_collection_module import define_garbage_collection_decorator
-from .simplify import solve_simplification
+from .garbage_collection_module import (
+    GarbageCollectionPolicy,
+    GarbageCollector,
+    define_garbage_collection_decorator,
+)
+from .simplify import CompiledExpression, compile_expression, solve_simplification
 from .utils import CustomFloatEnum, CustomPydanticBaseModel, CustomStrEnum
 
 __all__ = [
     "BinaryArithmeticOperator",
+    "BoundedCache",
+    "CacheStatistics",
+    "CompiledExpression",
     "CustomFloatEnum",
     "CustomPydanticBaseModel",
     "CustomStrEnum",
+    "EvictionPolicy",
+    "GarbageCollectionPolicy",
+    "GarbageCollector",
     "calculate_results",
+    "compile_expression",
     "define_garbage_collection_decorator",
     "solve_simplification",
 ]
+
+def read_package_version() -> str: ...
+
+__version__: str
@@ -0,0 +1,69 @@
+import asyncio
+import collections.abc
+import concurrent.futures
+import typing
+import weakref
+
+import pydantic
+
+from .streaming_module import EvaluationRecord
+
+__all__ = [
+    "DEFAULT_MAXIMUM_IN_FLIGHT",
+    "INLINE_EXPRESSION_LENGTH",
+    "MAXIMUM_EXECUTOR_SUBMISSIONS",
+    "SUBMISSION_LIMITERS",
+    "define_submission_limiter",
+    "evaluate_expression_async",
+    "run_evaluation",
+    "solve_many_async",
+    "solve_many_async_stream",
+    "solve_simplification_async",
+    "submit_evaluation",
+]
+
+DEFAULT_MAXIMUM_IN_FLIGHT: int
+INLINE_EXPRESSION_LENGTH: int
+MAXIMUM_EXECUTOR_SUBMISSIONS: int
+
+_EvaluationResult = typing.TypeVar("_EvaluationResult")
+
+SUBMISSION_LIMITERS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]
+
+def define_submission_limiter() -> asyncio.Semaphore: ...
+async def submit_evaluation(
+    evaluation: collections.abc.Callable[[], _EvaluationResult],
+    executor: concurrent.futures.Executor | None = ...,
+) -> _EvaluationResult: ...
+async def run_evaluation(
+    evaluation: collections.abc.Callable[[], _EvaluationResult],
+    inline: bool,
+    executor: concurrent.futures.Executor | None = ...,
+    timeout: float | None = ...,
+) -> _EvaluationResult: ...
+async def solve_simplification_async(
+    expression: str,
+    executor: concurrent.futures.Executor | None = ...,
+    timeout: pydantic.PositiveFloat | None = ...,
+    validate: bool = ...,
+) -> float: ...
+async def evaluate_expression_async(
+    expression: str,
+    executor: concurrent.futures.Executor | None = ...,
+    timeout: float | None = ...,
+    validate: bool = ...,
+) -> EvaluationRecord: ...
+def solve_many_async_stream(
+    expressions: collections.abc.Iterable[str],
+    executor: concurrent.futures.Executor | None = ...,
+    maximum_in_flight: pydantic.PositiveInt = ...,
+    timeout: pydantic.PositiveFloat | None = ...,
+    validate: bool = ...,
+) -> collections.abc.AsyncIterator[EvaluationRecord]: ...
+async def solve_many_async(
+    expressions: collections.abc.Iterable[str],
+    executor: concurrent.futures.Executor | None = ...,
+    maximum_in_flight: pydantic.PositiveInt = ...,
+    timeout: pydantic.PositiveFloat | None = ...,
+    validate: bool = ...,
+) -> list[EvaluationRecord]: ...
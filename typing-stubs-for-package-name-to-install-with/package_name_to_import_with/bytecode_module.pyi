@@ -0,0 +1,75 @@
+import array
+import collections.abc
+import enum
+import struct
+import typing
+
+import pydantic
+
+from .calculator_sub_package import BinaryArithmeticOperation, BinaryArithmeticOperator
+from .simplify import Variable
+
+__all__ = [
+    "BYTECODE_HEADER",
+    "OPCODE_OPERATIONS",
+    "OPCODE_OPERATORS",
+    "OPERATOR_OPCODES",
+    "VARIABLE_NAME_SEPARATOR",
+    "ExpressionBytecode",
+    "Opcode",
+    "PostfixElement",
+    "compile_bytecode",
+]
+
+PostfixElement: typing.TypeAlias = BinaryArithmeticOperator | Variable | float
+
+BYTECODE_HEADER: struct.Struct
+VARIABLE_NAME_SEPARATOR: str
+
+class Opcode(enum.IntEnum):
+    PUSH_CONSTANT: int
+    PUSH_VARIABLE: int
+    ADDITION: int
+    SUBTRACTION: int
+    MULTIPLICATION: int
+    DIVISION: int
+
+OPERATOR_OPCODES: dict[BinaryArithmeticOperator, Opcode]
+OPCODE_OPERATORS: dict[Opcode, BinaryArithmeticOperator]
+OPCODE_OPERATIONS: dict[int, BinaryArithmeticOperation]
+
+class ExpressionBytecode:
+    opcodes: array.array[int]
+    constants: array.array[float]
+    variable_indices: array.array[int]
+    variables: tuple[str, ...]
+    def __init__(
+        self: ExpressionBytecode,
+        opcodes: array.array[int],
+        constants: array.array[float],
+        variable_indices: array.array[int],
+        variables: tuple[str, ...],
+    ) -> None: ...
+    @classmethod
+    def from_postfix_expression(
+        cls: type[ExpressionBytecode],
+        postfix_expression: collections.abc.Iterable[PostfixElement],
+    ) -> ExpressionBytecode: ...
+    def to_postfix_expression(self: ExpressionBytecode) -> list[PostfixElement]: ...
+    def evaluate(
+        self: ExpressionBytecode, variable_values: dict[str, float] | None = ...
+    ) -> float: ...
+    @property
+    def nbytes(self: ExpressionBytecode) -> int: ...
+    def to_bytes(self: ExpressionBytecode) -> bytes: ...
+    @classmethod
+    def from_bytes(cls: type[ExpressionBytecode], data: bytes) -> ExpressionBytecode: ...
+    def __reduce__(
+        self: ExpressionBytecode,
+    ) -> tuple[collections.abc.Callable[[bytes], ExpressionBytecode], tuple[bytes]]: ...
+    def __eq__(self: ExpressionBytecode, other: object) -> bool: ...
+    def __hash__(self: ExpressionBytecode) -> int: ...
+
+def compile_bytecode(
+    expression: str, allow_variables: bool = ..., optimise: bool = ...
+) -> pydantic.InstanceOf[ExpressionBytecode]: ...
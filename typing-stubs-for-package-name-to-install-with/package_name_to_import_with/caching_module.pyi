@@ -0,0 +1,40 @@
+import collections.abc
+import typing
+
+from .utils import CustomPydanticBaseModel, CustomStrEnum
+
+__all__ = ["BoundedCache", "CacheStatistics", "EvictionPolicy"]
+
+_CachedValue = typing.TypeVar("_CachedValue")
+
+class EvictionPolicy(CustomStrEnum):
+    LEAST_RECENTLY_USED: str
+    FIRST_IN_FIRST_OUT: str
+
+class CacheStatistics(CustomPydanticBaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maximum_size: int
+    @property
+    def hit_ratio(self: CacheStatistics) -> float: ...
+
+class BoundedCache(typing.Generic[_CachedValue]):
+    maximum_size: int
+    eviction_policy: EvictionPolicy
+    def __init__(
+        self: BoundedCache[_CachedValue],
+        maximum_size: int = ...,
+        eviction_policy: EvictionPolicy = ...,
+    ) -> None: ...
+    def __len__(self: BoundedCache[_CachedValue]) -> int: ...
+    def __contains__(self: BoundedCache[_CachedValue], key: object) -> bool: ...
+    @property
+    def statistics(self: BoundedCache[_CachedValue]) -> CacheStatistics: ...
+    def get_or_compute(
+        self: BoundedCache[_CachedValue],
+        key: str,
+        computation: collections.abc.Callable[[str], _CachedValue],
+    ) -> _CachedValue: ...
+    def clear(self: BoundedCache[_CachedValue]) -> None: ...
@@ -10,24 +10,38 @@ from .basics import (
 )
 from .wrapper_module import (
     BINARY_ARITHMETIC_OPERATIONS,
+    TRUSTED_BINARY_ARITHMETIC_OPERATIONS,
     BinaryArithmeticExpression,
     BinaryArithmeticOperation,
     BinaryArithmeticOperator,
+    BinaryArithmeticRecord,
     calculate_results,
+    define_binary_arithmetic_expressions_adapter,
+    divide_trusted_numbers,
+    store_trusted_results,
+    validate_binary_arithmetic_expressions,
+    validate_binary_arithmetic_expressions_json,
 )
 
 __all__ = [
     "BINARY_ARITHMETIC_OPERATIONS",
+    "TRUSTED_BINARY_ARITHMETIC_OPERATIONS",
     "BinaryArithmeticExpression",
     "BinaryArithmeticOperation",
     "BinaryArithmeticOperator",
+    "BinaryArithmeticRecord",
     "IdentityElements",
     "InverseElements",
     "add_numbers",
     "calculate_results",
+    "define_binary_arithmetic_expressions_adapter",
     "divide_numbers",
+    "divide_trusted_numbers",
     "get_negative",
     "get_reciprocal",
     "multiply_numbers",
+    "store_trusted_results",
     "subtract_numbers",
+    "validate_binary_arithmetic_expressions",
+    "validate_binary_arithmetic_expressions_json",
 ]
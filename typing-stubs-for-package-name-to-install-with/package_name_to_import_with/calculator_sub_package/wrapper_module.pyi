@@ -1,14 +1,24 @@
+import collections.abc
 import functools
 import typing
 
+import pydantic
+
 from ..utils import CustomPydanticBaseModel, CustomStrEnum
 
 __all__ = [
     "BINARY_ARITHMETIC_OPERATIONS",
+    "TRUSTED_BINARY_ARITHMETIC_OPERATIONS",
     "BinaryArithmeticExpression",
     "BinaryArithmeticOperation",
     "BinaryArithmeticOperator",
+    "BinaryArithmeticRecord",
     "calculate_results",
+    "define_binary_arithmetic_expressions_adapter",
+    "divide_trusted_numbers",
+    "store_trusted_results",
+    "validate_binary_arithmetic_expressions",
+    "validate_binary_arithmetic_expressions_json",
 ]
 
 BinaryArithmeticOperation: typing.TypeAlias
@@ -21,6 +31,10 @@ class BinaryArithmeticOperator(CustomStrEnum):
 
 BINARY_ARITHMETIC_OPERATIONS: dict[BinaryArithmeticOperator, BinaryArithmeticOperation]
 
+def divide_trusted_numbers(dividend: float, divisor: float) -> float: ...
+
+TRUSTED_BINARY_ARITHMETIC_OPERATIONS: dict[BinaryArithmeticOperator, BinaryArithmeticOperation]
+
 class BinaryArithmeticExpression(CustomPydanticBaseModel):
     left_operand: float
     binary_operator: BinaryArithmeticOperator
@@ -31,6 +45,42 @@ class BinaryArithmeticExpression(CustomPydanticBaseModel):
     @functools.cached_property
     def result(self: BinaryArithmeticExpression) -> float: ...
 
+def define_binary_arithmetic_expressions_adapter() -> (
+    pydantic.TypeAdapter[list[BinaryArithmeticExpression]]
+): ...
+def store_trusted_results(
+    arithmetic_expressions: list[BinaryArithmeticExpression],
+) -> list[BinaryArithmeticExpression]: ...
+def validate_binary_arithmetic_expressions(
+    expressions: collections.abc.Iterable[typing.Any], compute_results: bool = True
+) -> list[BinaryArithmeticExpression]: ...
+def validate_binary_arithmetic_expressions_json(
+    data: str | bytes, compute_results: bool = True
+) -> list[BinaryArithmeticExpression]: ...
+
+class BinaryArithmeticRecord:
+    left_operand: float
+    binary_operator: BinaryArithmeticOperator
+    right_operand: float
+    def __init__(
+        self: BinaryArithmeticRecord,
+        left_operand: float,
+        binary_operator: BinaryArithmeticOperator,
+        right_operand: float,
+    ) -> None: ...
+    @classmethod
+    def from_expression(
+        cls: type[BinaryArithmeticRecord], arithmetic_expression: BinaryArithmeticExpression
+    ) -> BinaryArithmeticRecord: ...
+    @property
+    def operation(self: BinaryArithmeticRecord) -> BinaryArithmeticOperation: ...
+    @property
+    def result(self: BinaryArithmeticRecord) -> float: ...
+    def to_expression(self: BinaryArithmeticRecord) -> BinaryArithmeticExpression: ...
+    def model_dump(self: BinaryArithmeticRecord) -> dict[str, typing.Any]: ...
+    def __eq__(self: BinaryArithmeticRecord, other: object) -> bool: ...
+    def __hash__(self: BinaryArithmeticRecord) -> int: ...
+
 def calculate_results(
     first_input: float, operator: BinaryArithmeticOperator, second_input: float
 ) -> float: ...
@@ -0,0 +1,49 @@
+import collections.abc
+import typing
+
+from .calculator_sub_package import BinaryArithmeticOperator
+from .simplify import Variable
+
+__all__ = [
+    "GENERATED_FUNCTION_BUILTINS",
+    "GENERATED_FUNCTION_NAME",
+    "INDENTATION",
+    "MALFORMED_POSTFIX_MESSAGE",
+    "OPERATOR_TEMPLATES",
+    "STACK_SLOT_PREFIX",
+    "ZERO_DIVISION_MESSAGE",
+    "GeneratedFunction",
+    "PostfixElement",
+    "compile_function",
+    "define_parameter_names",
+    "format_constant",
+    "generate_function",
+    "generate_source",
+]
+
+PostfixElement: typing.TypeAlias = BinaryArithmeticOperator | Variable | float
+GeneratedFunction: typing.TypeAlias = collections.abc.Callable[..., float]
+
+GENERATED_FUNCTION_NAME: str
+STACK_SLOT_PREFIX: str
+ZERO_DIVISION_MESSAGE: str
+MALFORMED_POSTFIX_MESSAGE: str
+INDENTATION: str
+
+OPERATOR_TEMPLATES: dict[BinaryArithmeticOperator, str]
+GENERATED_FUNCTION_BUILTINS: dict[str, typing.Any]
+
+def format_constant(constant: float) -> str: ...
+def define_parameter_names(variables: collections.abc.Sequence[str]) -> list[str]: ...
+def generate_source(
+    postfix_expression: collections.abc.Iterable[PostfixElement],
+    variables: collections.abc.Sequence[str] = ...,
+) -> str: ...
+def compile_function(
+    postfix_expression: collections.abc.Iterable[PostfixElement],
+    variables: collections.abc.Sequence[str] = ...,
+    expression: str | None = ...,
+) -> GeneratedFunction: ...
+def generate_function(
+    expression: str, allow_variables: bool = ..., optimise: bool = ...
+) -> GeneratedFunction: ...
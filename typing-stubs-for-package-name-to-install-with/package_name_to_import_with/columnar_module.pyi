@@ -0,0 +1,77 @@
+import array
+import collections.abc
+import enum
+import struct
+import typing
+
+from .calculator_sub_package import (
+    BinaryArithmeticExpression,
+    BinaryArithmeticOperator,
+    BinaryArithmeticRecord,
+)
+
+__all__ = [
+    "COLUMNAR_FORMAT_VERSION",
+    "COLUMNAR_HEADER",
+    "COLUMNAR_MAGIC",
+    "CSV_HEADER",
+    "CSV_SEPARATOR",
+    "ArithmeticExpression",
+    "ExpressionRow",
+    "ResultColumns",
+    "ResultRow",
+    "ResultStatus",
+    "tabulate_results",
+]
+
+ArithmeticExpression: typing.TypeAlias = BinaryArithmeticExpression | BinaryArithmeticRecord
+ExpressionRow: typing.TypeAlias = tuple[float, BinaryArithmeticOperator, float]
+ResultRow: typing.TypeAlias = tuple[float, BinaryArithmeticOperator, float, float, ResultStatus]
+
+COLUMNAR_MAGIC: bytes
+COLUMNAR_FORMAT_VERSION: int
+COLUMNAR_HEADER: struct.Struct
+CSV_SEPARATOR: str
+CSV_HEADER: tuple[str, str, str, str, str]
+
+class ResultStatus(enum.IntEnum):
+    SUCCESS: int
+    ZERO_DIVISION: int
+
+class ResultColumns:
+    left_operands: array.array[float]
+    operator_codes: array.array[int]
+    right_operands: array.array[float]
+    results: array.array[float]
+    statuses: array.array[int]
+    def __init__(
+        self: ResultColumns,
+        left_operands: array.array[float] | None = None,
+        operator_codes: array.array[int] | None = None,
+        right_operands: array.array[float] | None = None,
+        results: array.array[float] | None = None,
+        statuses: array.array[int] | None = None,
+    ) -> None: ...
+    @property
+    def columns(self: ResultColumns) -> tuple[array.array[typing.Any], ...]: ...
+    def extend(self: ResultColumns, rows: collections.abc.Iterable[ExpressionRow]) -> None: ...
+    def extend_expressions(
+        self: ResultColumns,
+        arithmetic_expressions: collections.abc.Iterable[ArithmeticExpression],
+    ) -> None: ...
+    def __len__(self: ResultColumns) -> int: ...
+    @property
+    def nbytes(self: ResultColumns) -> int: ...
+    def iterate_rows(self: ResultColumns) -> collections.abc.Iterator[ResultRow]: ...
+    def write_csv(self: ResultColumns, stream: typing.TextIO) -> None: ...
+    def to_csv(self: ResultColumns) -> str: ...
+    def to_bytes(self: ResultColumns) -> bytes: ...
+    @classmethod
+    def from_bytes(cls: type[ResultColumns], data: bytes) -> ResultColumns: ...
+    def __eq__(self: ResultColumns, other: object) -> bool: ...
+
+def tabulate_results(
+    left_operands: list[float],
+    binary_operators: list[BinaryArithmeticOperator],
+    right_operands: list[float],
+) -> ResultColumns: ...
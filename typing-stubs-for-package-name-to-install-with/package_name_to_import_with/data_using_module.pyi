@@ -14,5 +14,8 @@ class PackageMetadata(CustomPydanticBaseModel):
     @classmethod
     def validate_version(cls: PackageMetadata, version: str) -> str: ...
 
+def read_metadata_contents() -> str: ...
+def load_metadata() -> PackageMetadata: ...
+
 METADATA_CONTENTS: str
 METADATA: PackageMetadata
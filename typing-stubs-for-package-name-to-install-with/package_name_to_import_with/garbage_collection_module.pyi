@@ -1,9 +1,84 @@
+import contextlib
 import typing
 
-__all__ = ["FunctionType", "define_garbage_collection_decorator"]
+from .utils import CustomPydanticBaseModel
+
+__all__ = [
+    "OLDEST_GENERATION",
+    "CollectionPauseMonitor",
+    "CollectionPauses",
+    "FunctionType",
+    "GarbageCollectionBatch",
+    "GarbageCollectionBatchReport",
+    "GarbageCollectionPolicy",
+    "GarbageCollectionStatistics",
+    "GarbageCollectionThresholds",
+    "GarbageCollector",
+    "define_garbage_collection_decorator",
+    "monitor_collection_pauses",
+    "pause_garbage_collection",
+]
 
 FunctionType: typing.TypeAlias
 
+OLDEST_GENERATION: int
+
+GarbageCollectionThresholds: typing.TypeAlias = tuple[int, int, int]
+
+class GarbageCollectionPolicy(CustomPydanticBaseModel):
+    generation: int
+    every_n_calls: int
+    allocation_threshold: int | None
+    freeze: bool
+
+class GarbageCollectionStatistics(CustomPydanticBaseModel):
+    calls: int
+    collections: int
+    collected_objects: int
+    seconds: float
+
+class GarbageCollector:
+    policy: GarbageCollectionPolicy
+    def __init__(self: GarbageCollector, policy: GarbageCollectionPolicy | None = ...) -> None: ...
+    @property
+    def statistics(self: GarbageCollector) -> GarbageCollectionStatistics: ...
+    def after_call(self: GarbageCollector) -> None: ...
+    def decorate(
+        self: GarbageCollector, function_to_be_decorated: FunctionType
+    ) -> FunctionType: ...
+    def reset(self: GarbageCollector) -> None: ...
+
+class CollectionPauses(CustomPydanticBaseModel):
+    collections: int
+    collected_objects: int
+    seconds: float
+
+class CollectionPauseMonitor:
+    def __init__(self: CollectionPauseMonitor) -> None: ...
+    def __call__(self: CollectionPauseMonitor, phase: str, info: dict[str, int]) -> None: ...
+    @property
+    def pauses(self: CollectionPauseMonitor) -> CollectionPauses: ...
+
+def monitor_collection_pauses() -> contextlib.AbstractContextManager[CollectionPauseMonitor]: ...
+
+class GarbageCollectionBatchReport(CustomPydanticBaseModel):
+    automatic_pauses: CollectionPauses
+    final_collection: GarbageCollectionStatistics
+    saved_seconds: float | None
+    @property
+    def pause_seconds(self: GarbageCollectionBatchReport) -> float: ...
+    def format_summary(self: GarbageCollectionBatchReport) -> str: ...
+
+class GarbageCollectionBatch:
+    report: GarbageCollectionBatchReport | None
+    def __init__(self: GarbageCollectionBatch) -> None: ...
+
+def pause_garbage_collection(
+    thresholds: GarbageCollectionThresholds | None = ...,
+    final_generation: int = ...,
+    baseline: CollectionPauses | None = ...,
+) -> contextlib.AbstractContextManager[GarbageCollectionBatch]: ...
 def define_garbage_collection_decorator(
     function_to_be_decorated: FunctionType,
+    policy: GarbageCollectionPolicy | None = ...,
 ) -> FunctionType: ...
@@ -0,0 +1,57 @@
+import collections.abc
+import contextlib
+import threading
+import typing
+
+from .utils import CustomStrEnum
+
+__all__ = [
+    "DEFAULT_DURATION_BUCKETS",
+    "STAGE_OBSERVERS",
+    "STAGE_OBSERVERS_LOCK",
+    "Stage",
+    "StageMetrics",
+    "StageObserver",
+    "StageTiming",
+    "add_stage_observer",
+    "observe_stages",
+    "remove_stage_observer",
+    "report_stage_timing",
+]
+
+StageObserver: typing.TypeAlias = collections.abc.Callable[[StageTiming], None]
+
+DEFAULT_DURATION_BUCKETS: tuple[float, ...]
+
+class Stage(CustomStrEnum):
+    TOKENISATION: str
+    CONVERSION: str
+    EVALUATION: str
+
+class StageTiming(typing.NamedTuple):
+    stage: Stage
+    seconds: float
+    size: int
+
+STAGE_OBSERVERS: list[StageObserver]
+STAGE_OBSERVERS_LOCK: threading.Lock
+
+def add_stage_observer(observer: StageObserver) -> None: ...
+def remove_stage_observer(observer: StageObserver) -> None: ...
+def report_stage_timing(stage_timing: StageTiming) -> None: ...
+def observe_stages(
+    observer: StageObserver,
+) -> contextlib.AbstractContextManager[StageObserver]: ...
+
+class StageMetrics:
+    duration_buckets: tuple[float, ...]
+    counts: dict[str, int]
+    seconds: dict[str, float]
+    sizes: dict[str, int]
+    bucket_counts: dict[str, list[int]]
+
+    def __init__(
+        self: StageMetrics, duration_buckets: collections.abc.Sequence[float] = ...
+    ) -> None: ...
+    def __call__(self: StageMetrics, stage_timing: StageTiming) -> None: ...
+    def to_prometheus_text(self: StageMetrics, prefix: str = ...) -> str: ...
@@ -0,0 +1,51 @@
+import tracemalloc
+import typing
+
+from .utils import CustomPydanticBaseModel
+
+__all__ = [
+    "TRACEMALLOC_FILTERS",
+    "FunctionType",
+    "MemoryCheckpoint",
+    "MemoryProfile",
+    "MemoryProfiler",
+    "count_traced_blocks",
+    "define_memory_profiling_decorator",
+]
+
+FunctionType: typing.TypeAlias
+
+TRACEMALLOC_FILTERS: tuple[tracemalloc.Filter, ...]
+
+class MemoryProfile(CustomPydanticBaseModel):
+    label: str
+    peak_bytes: int
+    allocated_bytes: int
+    allocated_blocks: int | None
+
+class MemoryCheckpoint:
+    traced_bytes: int
+    def __init__(self: MemoryCheckpoint) -> None: ...
+    def measure(self: MemoryCheckpoint, label: str) -> MemoryProfile: ...
+
+def count_traced_blocks() -> tuple[int, int]: ...
+
+class MemoryProfiler:
+    def __init__(self: MemoryProfiler) -> None: ...
+    @property
+    def profiles(self: MemoryProfiler) -> list[MemoryProfile]: ...
+    def record(self: MemoryProfiler, memory_profile: MemoryProfile) -> None: ...
+    def profile_call(
+        self: MemoryProfiler,
+        label: str,
+        function_to_be_profiled: FunctionType,
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> typing.Any: ...
+    def decorate(self: MemoryProfiler, function_to_be_decorated: FunctionType) -> FunctionType: ...
+    def format_summary(self: MemoryProfiler) -> str: ...
+    def reset(self: MemoryProfiler) -> None: ...
+
+def define_memory_profiling_decorator(
+    function_to_be_decorated: FunctionType, memory_profiler: MemoryProfiler
+) -> FunctionType: ...
@@ -0,0 +1,49 @@
+import collections.abc
+import concurrent.futures
+import typing
+
+import pydantic
+
+from .streaming_module import EvaluationRecord
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "PENDING_CHUNKS_PER_WORKER",
+    "collect_completed_chunks",
+    "evaluate_chunk",
+    "solve_many",
+    "solve_many_as_completed",
+    "solve_many_stream",
+    "split_into_chunks",
+]
+
+DEFAULT_CHUNK_SIZE: int
+PENDING_CHUNKS_PER_WORKER: int
+
+_ChunkElement = typing.TypeVar("_ChunkElement")
+
+def evaluate_chunk(expressions: list[str], validate: bool = ...) -> list[EvaluationRecord]: ...
+def split_into_chunks(
+    expressions: collections.abc.Iterable[_ChunkElement], chunksize: int
+) -> collections.abc.Iterator[list[_ChunkElement]]: ...
+def collect_completed_chunks(
+    pending_chunks: dict[concurrent.futures.Future[list[EvaluationRecord]], int],
+) -> collections.abc.Iterator[tuple[int, EvaluationRecord]]: ...
+def solve_many_stream(
+    expressions: collections.abc.Iterable[str],
+    workers: pydantic.PositiveInt | None = ...,
+    chunksize: pydantic.PositiveInt = ...,
+    validate: bool = ...,
+) -> collections.abc.Iterator[EvaluationRecord]: ...
+def solve_many_as_completed(
+    expressions: collections.abc.Iterable[str],
+    workers: pydantic.PositiveInt | None = ...,
+    chunksize: pydantic.PositiveInt = ...,
+    validate: bool = ...,
+) -> collections.abc.Iterator[tuple[int, EvaluationRecord]]: ...
+def solve_many(
+    expressions: collections.abc.Iterable[str],
+    workers: pydantic.PositiveInt | None = ...,
+    chunksize: pydantic.PositiveInt = ...,
+    validate: bool = ...,
+) -> list[EvaluationRecord]: ...
@@ -0,0 +1,65 @@
+import os
+import pathlib
+
+from .bytecode_module import ExpressionBytecode
+from .simplify import CompiledExpression
+
+__all__ = [
+    "COUNT_STATEMENT",
+    "DEFAULT_BUSY_TIMEOUT",
+    "DEFAULT_MEMORY_MAP_SIZE",
+    "DELETE_STATEMENT",
+    "INSERT_STATEMENT",
+    "SCHEMA_STATEMENT",
+    "SELECT_STATEMENT",
+    "PersistentExpressionCache",
+    "create_cache_key",
+]
+
+DEFAULT_MEMORY_MAP_SIZE: int
+DEFAULT_BUSY_TIMEOUT: float
+SCHEMA_STATEMENT: str
+SELECT_STATEMENT: str
+INSERT_STATEMENT: str
+COUNT_STATEMENT: str
+DELETE_STATEMENT: str
+
+def create_cache_key(
+    expression: str, allow_variables: bool = ..., optimise: bool = ..., version: str = ...
+) -> str: ...
+
+class PersistentExpressionCache:
+    path: pathlib.Path
+    read_only: bool
+    memory_map_size: int
+    busy_timeout: float
+    version: str
+
+    def __init__(
+        self: PersistentExpressionCache,
+        path: str | os.PathLike[str],
+        read_only: bool = ...,
+        memory_map_size: int = ...,
+        busy_timeout: float = ...,
+    ) -> None: ...
+    def __len__(self: PersistentExpressionCache) -> int: ...
+    def get_bytecode(
+        self: PersistentExpressionCache,
+        expression: str,
+        allow_variables: bool = ...,
+        optimise: bool = ...,
+    ) -> ExpressionBytecode | None: ...
+    def compile_bytecode(
+        self: PersistentExpressionCache,
+        expression: str,
+        allow_variables: bool = ...,
+        optimise: bool = ...,
+    ) -> ExpressionBytecode: ...
+    def compile_expression(
+        self: PersistentExpressionCache,
+        expression: str,
+        allow_variables: bool = ...,
+        optimise: bool = ...,
+    ) -> CompiledExpression: ...
+    def clear(self: PersistentExpressionCache) -> None: ...
+    def close(self: PersistentExpressionCache) -> None: ...
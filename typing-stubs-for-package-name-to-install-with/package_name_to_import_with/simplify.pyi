@@ -1,18 +1,36 @@
 import collections.abc
+import functools
 import re
 
 import pydantic
 
+from .caching_module import BoundedCache
 from .calculator_sub_package import BinaryArithmeticOperator
-from .utils import CustomStrEnum
+from .utils import CustomPydanticBaseModel, CustomStrEnum
 
 __all__ = [
+    "FIRST_CHARACTER_TOKEN_TYPES",
+    "NUMBER_TOKEN_TYPES",
     "OPERATION_PRECEDENCES",
+    "OPERATOR_TOKENS",
+    "CompiledExpression",
     "Parentheses",
+    "TokenType",
+    "Variable",
+    "classify_tokens",
     "clean_and_tokenise_expression",
+    "compile_expression",
     "convert_infix_expression",
     "evaluate_postfix_expression",
+    "evaluate_trusted_postfix_expression",
+    "normalise_expression",
+    "optimise_binary_operation",
+    "optimise_postfix_expression",
+    "solve_instrumented_simplification",
     "solve_simplification",
+    "substitute_variables",
+    "tokenise_expression",
+    "validate_expression_characters",
 ]
 
 class Parentheses(CustomStrEnum):
@@ -25,16 +43,77 @@ class TokenType(CustomStrEnum):
     OPERATOR: str
     LEFT_PARENTHESIS: str
     RIGHT_PARENTHESIS: str
+    VARIABLE: str
+
+SUPPORTED_CHARACTERS: set[str]
+ACCEPTABLE_CHARACTERS: set[str]
+VARIABLE_CHARACTERS: set[str]
+
+class Variable(CustomPydanticBaseModel):
+    name: str
+
+SUPPORTED_TOKEN_PATTERN: str
+SUPPORTED_TOKEN_REGULAR_EXPRESSION: re.Pattern[str]
+UNTYPED_TOKEN_REGULAR_EXPRESSION: re.Pattern[str]
+TOKEN_TYPES: dict[str, TokenType]
+OPERATOR_TOKENS: dict[str, BinaryArithmeticOperator]
+NUMBER_TOKEN_TYPES: frozenset[TokenType]
+FIRST_CHARACTER_TOKEN_TYPES: dict[str, TokenType]
 
 OPERATION_PRECEDENCES: dict[BinaryArithmeticOperator | Parentheses, int]
 
+def normalise_expression(raw_expression: str) -> str: ...
+def validate_expression_characters(raw_expression: str, allow_variables: bool = ...) -> str: ...
 def clean_and_tokenise_expression(
-    raw_expression: str,
+    raw_expression: str, allow_variables: bool = ...
 ) -> pydantic.InstanceOf[collections.abc.Iterator[re.Match[str]]]: ...
+def classify_tokens(
+    token_values: collections.abc.Iterable[str],
+) -> collections.abc.Iterator[tuple[TokenType, str]]: ...
+def tokenise_expression(
+    raw_expression: str, allow_variables: bool = ...
+) -> pydantic.InstanceOf[collections.abc.Iterator[tuple[TokenType, str]]]: ...
 def convert_infix_expression(
-    infix_expression_tokens: pydantic.InstanceOf[collections.abc.Iterator[re.Match[str]]],
-) -> list[BinaryArithmeticOperator | float]: ...
+    infix_expression_tokens: pydantic.InstanceOf[
+        collections.abc.Iterator[re.Match[str] | tuple[TokenType, str]]
+    ],
+) -> list[BinaryArithmeticOperator | Variable | float]: ...
 def evaluate_postfix_expression(
     postfix_expression: list[BinaryArithmeticOperator | float],
 ) -> float: ...
-def solve_simplification(expression: str) -> float: ...
+def evaluate_trusted_postfix_expression(
+    postfix_expression: collections.abc.Iterable[BinaryArithmeticOperator | float],
+) -> float: ...
+def optimise_binary_operation(
+    first_operand: list[BinaryArithmeticOperator | Variable | float],
+    operator: BinaryArithmeticOperator,
+    second_operand: list[BinaryArithmeticOperator | Variable | float],
+) -> list[BinaryArithmeticOperator | Variable | float]: ...
+def optimise_postfix_expression(
+    postfix_expression: collections.abc.Iterable[BinaryArithmeticOperator | Variable | float],
+) -> list[BinaryArithmeticOperator | Variable | float]: ...
+def substitute_variables(
+    postfix_expression: list[BinaryArithmeticOperator | Variable | float],
+    variable_values: dict[str, float],
+) -> list[BinaryArithmeticOperator | float]: ...
+
+class CompiledExpression(CustomPydanticBaseModel):
+    expression: str
+    postfix_expression: tuple[BinaryArithmeticOperator | Variable | float, ...]
+    @functools.cached_property
+    def variables(self: CompiledExpression) -> tuple[str, ...]: ...
+    def evaluate(
+        self: CompiledExpression,
+        validate: bool = ...,
+        variable_values: dict[str, float] | None = ...,
+    ) -> float: ...
+
+def compile_expression(
+    expression: str, allow_variables: bool = ..., optimise: bool = ...
+) -> CompiledExpression: ...
+def solve_instrumented_simplification(expression: str, validate: bool = ...) -> float: ...
+def solve_simplification(
+    expression: str,
+    cache: pydantic.InstanceOf[BoundedCache[float]] | None = ...,
+    validate: bool = ...,
+) -> float: ...
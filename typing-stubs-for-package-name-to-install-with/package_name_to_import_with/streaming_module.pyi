@@ -0,0 +1,28 @@
+import collections.abc
+import typing
+
+import pydantic
+
+from .caching_module import BoundedCache
+
+__all__ = [
+    "EvaluationRecord",
+    "evaluate_expression",
+    "format_evaluation_record",
+    "solve_simplification_stream",
+]
+
+class EvaluationRecord(typing.NamedTuple):
+    expression: str
+    result: float | None
+    error: str | None
+
+def evaluate_expression(
+    expression: str, cache: BoundedCache[float] | None = ..., validate: bool = ...
+) -> EvaluationRecord: ...
+def solve_simplification_stream(
+    expressions: collections.abc.Iterable[str],
+    cache: pydantic.InstanceOf[BoundedCache[float]] | None = ...,
+    validate: bool = ...,
+) -> collections.abc.Iterator[EvaluationRecord]: ...
+def format_evaluation_record(record: EvaluationRecord) -> str: ...
@@ -0,0 +1,58 @@
+import collections.abc
+import typing
+
+import numpy
+import numpy.typing
+import pydantic
+
+from .calculator_sub_package import BinaryArithmeticOperator
+from .simplify import Variable
+
+__all__ = [
+    "MAXIMUM_REPORTED_INDICES",
+    "REAL_NUMBER_KINDS",
+    "VECTORISED_BINARY_ARITHMETIC_OPERATIONS",
+    "BooleanArray",
+    "FloatArray",
+    "VectorisedBinaryArithmeticOperation",
+    "calculate_results_batch",
+    "convert_to_float_array",
+    "detect_zero_division",
+    "divide_arrays",
+    "evaluate_postfix_expression_batch",
+    "find_zero_division_indices",
+    "solve_simplification_batch",
+]
+
+FloatArray: typing.TypeAlias = numpy.typing.NDArray[numpy.float64]
+BooleanArray: typing.TypeAlias = numpy.typing.NDArray[numpy.bool_]
+MAXIMUM_REPORTED_INDICES: int
+REAL_NUMBER_KINDS: frozenset[str]
+
+VectorisedBinaryArithmeticOperation: typing.TypeAlias
+
+def detect_zero_division(
+    operator: BinaryArithmeticOperator, second_values: FloatArray
+) -> BooleanArray: ...
+def find_zero_division_indices(
+    operator: BinaryArithmeticOperator, second_values: FloatArray
+) -> numpy.typing.NDArray[numpy.intp]: ...
+def divide_arrays(dividend: FloatArray, divisor: FloatArray) -> FloatArray: ...
+def convert_to_float_array(inputs: numpy.typing.ArrayLike) -> FloatArray: ...
+
+VECTORISED_BINARY_ARITHMETIC_OPERATIONS: dict[
+    BinaryArithmeticOperator, VectorisedBinaryArithmeticOperation
+]
+
+def calculate_results_batch(
+    first_inputs: numpy.typing.ArrayLike,
+    operator: BinaryArithmeticOperator | str,
+    second_inputs: numpy.typing.ArrayLike,
+) -> FloatArray: ...
+def evaluate_postfix_expression_batch(
+    postfix_expression: collections.abc.Iterable[BinaryArithmeticOperator | Variable | float],
+    columns: collections.abc.Mapping[str, FloatArray],
+) -> numpy.ma.MaskedArray: ...
+def solve_simplification_batch(
+    expression: str, /, **columns: pydantic.InstanceOf[numpy.ndarray]
+) -> pydantic.InstanceOf[numpy.ma.MaskedArray]: ...